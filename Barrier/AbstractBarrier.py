@@ -0,0 +1,54 @@
+from abc import ABC, abstractmethod
+
+class AbstractBarrier(ABC):
+    """
+    Algorithme de barrière de synchronize().
+    arrive() et handle_message() s'exécutent dans le thread du dispatcher ; la barrière
+    se termine par communication._complete_synchronization().
+
+    Chaque barrière porte un numéro de génération : des synchronize() successifs ne
+    mélangent jamais leurs messages, même si un nœud rapide entame déjà la suivante.
+    """
+
+    def __init__(self, communication):
+        self.communication = communication
+        self.generation = 0  # Numéro de la barrière en cours (ou de la prochaine)
+        # Latence des synchronize() locaux (de l'appel au franchissement)
+        self.completed = 0
+        self.total_latency = 0.0
+        self.last_latency = None
+        self.max_latency = 0.0
+
+    @abstractmethod
+    def arrive(self):
+        """Le nœud local atteint la barrière (appelé par synchronize)"""
+        pass
+
+    @abstractmethod
+    def handle_message(self, message):
+        """Traite un message de la barrière"""
+        pass
+
+    def complete(self, generation):
+        """Termine la barrière 'generation' et passe à la suivante"""
+        self.generation = generation + 1
+        if self.communication.is_synchronizing:
+            self.communication._complete_synchronization()
+
+    def record_latency(self, latency):
+        """Enregistre la durée d'un synchronize() local"""
+        self.completed += 1
+        self.total_latency += latency
+        self.last_latency = latency
+        self.max_latency = max(self.max_latency, latency)
+
+    def stats(self):
+        """Métriques de la barrière (latences en secondes)"""
+        return {
+            'algorithm': type(self).__name__,
+            'generation': self.generation,
+            'completed': self.completed,
+            'last_latency': self.last_latency,
+            'mean_latency': self.total_latency / self.completed if self.completed else None,
+            'max_latency': self.max_latency,
+        }
@@ -0,0 +1,55 @@
+from Message import BarrierMessage
+from Log import get_logger
+from .AbstractBarrier import AbstractBarrier
+
+log = get_logger("sync")
+
+class DisseminationBarrier(AbstractBarrier):
+    """
+    Barrière par dissémination (Hensgen, Finkel et Manber).
+    Au tour r, le nœud d'indice i (monde trié) prévient le nœud i+2^r (mod N) puis attend
+    le message du nœud i-2^r : après ⌈log2 N⌉ tours, chacun sait que tous sont arrivés.
+    N·⌈log2 N⌉ messages, mais chaque nœud n'en envoie et n'en reçoit qu'un par tour :
+    aucun nœud central. Tous les nœuds du monde doivent appeler synchronize().
+    """
+
+    def __init__(self, communication):
+        super().__init__(communication)
+        self.received = set()  # Messages reçus : (génération, tour), en avance ou non
+        self.round = None      # Tour en cours, None hors barrière
+        self.sent = False      # Le message du tour en cours est envoyé
+        self.members = []
+
+    def arrive(self):
+        self.members = sorted(self.communication.world)
+        self.round = 0
+        self.sent = False
+        self._advance()
+
+    def handle_message(self, message):
+        if message.generation < self.generation:
+            return
+        self.received.add((message.generation, message.round))
+        if self.round is not None:
+            self._advance()
+
+    def _advance(self):
+        communication = self.communication
+        nb_nodes = len(self.members)
+        rounds = (nb_nodes - 1).bit_length()  # ⌈log2 N⌉
+        index = self.members.index(communication.id)
+        generation = self.generation
+        while self.round < rounds:
+            if not self.sent:
+                partner = self.members[(index + (1 << self.round)) % nb_nodes]
+                communication.send_message_to(partner, BarrierMessage(
+                    communication.id, communication.get_clock(), generation, self.round))
+                self.sent = True
+            if (generation, self.round) not in self.received:
+                return
+            self.received.discard((generation, self.round))
+            self.round += 1
+            self.sent = False
+        log.debug("Nœud %s : barrière %s terminée en %s tours", communication.id, generation, rounds)
+        self.round = None
+        self.complete(generation)
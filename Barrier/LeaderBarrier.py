@@ -0,0 +1,68 @@
+from Message import SynchronizeMessage, SynchronizeConfirmedMessage, AllSynchronizedMessage
+from State.NodeState import NodeState
+from Log import get_logger
+from .AbstractBarrier import AbstractBarrier
+
+log = get_logger("sync")
+
+class LeaderBarrier(AbstractBarrier):
+    """
+    Barrière centralisée (par défaut).
+    Le nœud qui synchronise diffuse SynchronizeMessage ; chaque follower confirme au leader,
+    qui diffuse AllSynchronizedMessage une fois toutes les confirmations reçues.
+    Le leader traite O(N) messages par barrière.
+    """
+
+    def __init__(self, communication):
+        super().__init__(communication)
+        self.confirmations = {}  # Dict: {génération: nœuds ayant confirmé}
+
+    def is_leader(self):
+        return self.communication.state == NodeState.LEADER
+
+    def arrive(self):
+        communication = self.communication
+        generation = self.generation
+        communication.broadcast_message(SynchronizeMessage(communication.id, communication.get_clock(), generation))
+        if self.is_leader():
+            self._check(generation)
+        else:
+            self._confirm(generation)  # Le demandeur ne reçoit pas sa propre diffusion
+
+    def handle_message(self, message):
+        if message.generation < self.generation:
+            return  # Barrière déjà terminée
+        match message:
+            case SynchronizeMessage():
+                log.info("Nœud %s reçoit demande de synchronisation de %s", self.communication.id, message.source)
+                if not self.is_leader():
+                    self._confirm(message.generation)
+            case SynchronizeConfirmedMessage() if self.is_leader():
+                log.debug("Leader %s reçoit confirmation de synchronisation de %s", self.communication.id, message.source)
+                self.confirmations.setdefault(message.generation, set()).add(message.source)
+                self._check(message.generation)
+            case SynchronizeConfirmedMessage():
+                log.debug("Nœud %s reçoit confirmation de synchronisation mais n'est pas leader", self.communication.id)
+            case AllSynchronizedMessage():
+                log.info("Nœud %s reçoit signal de fin de synchronisation du leader %s", self.communication.id, message.source)
+                self.complete(message.generation)
+
+    def _confirm(self, generation):
+        communication = self.communication
+        if communication.leader_id:
+            communication.send_message_to(communication.leader_id, SynchronizeConfirmedMessage(
+                communication.id, communication.get_clock(), generation, target=communication.leader_id))
+            log.debug("Nœud %s envoie confirmation de synchronisation au leader %s", communication.id, communication.leader_id)
+
+    def _check(self, generation):
+        """Quand tous les followers ont confirmé, le leader termine la barrière pour tous"""
+        communication = self.communication
+        expected_nodes = communication.world - {communication.id}
+        if self.confirmations.get(generation, set()) >= expected_nodes:
+            log.debug("Leader %s a reçu toutes les confirmations - envoie AllSynchronizedMessage", communication.id)
+            communication.broadcast_message(AllSynchronizedMessage(communication.id, communication.get_clock(), generation))
+            self.complete(generation)
+
+    def complete(self, generation):
+        self.confirmations = {g: nodes for g, nodes in self.confirmations.items() if g > generation}
+        super().complete(generation)
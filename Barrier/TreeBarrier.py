@@ -0,0 +1,68 @@
+from Message import BarrierMessage
+from Log import get_logger
+from .AbstractBarrier import AbstractBarrier
+
+log = get_logger("sync")
+
+ARRIVE = 0   # Un sous-arbre complet a atteint la barrière (fils -> parent)
+RELEASE = 1  # Fin de la barrière (parent -> fils)
+
+class TreeBarrier(AbstractBarrier):
+    """
+    Barrière par arbre de combinaison.
+    Les nœuds triés forment un arbre d'arité 'fan_in' (le nœud d'indice i a pour fils
+    fan_in·i+1 ... fan_in·i+fan_in) : chaque nœud attend l'arrivée de ses fils avant de
+    signaler celle de son sous-arbre à son parent, puis la racine libère l'arbre en sens inverse.
+    2(N-1) messages et 2·log_fan_in(N) tours ; aucun nœud ne traite plus de 2·fan_in messages.
+    Tous les nœuds du monde doivent appeler synchronize().
+    """
+
+    def __init__(self, communication, fan_in=4):
+        super().__init__(communication)
+        self.fan_in = fan_in
+        self.arrived = {}       # Dict: {génération: fils dont le sous-arbre est arrivé}
+        self.waiting = False    # Le nœud local a atteint la barrière en cours
+        self.reported = False   # L'arrivée du sous-arbre a été signalée au parent
+        self.parent = None
+        self.children = set()
+
+    def arrive(self):
+        members = sorted(self.communication.world)
+        index = members.index(self.communication.id)
+        self.parent = members[(index - 1) // self.fan_in] if index else None
+        self.children = set(members[self.fan_in * index + 1:self.fan_in * index + self.fan_in + 1])
+        self.waiting = True
+        self.reported = False
+        self._check()
+
+    def handle_message(self, message):
+        if message.generation < self.generation:
+            return
+        if message.round == RELEASE:
+            self._release(message.generation)
+            return
+        self.arrived.setdefault(message.generation, set()).add(message.source)
+        if message.generation == self.generation:
+            self._check()
+
+    def _check(self):
+        generation = self.generation
+        if not self.waiting or self.reported or not self.arrived.get(generation, set()) >= self.children:
+            return
+        if self.parent is None:
+            log.debug("Racine %s : barrière %s atteinte par tous", self.communication.id, generation)
+            self._release(generation)
+        else:
+            self.reported = True
+            self._send(self.parent, generation, ARRIVE)
+
+    def _release(self, generation):
+        for child in sorted(self.children):
+            self._send(child, generation, RELEASE)
+        self.arrived.pop(generation, None)
+        self.waiting = False
+        self.complete(generation)
+
+    def _send(self, node, generation, round):
+        communication = self.communication
+        communication.send_message_to(node, BarrierMessage(communication.id, communication.get_clock(), generation, round))
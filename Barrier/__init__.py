@@ -0,0 +1,11 @@
+from .AbstractBarrier import AbstractBarrier
+from .DisseminationBarrier import DisseminationBarrier
+from .LeaderBarrier import LeaderBarrier
+from .TreeBarrier import TreeBarrier
+
+__all__ = [
+    "AbstractBarrier",
+    "DisseminationBarrier",
+    "LeaderBarrier",
+    "TreeBarrier",
+]
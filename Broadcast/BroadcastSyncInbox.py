@@ -0,0 +1,40 @@
+from collections import deque
+
+class BroadcastSyncInbox:
+    """
+    Réception des broadcastSync d'un émetteur.
+    Les messages sont remis dans l'ordre de leurs numéros (un message en avance est retenu
+    jusqu'à l'arrivée des précédents), chacun au plus ancien broadcastSync(from_id) en attente,
+    ou gardés pour les appels suivants.
+    """
+
+    def __init__(self):
+        self.next_sequence = None  # Prochain numéro à remettre (fixé par le premier message reçu)
+        self.held = {}             # Dict: {numéro: payload} messages arrivés en avance
+        self.ready = deque()       # Payloads remis dans l'ordre, pas encore demandés
+        self.waiters = deque()     # Appels broadcastSync en attente : {'payload', 'callback', 'event'}
+
+    def receive(self, sequence, payload):
+        """Enregistre un message ; retourne les remises [(attente, payload), ...] à effectuer"""
+        if self.next_sequence is None:
+            self.next_sequence = sequence  # Canaux FIFO : le premier message reçu est le plus ancien
+        if sequence < self.next_sequence:
+            return []  # Doublon
+        self.held[sequence] = payload
+        deliveries = []
+        while self.next_sequence in self.held:
+            payload = self.held.pop(self.next_sequence)
+            self.next_sequence += 1
+            if self.waiters:
+                deliveries.append((self.waiters.popleft(), payload))
+            else:
+                self.ready.append(payload)
+        return deliveries
+
+    def wait(self, waiter):
+        """Sert un appel avec le plus ancien message disponible ; sinon le met en attente (retourne False)"""
+        if self.ready:
+            waiter['payload'] = self.ready.popleft()
+            return True
+        self.waiters.append(waiter)
+        return False
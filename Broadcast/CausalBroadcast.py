@@ -0,0 +1,142 @@
+from threading import Lock
+from time import time
+import heapq
+from itertools import count
+from Message import CausalMessage
+from Log import get_logger
+
+log = get_logger("sync")
+
+class CausalBroadcast:
+    """
+    Diffusion causale (Birman–Schiper–Stephenson) : un message n'est remis qu'après tous les
+    messages diffusés causalement avant lui. Une réponse n'arrive donc jamais avant la question.
+
+    - delivered[j] : nombre de diffusions causales de j remises ici. Une diffusion porte ce
+      vecteur (entrée de l'émetteur incrémentée) dans 'dependencies' ; l'émetteur la remet
+      aussitôt à sa propre boîte aux lettres.
+    - Un message de j est remissible si dependencies[j] == delivered[j] + 1 et si
+      dependencies[k] <= delivered[k] pour tout autre k.
+    - File de rétention : un tas par émetteur, ordonné par dependencies[émetteur]. Seule la tête
+      d'un tas peut devenir remissible (les diffusions d'un émetteur se suivent). Chaque tête est
+      indexée par la première dépendance qui lui manque : une remise ne réexamine que les têtes
+      qui l'attendaient, quel que soit le nombre de messages retenus ou de nœuds.
+
+    Les vecteurs sont des dicts (entrées nulles absentes) : un message ne coûte que les nœuds qui
+    ont déjà diffusé, et un nœud qui rejoint le monde n'a rien à réinitialiser.
+    """
+
+    def __init__(self, communication):
+        self.communication = communication
+        self.lock = Lock()
+        self.delivered = {}  # Dict: {nœud: diffusions causales remises ici}
+        self.held = {}       # Dict: {émetteur: tas de (dependencies[émetteur], ordre d'arrivée, arrivée, message)}
+        self.blocked = {}    # Dict: {nœud: {émetteur: numéro}} têtes de tas en attente de la diffusion 'numéro' de 'nœud'
+        self.arrivals = count()
+        # Métriques
+        self.held_count = 0
+        self.max_held = 0
+        self.held_total = 0  # Messages retenus au moins une fois
+        self.delivered_total = 0
+        self.total_delay = 0.0
+        self.max_delay = 0.0
+
+    def broadcast(self, payload):
+        """Diffuse 'payload' à tous les nœuds ; remis ici immédiatement, ailleurs après ses dépendances"""
+        communication = self.communication
+        my_id = communication.get_rank()
+        timestamp = communication.get_lamport_timestamp()  # Événement de l'application
+        with self.lock:
+            dependencies = dict(self.delivered)
+            dependencies[my_id] = dependencies.get(my_id, 0) + 1
+            message = CausalMessage(my_id, timestamp, dependencies, payload)
+            self._deliver(message)
+        # Hors verrou (la boîte aux lettres d'un pair peut faire attendre) : si deux diffusions
+        # concurrentes partent dans le désordre, les récepteurs retiennent la seconde
+        communication.broadcast_message(message)
+
+    def handle_message(self, message):
+        """Réception (thread du dispatcher) : remise immédiate ou rétention"""
+        with self.lock:
+            sender = message.source
+            number = message.dependencies.get(sender, 0)
+            if number <= self.delivered.get(sender, 0):
+                return  # Doublon
+            missing = self._missing(message)
+            if missing:
+                heap = self.held.setdefault(sender, [])
+                heapq.heappush(heap, (number, next(self.arrivals), time(), message))
+                if heap[0][3] is message:
+                    self._block(sender, missing)
+                self.held_count += 1
+                self.held_total += 1
+                self.max_held = max(self.max_held, self.held_count)
+                log.debug("Nœud %s retient la diffusion %s de %s", self.communication.id, number, sender)
+                return
+            self._deliver(message)
+            if self.held_count:
+                self._release(sender)
+
+    def stats(self):
+        """Métriques de la file de rétention (délais en secondes)"""
+        with self.lock:
+            return {
+                'delivered': self.delivered_total,
+                'held': self.held_count,
+                'max_held': self.max_held,
+                'held_total': self.held_total,
+                'mean_delay': self.total_delay / self.held_total if self.held_total else None,
+                'max_delay': self.max_delay,
+            }
+
+    def _missing(self, message):
+        """Première dépendance pas encore remise ici : (nœud, numéro), None si le message est remissible"""
+        sender = message.source
+        for node, number in message.dependencies.items():
+            if node == sender:
+                number -= 1  # Les diffusions précédentes de l'émetteur
+            if number > self.delivered.get(node, 0):
+                return node, number
+        return None
+
+    def _block(self, sender, missing):
+        node, number = missing
+        self.blocked.setdefault(node, {})[sender] = number
+
+    def _release(self, changed):
+        """Remet les messages retenus devenus remissibles après une remise de 'changed' (verrou tenu)"""
+        work = [changed]
+        while work:
+            node = work.pop()
+            waiting = self.blocked.get(node)
+            if not waiting:
+                continue
+            count = self.delivered.get(node, 0)
+            woken = [sender for sender, number in waiting.items() if number <= count]
+            for sender in woken:
+                del waiting[sender]
+            if not waiting:
+                del self.blocked[node]
+            for sender in woken:
+                heap = self.held.get(sender)
+                while heap:
+                    number, _, arrival, message = heap[0]
+                    missing = None if number <= self.delivered.get(sender, 0) else self._missing(message)
+                    if missing:
+                        self._block(sender, missing)
+                        break
+                    heapq.heappop(heap)
+                    self.held_count -= 1
+                    if number > self.delivered.get(sender, 0):
+                        delay = time() - arrival
+                        self.total_delay += delay
+                        self.max_delay = max(self.max_delay, delay)
+                        self._deliver(message)
+                        work.append(sender)
+                if heap == []:
+                    del self.held[sender]
+
+    def _deliver(self, message):
+        self.delivered[message.source] = message.dependencies[message.source]
+        self.delivered_total += 1
+        self.communication.addLetterMessage(message, ordered=True)
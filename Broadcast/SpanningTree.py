@@ -0,0 +1,27 @@
+class SpanningTree:
+    """
+    Arbre k-aire couvrant les membres triés, enraciné en n'importe quel membre :
+    le nœud de rang r (position relative à la racine, modulo N) a pour fils les rangs
+    k·r+1 ... k·r+k. Profondeur ⌈log_k N⌉, chaque nœud a au plus k fils.
+    """
+
+    def __init__(self, members, fan_out):
+        self.members = sorted(members)
+        self.position = {node: index for index, node in enumerate(self.members)}
+        self.fan_out = fan_out
+        self.key = (frozenset(self.members), fan_out)
+
+    def children(self, root, node):
+        """Fils de 'node' dans l'arbre enraciné en 'root'"""
+        count = len(self.members)
+        origin = self.position[root]
+        rank = (self.position[node] - origin) % count
+        first = self.fan_out * rank + 1
+        return [self.members[(origin + child) % count] for child in range(first, min(first + self.fan_out, count))]
+
+    def parent(self, root, node):
+        """Parent de 'node' (None pour la racine)"""
+        count = len(self.members)
+        origin = self.position[root]
+        rank = (self.position[node] - origin) % count
+        return self.members[(origin + (rank - 1) // self.fan_out) % count] if rank else None
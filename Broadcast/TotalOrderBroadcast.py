@@ -0,0 +1,193 @@
+from threading import Lock
+from Message import TotalOrderRequestMessage, TotalOrderBatchMessage, TotalOrderMessage
+from State.NodeState import NodeState
+from Log import get_logger
+
+log = get_logger("sync")
+
+BATCH_SIZE = 256      # Demandes numérotées au plus par lot
+RESEND_INTERVAL = 0.5 # Période de renvoi des demandes non remises, si le leader a changé ou rien n'a avancé (secondes)
+
+class TotalOrderBroadcast:
+    """
+    Diffusion totalement ordonnée par séquenceur : tous les nœuds remettent les messages
+    diffusés dans le même ordre, quel que soit leur émetteur.
+
+    - Émetteur : la demande part vers le leader et reste en attente jusqu'à ce que l'émetteur
+      remette lui-même son message ; si le leader change (ou si rien n'est remis pendant
+      RESEND_INTERVAL), les demandes en attente sont renvoyées, dans l'ordre, au leader connu.
+    - Séquenceur (leader) : les demandes reçues sont numérotées par lots. Le lot est vidé par une
+      tâche du dispatcher, après les messages déjà en file : tout ce qui est arrivé entre-temps est
+      numéroté en un seul TotalOrderBatchMessage, sans délai ajouté (au plus BATCH_SIZE demandes).
+    - Récepteur : les lots sont retenus jusqu'à ce que les numéros précédents soient arrivés, puis
+      remis à la boîte aux lettres en TotalOrderMessage. Les doublons (demande renvoyée) sont écartés
+      grâce au numéro de chaque émetteur.
+
+    L'époque d'un lot est le terme du leader : un nouveau leader reprend la numérotation après le
+    plus grand numéro qu'il connaît, et les lots d'un ancien leader arrivés ensuite sont ignorés.
+    Un lot diffusé par un leader qui tombe avant que le nouveau ne le reçoive peut n'avoir été
+    remis que par une partie des nœuds : l'ordre total n'est garanti que hors de cette fenêtre.
+    """
+
+    def __init__(self, communication):
+        self.communication = communication
+        self.lock = Lock()
+        self.running = False
+        # Émetteur (threads de l'application)
+        self.sender_sequence = 0
+        self.unconfirmed = {}  # Dict: {numéro émetteur: (horloge, payload)} demandes pas encore remises localement
+        self.sent_to = None    # Leader auquel les demandes en attente ont été envoyées
+        self.confirmed = 0     # Demandes de ce nœud remises localement (progression entre deux vérifications)
+        self.last_confirmed = 0
+        self.resend_timer = None
+        # Séquenceur (thread du dispatcher)
+        self.epoch = None           # Terme pendant lequel ce nœud numérote, None s'il n'est pas séquenceur
+        self.next_sequence = None   # Prochain numéro global à attribuer
+        self.stamped = {}           # Dict: {émetteur: dernier numéro émetteur numéroté}
+        self.pending = []           # Demandes en attente du prochain lot : (émetteur, numéro, horloge, payload)
+        self.flush_scheduled = False
+        # Récepteur (thread du dispatcher)
+        self.highest_epoch = -1
+        self.next_delivery = 1      # Prochain numéro global à remettre
+        self.held = {}              # Dict: {numéro global: (émetteur, numéro émetteur, horloge, payload)}
+        self.delivered = {}         # Dict: {émetteur: dernier numéro émetteur remis}
+
+    def start(self):
+        self.running = True
+
+    def stop(self):
+        self.running = False
+        with self.lock:
+            if self.resend_timer:
+                self.resend_timer.cancel()
+                self.resend_timer = None
+
+    def broadcast(self, payload):
+        """Diffuse 'payload' ; il sera remis à tous les nœuds (y compris celui-ci) dans l'ordre global"""
+        timestamp = self.communication.get_lamport_timestamp()  # Événement de l'application
+        with self.lock:
+            self.sender_sequence += 1
+            self.unconfirmed[self.sender_sequence] = (timestamp, payload)
+            if self.communication.leader_id != self.sent_to:
+                self._resend()  # Nouveau leader : toutes les demandes en attente, dans l'ordre
+            else:
+                self._request(self.sender_sequence, timestamp, payload)
+            if self.resend_timer is None and self.running:
+                self.resend_timer = self.communication.call_later(RESEND_INTERVAL, self._check_resend)
+        return self.sender_sequence
+
+    def on_leader_elected(self):
+        """Appelé quand ce nœud devient leader : il reprend la numérotation pour son terme"""
+        self.epoch = self.communication.current_term
+        self.next_sequence = max([self.next_delivery - 1, *self.held]) + 1
+        self.stamped = dict(self.delivered)
+        for sender, sender_sequence, _, _ in self.held.values():
+            self.stamped[sender] = max(self.stamped.get(sender, 0), sender_sequence)
+        self.pending = []
+        log.info("Leader %s reprend le séquenceur (époque %s, numéro %s)", self.communication.id, self.epoch, self.next_sequence)
+
+    def is_sequencer(self):
+        return self.communication.state == NodeState.LEADER and self.epoch == self.communication.current_term
+
+    def handle_message(self, message):
+        match message:
+            case TotalOrderRequestMessage():
+                self._on_request(message.source, message.sender_sequence, message.timestamp, message.payload)
+            case TotalOrderBatchMessage():
+                self._on_batch(message)
+
+    # Émetteur
+
+    def _request(self, sender_sequence, timestamp, payload):
+        """Envoie une demande au leader (verrou tenu : les demandes partent dans l'ordre)"""
+        communication = self.communication
+        leader = communication.leader_id
+        if leader is None:
+            return  # Renvoyée quand un leader sera connu
+        if leader == communication.id:
+            communication.dispatcher.schedule(self._on_request, leader, sender_sequence, timestamp, payload)
+        else:
+            communication.send_message_to(leader, TotalOrderRequestMessage(
+                communication.id, timestamp, sender_sequence, payload, target=leader))
+
+    def _resend(self):
+        self.sent_to = self.communication.leader_id
+        for sender_sequence in sorted(self.unconfirmed):
+            self._request(sender_sequence, *self.unconfirmed[sender_sequence])
+
+    def _check_resend(self):
+        """Tant que des demandes ne sont pas remises, les renvoie si le leader a changé ou si rien n'a avancé"""
+        with self.lock:
+            self.resend_timer = None
+            if not self.unconfirmed or not self.running:
+                return
+            stalled = self.confirmed == self.last_confirmed
+            self.last_confirmed = self.confirmed
+            if stalled or self.communication.leader_id != self.sent_to:
+                # Le séquenceur écarte les demandes déjà numérotées
+                log.info("Nœud %s renvoie %s demandes au leader %s", self.communication.id, len(self.unconfirmed), self.communication.leader_id)
+                self._resend()
+            self.resend_timer = self.communication.call_later(RESEND_INTERVAL, self._check_resend)
+
+    # Séquenceur
+
+    def _on_request(self, sender, sender_sequence, timestamp, payload):
+        if not self.is_sequencer():
+            return  # L'émetteur renverra sa demande au leader qu'il connaîtra
+        if sender_sequence <= self.stamped.get(sender, 0):
+            return  # Demande renvoyée, déjà numérotée
+        self.stamped[sender] = sender_sequence
+        self.pending.append((sender, sender_sequence, timestamp, payload))
+        if len(self.pending) >= BATCH_SIZE:
+            self._flush()
+        elif not self.flush_scheduled:
+            self.flush_scheduled = True
+            self.communication.dispatcher.schedule(self._flush)
+
+    def _flush(self):
+        """Numérote les demandes en attente et les diffuse en un seul lot"""
+        self.flush_scheduled = False
+        if not self.pending or not self.is_sequencer():
+            return
+        batch, self.pending = self.pending, []
+        communication = self.communication
+        message = TotalOrderBatchMessage(
+            communication.id, communication.get_clock(), self.epoch, self.next_sequence,
+            [request[0] for request in batch], [request[1] for request in batch],
+            [request[2] for request in batch], [request[3] for request in batch])
+        self.next_sequence += len(batch)
+        log.debug("Séquenceur %s : lot %s-%s", communication.id, message.first_sequence, self.next_sequence - 1)
+        communication.broadcast_message(message)
+        self._on_batch(message)
+
+    # Récepteur
+
+    def _on_batch(self, message):
+        if message.epoch < self.highest_epoch:
+            return  # Lot d'un ancien leader
+        if message.epoch > self.highest_epoch:
+            self.highest_epoch = message.epoch
+            if message.first_sequence > self.next_delivery:
+                # Le nouveau leader reprend après un numéro jamais reçu ici : remettre ce qui est retenu
+                for sequence in sorted(s for s in self.held if s < message.first_sequence):
+                    self._deliver(sequence, *self.held.pop(sequence))
+                self.next_delivery = message.first_sequence
+        for i, sender in enumerate(message.senders):
+            sequence = message.first_sequence + i
+            if sequence >= self.next_delivery:
+                self.held[sequence] = (sender, message.sender_sequences[i], message.timestamps[i], message.payloads[i])
+        while self.next_delivery in self.held:
+            self._deliver(self.next_delivery, *self.held.pop(self.next_delivery))
+            self.next_delivery += 1
+
+    def _deliver(self, sequence, sender, sender_sequence, timestamp, payload):
+        if sender_sequence <= self.delivered.get(sender, 0):
+            return  # Doublon
+        self.delivered[sender] = sender_sequence
+        communication = self.communication
+        if sender == communication.id:
+            with self.lock:
+                self.unconfirmed.pop(sender_sequence, None)
+                self.confirmed += 1
+        communication.update_lamport_clock(timestamp)
+        communication.addLetterMessage(TotalOrderMessage(sender, timestamp, sequence, payload), ordered=True)
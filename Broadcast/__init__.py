@@ -0,0 +1,11 @@
+from .BroadcastSyncInbox import BroadcastSyncInbox
+from .CausalBroadcast import CausalBroadcast
+from .SpanningTree import SpanningTree
+from .TotalOrderBroadcast import TotalOrderBroadcast
+
+__all__ = [
+    "BroadcastSyncInbox",
+    "CausalBroadcast",
+    "SpanningTree",
+    "TotalOrderBroadcast",
+]
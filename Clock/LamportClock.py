@@ -0,0 +1,29 @@
+from threading import Lock
+
+class LamportClock:
+    """
+    Horloge de Lamport protégée par un verrou (sémaphore binaire).
+    Le processus et le communicateur la modifient depuis des threads différents ;
+    chaque opération est une section critique de quelques instructions.
+    """
+
+    def __init__(self, value=0):
+        self._value = value
+        self.lock = Lock()
+
+    @property
+    def value(self):
+        """Valeur courante, sans l'incrémenter"""
+        return self._value
+
+    def inc(self):
+        """Événement local (ou émission) : incrémente l'horloge et retourne la nouvelle valeur"""
+        with self.lock:
+            self._value += 1
+            return self._value
+
+    def update(self, received_timestamp):
+        """Réception : max(horloge locale, timestamp reçu) + 1"""
+        with self.lock:
+            self._value = max(self._value, received_timestamp) + 1
+            return self._value
@@ -0,0 +1,87 @@
+from threading import Lock
+
+class VectorClock:
+    """
+    Horloge vectorielle avec encodage différentiel (Singhal–Kshemkalyani).
+
+    Le vecteur est un dict {nœud: compteur} (les entrées nulles sont absentes).
+    Un message ciblé ne transporte que les entrées modifiées depuis le dernier envoi
+    au même destinataire : sur des canaux FIFO (ce que garantissent les routeurs),
+    le destinataire connaît déjà les autres. Un broadcast transporte le vecteur complet.
+
+    - last_update[j] : valeur de notre propre compteur quand l'entrée j a changé
+    - last_sent[d]   : valeur de notre propre compteur lors du dernier envoi à d
+    """
+
+    def __init__(self, node_id):
+        self.node_id = node_id
+        self.vector = {}       # Dict: {nœud: compteur}
+        self.last_update = {}  # Dict: {nœud: compteur local lors de la dernière modification}
+        self.last_sent = {}    # Dict: {destinataire: compteur local lors du dernier envoi}
+        self.lock = Lock()
+
+    def set_node_id(self, node_id):
+        """Renomme l'entrée locale (ID temporaire remplacé par l'ID permanent)"""
+        with self.lock:
+            if node_id == self.node_id:
+                return
+            if self.node_id in self.vector:
+                self.vector[node_id] = self.vector.pop(self.node_id)
+                self.last_update[node_id] = self.last_update.pop(self.node_id)
+            self.node_id = node_id
+            self.last_sent.clear()  # Les destinataires ne connaissent pas encore la nouvelle entrée
+
+    def snapshot(self):
+        """Copie du vecteur courant"""
+        with self.lock:
+            return dict(self.vector)
+
+    def tick(self):
+        """Événement local"""
+        with self.lock:
+            self._tick()
+            return dict(self.vector)
+
+    def stamp(self, destination=None):
+        """
+        Émission : incrémente l'horloge et retourne le vecteur à joindre au message.
+
+        Args:
+            destination: Destinataire d'un message ciblé (encodage différentiel), None pour un broadcast
+
+        Returns:
+            Dict {nœud: compteur} : entrées modifiées depuis le dernier envoi à 'destination', ou vecteur complet
+        """
+        with self.lock:
+            own = self._tick()
+            if destination is None:
+                return dict(self.vector)
+            since = self.last_sent.get(destination, 0)
+            self.last_sent[destination] = own
+            return {node: self.vector[node] for node, updated in self.last_update.items() if updated > since}
+
+    def merge(self, received):
+        """Réception : max entrée par entrée avec le vecteur (ou la différence) reçu, puis incrément local"""
+        with self.lock:
+            own = self._tick()
+            for node, counter in received.items():
+                if node != self.node_id and counter > self.vector.get(node, 0):
+                    self.vector[node] = counter
+                    self.last_update[node] = own
+            return dict(self.vector)
+
+    def _tick(self):
+        own = self.vector.get(self.node_id, 0) + 1
+        self.vector[self.node_id] = own
+        self.last_update[self.node_id] = own
+        return own
+
+    @staticmethod
+    def happened_before(a, b):
+        """Retourne True si le vecteur 'a' précède causalement 'b' (a < b)"""
+        return all(counter <= b.get(node, 0) for node, counter in a.items()) and a != b
+
+    @staticmethod
+    def concurrent(a, b):
+        """Retourne True si aucun des deux vecteurs ne précède l'autre"""
+        return a != b and not VectorClock.happened_before(a, b) and not VectorClock.happened_before(b, a)
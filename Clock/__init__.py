@@ -0,0 +1,7 @@
+from .LamportClock import LamportClock
+from .VectorClock import VectorClock
+
+__all__ = [
+    "LamportClock",
+    "VectorClock",
+]
@@ -0,0 +1,214 @@
+from threading import Condition
+from time import time
+from Message import CollectiveMessage
+from Log import get_logger
+from .ReduceOp import SUM, numpy
+
+log = get_logger("sync")
+
+RING_CHUNK_BYTES = 1 << 20  # Taille des morceaux du ring allreduce (pipeline)
+
+class Collectives:
+    """
+    Opérations collectives à la MPI : scatter, gather, reduce, allgather, allreduce.
+
+    Tous les nœuds du monde appellent les mêmes collectives, dans le même ordre : chaque appel
+    prend le numéro suivant ('sequence'), qui associe les messages d'une même opération. Les
+    nœuds sont rangés dans l'ordre du monde trié (indice 0 à N-1) ; un message arrivé avant
+    l'appel local est gardé jusqu'à ce que l'opération le réclame.
+
+    Tours de chaque opération :
+    - scatter, gather, reduce : arbre binomial enraciné en 'root' (ceil(log2 N) tours)
+    - allgather : dissémination (Bruck), chaque nœud envoie au tour k ce qu'il connaît à
+      l'indice + 2^k (ceil(log2 N) tours, N quelconque)
+    - allreduce : doublement récursif sur la plus grande puissance de 2 p <= N ; les N - p
+      nœuds en trop confient d'abord leur valeur à un voisin puis reçoivent le résultat
+      (log2 p + 2 tours)
+    - ring_allreduce : anneau de l'ordre du monde trié (celui du jeton), pour les grands tableaux
+      NumPy ; 2(N-1) tours, mais chaque nœud n'envoie et ne reçoit que 2(N-1)/N du tableau
+
+    'op' doit être associative et commutative (voir ReduceOp.py : SUM, PROD, MIN, MAX,
+    vectorisées sur les tableaux NumPy) ; toute fonction (a, b) -> a op b convient.
+    """
+
+    def __init__(self, communication):
+        self.communication = communication
+        self.condition = Condition()
+        self.sequence = 0  # Numéro de la dernière collective lancée par ce nœud
+        self.inbox = {}    # Dict: {(sequence, round, source): payload} messages pas encore consommés
+
+    def stop(self):
+        with self.condition:
+            self.condition.notify_all()
+
+    def handle_message(self, message):
+        with self.condition:
+            self.inbox[(message.sequence, message.round, message.source)] = message.payload
+            self.condition.notify_all()
+
+    def scatter(self, values, root=None, timeout=None):
+        """Le nœud 'root' distribue values[i] au nœud d'indice i ; retourne la valeur reçue par ce nœud"""
+        sequence, members, index, root_index = self._begin("scatter", root)
+        deadline = self._deadline(timeout)
+        size = len(members)
+        relative = (index - root_index) % size
+        if relative == 0:
+            if len(values) != size:
+                raise ValueError(f"scatter: {len(values)} valeurs pour {size} nœuds")
+            chunk = {i: values[(i + root_index) % size] for i in range(size)}
+            mask = 1
+            while mask < size:
+                mask <<= 1
+        else:
+            mask = relative & -relative  # Le parent envoie le bloc [relative, relative + mask)
+            chunk = self._receive(sequence, mask.bit_length() - 1, members[(index - mask) % size], deadline)
+        mask >>= 1
+        while mask:
+            if relative + mask < size:
+                part = {i: chunk[i] for i in range(relative + mask, min(relative + 2 * mask, size))}
+                self._send(sequence, mask.bit_length() - 1, members[(index + mask) % size], part)
+            mask >>= 1
+        return chunk[relative]
+
+    def gather(self, value, root=None, timeout=None):
+        """Retourne, au nœud 'root', la liste des valeurs de tous les nœuds (ordre du monde trié) ; None ailleurs"""
+        sequence, members, index, root_index = self._begin("gather", root)
+        gathered = self._combine_to_root(sequence, members, index, root_index, {index: value},
+                                         lambda a, b: {**a, **b}, self._deadline(timeout))
+        return None if gathered is None else [gathered[i] for i in range(len(members))]
+
+    def reduce(self, value, op=SUM, root=None, timeout=None):
+        """Retourne, au nœud 'root', la réduction par 'op' des valeurs de tous les nœuds ; None ailleurs"""
+        sequence, members, index, root_index = self._begin("reduce", root)
+        return self._combine_to_root(sequence, members, index, root_index, value, op, self._deadline(timeout))
+
+    def allgather(self, value, timeout=None):
+        """Retourne, à tous les nœuds, la liste des valeurs de tous les nœuds (ordre du monde trié)"""
+        sequence, members, index, _ = self._begin("allgather")
+        deadline = self._deadline(timeout)
+        size = len(members)
+        known = {index: value}
+        distance, round = 1, 0
+        while distance < size:
+            self._send(sequence, round, members[(index + distance) % size], known)
+            known = {**known, **self._receive(sequence, round, members[(index - distance) % size], deadline)}
+            distance, round = distance * 2, round + 1
+        return [known[i] for i in range(size)]
+
+    def allreduce(self, value, op=SUM, timeout=None):
+        """Retourne, à tous les nœuds, la réduction par 'op' des valeurs de tous les nœuds"""
+        sequence, members, index, _ = self._begin("allreduce")
+        deadline = self._deadline(timeout)
+        size = len(members)
+        power = 1 << (size.bit_length() - 1)
+        extra = size - power
+        # Les 2*extra premiers nœuds vont par paires : le pair confie sa valeur à l'impair
+        if index < 2 * extra:
+            if index % 2 == 0:
+                self._send(sequence, 0, members[index + 1], value)
+                return self._receive(sequence, 1, members[index + 1], deadline)
+            value = op(self._receive(sequence, 0, members[index - 1], deadline), value)
+            rank = index // 2
+        else:
+            rank = index - extra
+        mask, round = 1, 2
+        while mask < power:
+            partner = rank ^ mask
+            partner_index = partner * 2 + 1 if partner < extra else partner + extra
+            self._send(sequence, round, members[partner_index], value)
+            received = self._receive(sequence, round, members[partner_index], deadline)
+            # Même ordre d'opérandes des deux côtés : les deux partenaires obtiennent la même valeur
+            value = op(received, value) if partner < rank else op(value, received)
+            mask, round = mask * 2, round + 1
+        if index < 2 * extra:
+            self._send(sequence, 1, members[index - 1], value)
+        return value
+
+    def ring_allreduce(self, array, op=SUM, chunk_bytes=RING_CHUNK_BYTES, timeout=None):
+        """
+        allreduce d'un tableau NumPy (même forme et même type sur tous les nœuds) en anneau.
+
+        Le tableau est découpé en N segments. Réduction-diffusion (N-1 étapes) : à l'étape s, le nœud
+        d'indice i reçoit du précédent le segment i-s-1, le combine avec le sien et le passe au suivant ;
+        le segment i+1 est alors entièrement réduit chez i. Diffusion (N-1 étapes) : les segments réduits
+        font le tour de l'anneau. Chaque segment est envoyé en morceaux de 'chunk_bytes' : un morceau reçu
+        est réduit puis réexpédié aussitôt, pendant que les suivants sont en route (pipeline).
+
+        Le tableau d'entrée n'est pas modifié ; le résultat est un nouveau tableau, identique sur tous les nœuds.
+        """
+        if numpy is None:
+            raise RuntimeError("ring_allreduce() nécessite NumPy")
+        sequence, members, index, _ = self._begin("ring_allreduce")
+        deadline = self._deadline(timeout)
+        size = len(members)
+        array = numpy.asarray(array)
+        if size == 1:
+            return array.copy()
+        following, preceding = members[(index + 1) % size], members[(index - 1) % size]
+        nb_chunks = max(1, -(-array.nbytes // (size * chunk_bytes)))
+        # segments[k][j] : morceau j du segment k ; jamais modifié sur place (un morceau envoyé est partagé en mémoire)
+        segments = [numpy.array_split(segment, nb_chunks) for segment in numpy.array_split(array.reshape(-1), size)]
+        steps = 2 * (size - 1)
+        for j, chunk in enumerate(segments[index]):
+            self._send(sequence, j, following, chunk)
+        for step in range(steps):
+            k = (index - step - 1) % size
+            for j in range(nb_chunks):
+                received = self._receive(sequence, step * nb_chunks + j, preceding, deadline)
+                chunk = op(received, segments[k][j]) if step < size - 1 else received
+                segments[k][j] = chunk
+                if step + 1 < steps:
+                    self._send(sequence, (step + 1) * nb_chunks + j, following, chunk)
+        return numpy.concatenate([chunk for segment in segments for chunk in segment]).reshape(array.shape)
+
+    def _combine_to_root(self, sequence, members, index, root_index, value, op, deadline):
+        """Arbre binomial : chaque nœud combine les valeurs de ses fils puis envoie le résultat à son parent"""
+        size = len(members)
+        relative = (index - root_index) % size
+        mask, round = 1, 0
+        while mask < size:
+            if relative & mask:
+                self._send(sequence, round, members[(index - mask) % size], value)
+                return None
+            if relative + mask < size:
+                value = op(value, self._receive(sequence, round, members[(index + mask) % size], deadline))
+            mask, round = mask * 2, round + 1
+        return value
+
+    def _begin(self, operation, root=None):
+        """Numérote l'opération et retourne (sequence, monde trié, indice de ce nœud, indice de la racine)"""
+        communication = self.communication
+        if communication.dispatcher.is_dispatcher_thread():
+            raise RuntimeError(f"{operation}() bloquant depuis le dispatcher")
+        members = sorted(communication.world)
+        if communication.id not in members:
+            raise RuntimeError(f"{operation}(): nœud {communication.get_rank()} hors du monde")
+        if root is not None and root not in members:
+            raise ValueError(f"{operation}(): racine {root} hors du monde")
+        with self.condition:
+            self.sequence += 1
+            sequence = self.sequence
+        log.debug("Nœud %s - %s n°%s sur %s nœuds", communication.id, operation, sequence, len(members))
+        root_index = 0 if root is None else members.index(root)
+        return sequence, members, members.index(communication.id), root_index
+
+    def _deadline(self, timeout):
+        return None if timeout is None else time() + timeout
+
+    def _send(self, sequence, round, node, payload):
+        communication = self.communication
+        communication.send_message_to(node, CollectiveMessage(
+            communication.id, communication.get_clock(), sequence, round, payload, target=node))
+
+    def _receive(self, sequence, round, node, deadline):
+        """Attend le message (sequence, round) de 'node'"""
+        key = (sequence, round, node)
+        with self.condition:
+            while key not in self.inbox:
+                if not self.communication.alive:
+                    raise RuntimeError(f"Nœud {self.communication.id} arrêté pendant une collective")
+                remaining = None if deadline is None else deadline - time()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError(f"Collective n°{sequence}: pas de message de {node} (tour {round})")
+                self.condition.wait(remaining)
+            return self.inbox.pop(key)
@@ -0,0 +1,40 @@
+import operator
+
+try:
+    import numpy
+except ImportError:  # NumPy est optionnel : sans lui, les réductions portent sur des nombres et des listes
+    numpy = None
+
+def is_array(value):
+    return numpy is not None and isinstance(value, numpy.ndarray)
+
+class ReduceOp:
+    """
+    Opération de réduction des collectives (équivalent de MPI_Op), associative et commutative.
+
+    - tableaux NumPy : opération vectorisée (numpy.add, numpy.minimum, ...), un seul appel par paire
+    - listes et tuples : élément par élément, comme un tampon MPI
+    - sinon : opération scalaire
+
+    Les opérandes ne sont jamais modifiés : en mémoire, un même objet est partagé entre les nœuds.
+    """
+
+    def __init__(self, name, scalar, vectorized):
+        self.name = name
+        self.scalar = scalar          # (a, b) -> a op b sur des scalaires
+        self.vectorized = vectorized  # Nom de la fonction NumPy équivalente
+
+    def __call__(self, a, b):
+        if is_array(a) or is_array(b):
+            return getattr(numpy, self.vectorized)(a, b)
+        if isinstance(a, (list, tuple)):
+            return type(a)(self(x, y) for x, y in zip(a, b))
+        return self.scalar(a, b)
+
+    def __repr__(self):
+        return f"ReduceOp({self.name})"
+
+SUM = ReduceOp("sum", operator.add, "add")
+PROD = ReduceOp("prod", operator.mul, "multiply")
+MIN = ReduceOp("min", min, "minimum")
+MAX = ReduceOp("max", max, "maximum")
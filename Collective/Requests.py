@@ -0,0 +1,34 @@
+from concurrent.futures import FIRST_COMPLETED, wait
+
+def wait_all(requests, timeout=None):
+    """
+    Attend la fin de toutes les requêtes (Futures de isend, irecv, ibroadcast, équivalent de MPI_Waitall).
+
+    Retourne la liste de leurs résultats, dans l'ordre des requêtes ; lève TimeoutError si
+    elles ne sont pas toutes terminées après 'timeout' secondes.
+    """
+    requests = list(requests)
+    _, not_done = wait(requests, timeout)
+    if not_done:
+        raise TimeoutError(f"{len(not_done)} requête(s) sur {len(requests)} non terminée(s)")
+    return [request.result() for request in requests]
+
+def wait_any(requests, timeout=None):
+    """
+    Attend la fin d'au moins une requête (équivalent de MPI_Waitany).
+
+    Retourne (indice, résultat) de la première requête terminée dans l'ordre de la liste,
+    ou (None, None) si aucune ne l'est après 'timeout' secondes.
+    """
+    requests = list(requests)
+    done, _ = wait(requests, timeout, return_when=FIRST_COMPLETED)
+    for index, request in enumerate(requests):
+        if request in done:
+            return index, request.result()
+    return None, None
+
+def test(request):
+    """Sans bloquer (équivalent de MPI_Test) : (True, résultat) si la requête est terminée, (False, None) sinon"""
+    if request.done():
+        return True, request.result()
+    return False, None
@@ -0,0 +1,15 @@
+from .Collectives import Collectives
+from .ReduceOp import ReduceOp, SUM, PROD, MIN, MAX
+from .Requests import test, wait_all, wait_any
+
+__all__ = [
+    "Collectives",
+    "ReduceOp",
+    "SUM",
+    "PROD",
+    "MIN",
+    "MAX",
+    "test",
+    "wait_all",
+    "wait_any",
+]
@@ -1,24 +1,75 @@
 # Communication.py
-from pyeventbus3.pyeventbus3 import *
-from threading import Lock, Timer
+from concurrent.futures import Future, InvalidStateError
+from copy import copy
+from threading import Lock, Thread
 from Message import *
 from State import *
+from Network import ANY_SOURCE, ANY_TAG, Batcher, Dispatcher, Mailbox, MatchQueue, Router
+from Log import get_logger
+from Clock import LamportClock, VectorClock
+from Barrier import DisseminationBarrier, LeaderBarrier, TreeBarrier
+from Broadcast import BroadcastSyncInbox, CausalBroadcast, SpanningTree, TotalOrderBroadcast
+from Collective import Collectives, SUM, test, wait_all, wait_any
+from Collective.Collectives import RING_CHUNK_BYTES
+from Mutex import LockService, Maekawa, RicartAgrawala, SuzukiKasami, TokenRing
 from time import time, sleep
 import random
 
+log = get_logger("comm")         # Découverte, enregistrement, routage
+sync_log = get_logger("sync")    # synchronize, broadcastSync, sendToSync/receiveFromSync
+
+# Messages non système traités par le nœud (découverte, enregistrement, distribution d'ID, monde) :
+# ils n'entrent pas dans la boîte aux lettres, donc ne subissent pas sa contre-pression
+CONTROL_MESSAGES = (AliveMessage, IdAnnouncementMessage, IdConfirmationMessage, WorldInfoMessage,
+                    RegistrationRequest, RegistrationResponse, WorldUpdateMessage)
+
 class Communication:
 
-    def __init__(self):
+    def __init__(self, router=None, batch_window=None, batch_size=64,
+                 mailbox_capacity=None, mailbox_bytes=None, mailbox_policy="block", mailbox_block_timeout=1.0,
+                 vector_clock=False, mutex="ring", lock_placement="sharded", barrier="leader",
+                 broadcast_fan_out=None):
+        """
+        Args:
+            router: Transport entre nœuds (Router en mémoire par défaut)
+            batch_window: Si défini, regroupe les messages ciblés par destinataire pendant
+                          cette durée (secondes) et les envoie dans une EnvelopeMessage
+            batch_size: Taille maximale d'un lot (envoi immédiat quand elle est atteinte)
+            mailbox_capacity: Nombre maximal de messages en boîte aux lettres (None = illimité)
+            mailbox_bytes: Taille approximative maximale de la boîte aux lettres, en octets
+            mailbox_policy: Comportement quand la boîte est pleine : "block", "drop_oldest",
+                            "drop_newest" ou "spill" (voir Network/Mailbox.py)
+            mailbox_block_timeout: Avec "block", attente maximale d'un émetteur (None = illimitée) ;
+                                   au-delà, le message est accepté au-delà de la capacité
+            vector_clock: Si True, les messages non système transportent aussi une horloge
+                          vectorielle (encodage différentiel, voir Clock/VectorClock.py)
+            mutex: Moteur d'exclusion mutuelle de requestToken/releaseToken : "ring" (jeton
+                   circulant sur l'anneau), "suzuki_kasami" (jeton envoyé à la demande),
+                   "ricart_agrawala" (permission de tous) ou "maekawa" (permission d'un quorum)
+            lock_placement: Gestionnaire des verrous nommés de acquire/release : "sharded"
+                            (réparti sur les nœuds selon le nom) ou "leader"
+            barrier: Algorithme de synchronize() : "leader" (confirmations centralisées),
+                     "tree" (arbre de combinaison) ou "dissemination", en O(log N) tours
+            broadcast_fan_out: Si défini, broadcastSync diffuse le message le long d'un arbre
+                               de cette arité et les ACKs sont agrégés en remontant (None = envoi
+                               direct à chaque nœud, et N-1 ACKs pour l'émetteur)
+        """
         # Identifiants
         self.id = None              # ID du processus (permanent)
         self.temp_id = random.randint(10000, 99999)  # ID temporaire pour l'initialisation
-        self.lamportClock = 0       # Horloge de Lamport
+        self.clock = LamportClock() # Horloge de Lamport (messages non système uniquement)
+        self.vector_clock = VectorClock(self.temp_id) if vector_clock else None  # Horloge vectorielle optionnelle (indexée par ID permanent)
         
         # Communication
-        self.mailbox = []           # File des messages reçus
-        self.mailbox_lock = Lock()  # Verrou pour thread-safety
+        self.mailbox = Mailbox(mailbox_capacity, mailbox_bytes, mailbox_policy)  # File des messages reçus
+        self.mailbox_block_timeout = mailbox_block_timeout
         self.world = set()          # Ensemble des nœuds connus (IDs permanents)
         self.temp_world = set()     # Ensemble des nœuds temporaires découverts
+        self.router = router or Router.Instance()  # Registre d'adresses pour les messages ciblés
+        self.dispatcher = Dispatcher(self._dispatch_message, name=f"Dispatcher-{self.temp_id}")  # File d'entrée unique du nœud
+        self.batcher = None         # Regroupement optionnel des messages sortants par destinataire
+        if batch_window is not None:
+            self.batcher = Batcher(self._send_batch, batch_window, batch_size, name=f"Batcher-{self.temp_id}")
         
         # État et machine à états
         self.alive = True
@@ -41,34 +92,82 @@ class Communication:
         
         # Synchronisation
         self.is_synchronizing = False  # Flag pour indiquer que le nœud est en cours de synchronisation
-        self.synchronize_confirmations = set()  # Set des confirmations reçues pour la synchronisation
         self.synchronize_callback = None  # Callback à appeler quand la synchronisation est terminée
+        self.synchronize_future = None    # Future du synchronize() en cours
+        self.synchronize_started = None   # Début du synchronize() en cours (mesure de latence)
+        self.barrier = self._create_barrier(barrier)  # Algorithme de barrière (avec numéros de génération)
         
         # BroadcastSync
-        self.broadcast_sync_waiting = {}  # Dict: {from_id: {'payload': payload, 'callback': callback, 'acks': set()}}
+        self.broadcast_sync_sequence = 0  # Numéro du dernier broadcastSync émis
+        self.broadcast_sync_waiting = {}  # Émetteur - Dict: {sequence: {'payload', 'callback', 'acks': set(), 'expected_acks': set(), 'event'}}
+        self.broadcast_sync_inbox = {}    # Récepteur - Dict: {from_id: BroadcastSyncInbox}
+        self.broadcast_sync_relays = {}   # Relais (arbre) - Dict: {(from_id, sequence): {'parent', 'pending': fils sans ACK}}
         self.broadcast_sync_lock = Lock()  # Verrou pour thread-safety du broadcast sync
+        self.broadcast_fan_out = broadcast_fan_out
+        self.broadcast_tree = None  # Dernier arbre couvrant construit (reconstruit si le monde change)
+
+        # Diffusion totalement ordonnée (séquenceur sur le leader)
+        self.total_order = TotalOrderBroadcast(self)
+
+        # Diffusion causale (file de rétention indexée par émetteur)
+        self.causal = CausalBroadcast(self)
+
+        # Opérations collectives (scatter, gather, reduce, allgather, allreduce)
+        self.collectives = Collectives(self)
         
         # SendToSync / ReceiveFromSync
-        self.send_to_sync_waiting = {}  # Dict: {sync_id: {'event': Event, 'callback': callback}}
-        self.receive_from_sync_waiting = {}  # Dict: {from_id: {'sync_id': sync_id, 'event': Event, 'payload': None, 'callback': callback}}
+        self.send_to_sync_waiting = {}  # Dict: {sync_id: {'future': Future, 'callback': callback, 'dest_id'}}
+        self.receive_from_sync_matches = MatchQueue()  # Messages inattendus et receiveFromSync en attente, appariés par (expéditeur, étiquette)
         self.send_to_sync_lock = Lock()  # Verrou pour thread-safety
         self.sync_id_counter = 0  # Compteur pour générer des IDs uniques
+        self.pending_requests = {}  # isend / irecv / ibroadcast en cours - Dict: {Future: résultat si le nœud s'arrête}
+        self.requests_lock = Lock()
 
-        self.request = False
-        self.release = True
-        self.token = None
-        self.token_lock = Lock()  # Verrou pour l'accès au jeton
-        self.have_token = False
+        # Exclusion mutuelle (requestToken / releaseToken)
+        self.mutex = self._create_mutex(mutex)
+
+        # Verrous nommés (acquire / release)
+        self.locks = LockService(self, lock_placement)
+
+    def _create_mutex(self, name):
+        """Instancie le moteur d'exclusion mutuelle choisi"""
+        match name:
+            case "ring":
+                return TokenRing(self)
+            case "suzuki_kasami":
+                return SuzukiKasami(self)
+            case "ricart_agrawala":
+                return RicartAgrawala(self)
+            case "maekawa":
+                return Maekawa(self)
+        raise ValueError(f"Moteur d'exclusion mutuelle inconnu: {name}")
+
+    def _create_barrier(self, name):
+        """Instancie l'algorithme de barrière choisi"""
+        match name:
+            case "leader":
+                return LeaderBarrier(self)
+            case "tree":
+                return TreeBarrier(self)
+            case "dissemination":
+                return DisseminationBarrier(self)
+        raise ValueError(f"Algorithme de barrière inconnu: {name}")
 
     def init(self):
         """Initialise la communication et démarre le processus de découverte"""
-        PyBus.Instance().register(self, self)
+        self.dispatcher.start()
+        self.mutex.start()
+        self.locks.start()
+        self.total_order.start()
+        if self.batcher:
+            self.batcher.start()
+        self.router.register(self.temp_id, self)
         self.transition_to_state(NodeState.FOLLOWER)
         self.start_discovery_phase()
     
     def start_discovery_phase(self):
         """Phase 1: Découverte des nœuds avec message Alive"""
-        print(f"Nœud (temp_id: {self.temp_id}) démarre la phase de découverte")
+        log.info("Nœud (temp_id: %s) démarre la phase de découverte", self.temp_id)
         
         # Envoyer un message Alive
         alive_msg = AliveMessage(self.temp_id, self.get_lamport_timestamp())
@@ -76,31 +175,28 @@ class Communication:
 
         if self.alive:
             # Attendre 3 secondes pour la découverte, puis tenter l'enregistrement
-            self.discovery_timer = Timer(3.0, self.start_registration_phase)
-            self.discovery_timer.start()
+            self.discovery_timer = self.call_later(3.0, self.start_registration_phase)
     
     def start_registration_phase(self):
         """Phase 2: Tentative d'enregistrement auprès du leader"""
         if self.alive:
-            print(f"Nœud (temp_id: {self.temp_id}) tente l'enregistrement")
+            log.info("Nœud (temp_id: %s) tente l'enregistrement", self.temp_id)
             if self.leader_id:
                 # Il y a un leader connu, demander l'enregistrement
                 registration_req = RegistrationRequest(self.temp_id, self.get_lamport_timestamp())
                 self.send_message_to(self.leader_id, registration_req)
                 
                 # Attendre 5 secondes pour une réponse
-                self.registration_timer = Timer(5.0, self.start_leader_election_phase)
-                self.registration_timer.start()
+                self.registration_timer = self.call_later(5.0, self.start_leader_election_phase)
             else:
                 # Pas de leader connu, attendre un peu plus pour les heartbeats potentiels
-                print(f"Nœud (temp_id: {self.temp_id}) attend des heartbeats...")
-                self.registration_timer = Timer(3.0, self.start_leader_election_phase)
-                self.registration_timer.start()
+                log.info("Nœud (temp_id: %s) attend des heartbeats...", self.temp_id)
+                self.registration_timer = self.call_later(3.0, self.start_leader_election_phase)
     
     def start_leader_election_phase(self):
         """Phase 3: Distribution d'ID puis démarrage de l'élection de leader"""
         if not self.is_registered:
-            print(f"Nœud (temp_id: {self.temp_id}) aucun leader trouvé - démarre distribution d'ID")
+            log.info("Nœud (temp_id: %s) aucun leader trouvé - démarre distribution d'ID", self.temp_id)
             self.distribute_ids()
     
     def distribute_ids(self):
@@ -116,10 +212,10 @@ class Communication:
         for i, temp_id in enumerate(temp_nodes, 1):
             id_mapping[temp_id] = i
         
-        print(f"Nœud {self.temp_id} calcule mapping d'ID: {id_mapping}")
+        log.debug("Nœud %s calcule mapping d'ID: %s", self.temp_id, id_mapping)
         
         # Assigner son propre ID permanent
-        self.id = id_mapping[self.temp_id]
+        self.assign_id(id_mapping[self.temp_id])
         self.world = set(id_mapping.values())
         
         # Broadcaster la confirmation d'ID
@@ -132,25 +228,54 @@ class Communication:
         
         # Marquer comme enregistré
         self.is_registered = True
-        print(f"Nœud {self.temp_id} devient nœud {self.id}")
-        print(f"Monde: {self.world}")
+        log.info("Nœud %s devient nœud %s", self.temp_id, self.id)
+        log.debug("Monde: %s", self.world)
         
         # Attendre un peu que les autres nœuds reçoivent la confirmation
-        Timer(1.0, self.start_election_after_id_distribution).start()
+        self.call_later(1.0, self.start_election_after_id_distribution)
     
     def start_election_after_id_distribution(self):
         """Démarre l'élection après la distribution d'ID"""
-        print(f"Nœud {self.id} démarre l'élection")
+        log.info("Nœud %s démarre l'élection", self.id)
         self.transition_to_state(NodeState.CANDIDATE)
     
+    def call_later(self, delay, callback, *args):
+        """Planifie un callback exécuté par le dispatcher du nœud (remplace threading.Timer)"""
+        return self.dispatcher.call_later(delay, callback, *args)
+
+    def assign_id(self, new_id):
+        """Assigne l'ID permanent et l'enregistre auprès du routeur"""
+        if self.id is not None and self.id != new_id:
+            self.router.unregister(self.id)
+        self.id = new_id
+        self.router.register(new_id, self)
+        if self.vector_clock:
+            self.vector_clock.set_node_id(new_id)
+
+    @property
+    def lamportClock(self):
+        """Valeur courante de l'horloge de Lamport"""
+        return self.clock.value
+
+    def inc_clock(self):
+        """Incrémente l'horloge de Lamport (événement local du processus) et retourne sa valeur"""
+        return self.clock.inc()
+
     def get_lamport_timestamp(self):
-        """Retourne et incrémente l'horloge de Lamport"""
-        self.lamportClock += 1
-        return self.lamportClock
+        """Retourne et incrémente l'horloge de Lamport (timestamp d'un message non système)"""
+        return self.clock.inc()
+
+    def get_clock(self):
+        """Retourne l'horloge de Lamport sans l'incrémenter (timestamp d'un message système)"""
+        return self.clock.value
     
     def update_lamport_clock(self, received_timestamp):
         """Met à jour l'horloge de Lamport avec un timestamp reçu"""
-        self.lamportClock = max(self.lamportClock, received_timestamp) + 1
+        self.clock.update(received_timestamp)
+
+    def get_vector_clock(self):
+        """Retourne une copie de l'horloge vectorielle (None si elle n'est pas activée)"""
+        return self.vector_clock.snapshot() if self.vector_clock else None
     
     def transition_to_state(self, new_state):
         """Change l'état du nœud"""
@@ -161,7 +286,7 @@ class Communication:
         old_state = self.state
         self.state = new_state
         
-        print(f"Nœud {self.id or self.temp_id} transition {old_state.value} -> {new_state.value}")
+        log.info("Nœud %s transition %s -> %s", self.id or self.temp_id, old_state.value, new_state.value)
         
         # Créer la nouvelle machine à états
         match new_state:
@@ -182,22 +307,81 @@ class Communication:
         if target_id == self.id or target_id == self.temp_id:
             return
             
-        # Marquer le message comme ciblé
+        # Marquer une copie du message comme ciblée : un même message peut être
+        # envoyé à plusieurs destinataires et rester en file chez chacun d'eux
+        message = copy(message)
         message.target = target_id
+        if self.vector_clock and self.id is not None and not message.is_system():
+            message.vector = self.vector_clock.stamp(target_id)  # Entrées modifiées depuis le dernier envoi à target_id
         
         # Simulation d'envoi - dans un vrai système, cela passerait par le réseau
-        print(f"Envoi de {type(message).__name__} de {message.source} vers {target_id}")
+        log.debug("Envoi de %s de %s vers %s", type(message).__name__, message.source, target_id)
         
-        # Pour la simulation, on utilise PyBus mais avec un target spécifique
-        PyBus.Instance().post(message)
+        if self.batcher:
+            self.batcher.add(target_id, message)
+        else:
+            self._route(message)
+    
+    def _route(self, message):
+        """
+        Livraison directe au destinataire via le routeur ; si l'adresse est
+        encore inconnue, repli sur une diffusion (chaque nœud filtre avec is_for_me)
+        """
+        if not self.router.route(message):
+            self.router.broadcast(message, sender=self)
+    
+    def _send_batch(self, target_id, messages):
+        """Envoie un lot du batcher : le message seul, ou une enveloppe s'il y en a plusieurs"""
+        if len(messages) == 1:
+            self._route(messages[0])
+            return
+        envelope = EnvelopeMessage(messages[0].source, messages[-1].timestamp, messages, target=target_id)
+        self._route(envelope)
     
     def broadcast_message(self, message):
         """Diffuse un message à tous les nœuds connus"""
         # Marquer explicitement comme broadcast
         message.target = None
-        print(f"Broadcast de {type(message).__name__} depuis {message.source}")
-        PyBus.Instance().post(message)
+        if self.vector_clock and self.id is not None and not message.is_system():
+            message.vector = self.vector_clock.stamp()  # Vecteur complet
+        log.debug("Broadcast de %s depuis %s", type(message).__name__, message.source)
+        # Vider les lots en attente pour que le broadcast ne double pas des messages envoyés avant lui
+        if self.batcher:
+            self.batcher.flush()
+        self.router.broadcast(message, sender=self)
     
+    def deliver(self, message):
+        """
+        Point d'entrée du routeur : dépose le message dans la file d'entrée du nœud.
+        Si la boîte aux lettres est pleine (politique "block"), le thread qui livre le message
+        attend qu'elle se vide : l'émetteur (send_message_to en mémoire, ou le lecteur du
+        socket, et donc la fenêtre TCP) est ralenti au lieu de remplir la mémoire.
+        Seuls les messages destinés à la boîte aux lettres sont retenus : jamais les messages système,
+        ni le trafic de contrôle (découverte, enregistrement, IDs, monde), traité par le nœud lui-même.
+        """
+        if not message.is_system() and not isinstance(message, CONTROL_MESSAGES):
+            self.mailbox.wait_for_room(self.mailbox_block_timeout)
+        self.dispatcher.post(message)
+
+    def _dispatch_message(self, message):
+        """Aiguille un message, dans le thread du dispatcher, vers son gestionnaire"""
+        match message:
+            case EnvelopeMessage():
+                # Déballer le lot et traiter chaque message dans l'ordre d'envoi
+                for inner in message.messages:
+                    self._dispatch_message(inner)
+            case TokenMessage() | TokenRequestMessage() | TokenGrantMessage() | PermissionMessage():
+                # Le jeton (ou la permission) est déposé auprès du moteur d'exclusion mutuelle, sans bloquer le dispatcher
+                self.mutex.handle_message(message)
+            case LockRequestMessage() | LockGrantMessage() | LockReleaseMessage() | LockRenewMessage():
+                self.locks.handle_message(message)
+            case TotalOrderRequestMessage() | TotalOrderBatchMessage():
+                self.total_order.handle_message(message)
+            case CollectiveMessage():
+                self.collectives.handle_message(message)
+            case _:
+                self._handle_message_common(message)
+
     def _handle_message_common(self, message):
         """Logique commune pour tous les messages"""
         # Ignorer ses propres messages - vérifier à la fois l'ID permanent et temporaire
@@ -211,8 +395,11 @@ class Communication:
             # Message pas pour nous, l'ignorer
             return False
         
-        # Mettre à jour l'horloge de Lamport
-        self.update_lamport_clock(message.timestamp)
+        # Mettre à jour les horloges (les messages système n'ont pas d'effet sur l'horloge)
+        if not message.is_system():
+            self.update_lamport_clock(message.timestamp)
+            if self.vector_clock and message.vector is not None:
+                self.vector_clock.merge(message.vector)
         
         # Traiter les messages spéciaux pour la phase d'initialisation
         match message:
@@ -226,14 +413,8 @@ class Communication:
                 # Si on reçoit un heartbeat et qu'on n'est pas enregistré, demander l'enregistrement
                 self.handle_heartbeat_during_initialization(message)
                 return True
-            case SynchronizeMessage():
-                self.handle_synchronize_message(message)
-                return True
-            case SynchronizeConfirmedMessage():
-                self.handle_synchronize_confirmed_message(message)
-                return True
-            case AllSynchronizedMessage():
-                self.handle_all_synchronized_message(message)
+            case SynchronizeMessage() | SynchronizeConfirmedMessage() | AllSynchronizedMessage() | BarrierMessage():
+                self.barrier.handle_message(message)
                 return True
             case BroadcastSyncMessage():
                 self.handle_broadcast_sync_message(message)
@@ -241,6 +422,9 @@ class Communication:
             case BroadcastSyncAckMessage():
                 self.handle_broadcast_sync_ack_message(message)
                 return True
+            case CausalMessage():
+                self.causal.handle_message(message)
+                return True
             case SendToSyncMessage():
                 self.handle_send_to_sync_message(message)
                 return True
@@ -255,122 +439,32 @@ class Communication:
         
         return False
     
-    @subscribe(threadMode=Mode.PARALLEL, onEvent=AliveMessage)
-    def handle_alive_message(self, message):
-        """Gestionnaire pour les messages AliveMessage"""
-        self._handle_message_common(message)
-    
-    @subscribe(threadMode=Mode.PARALLEL, onEvent=RegistrationRequest)
-    def handle_registration_request_message(self, message):
-        """Gestionnaire pour les messages RegistrationRequest"""
-        self._handle_message_common(message)
-
-    @subscribe(threadMode=Mode.PARALLEL, onEvent=RegistrationResponse)
-    def handle_registration_response_message(self, message):
-        """Gestionnaire pour les messages RegistrationResponse"""
-        self._handle_message_common(message)
-
-    @subscribe(threadMode=Mode.PARALLEL, onEvent=HeartbeatMessage)
-    def handle_heartbeat_message(self, message):
-        """Gestionnaire pour les messages HeartbeatMessage"""
-        self._handle_message_common(message)
-
-    @subscribe(threadMode=Mode.PARALLEL, onEvent=HeartbeatConfirmationMessage)
-    def handle_heartbeat_confirmation_message(self, message):
-        """Gestionnaire pour les messages HeartbeatConfirmationMessage"""
-        self._handle_message_common(message)
-
-    @subscribe(threadMode=Mode.PARALLEL, onEvent=RequestVoteMessage)
-    def handle_request_vote_message(self, message):
-        """Gestionnaire pour les messages RequestVoteMessage"""
-        self._handle_message_common(message)
-
-    @subscribe(threadMode=Mode.PARALLEL, onEvent=VoteResponseMessage)
-    def handle_vote_response_message(self, message):
-        """Gestionnaire pour les messages VoteResponseMessage"""
-        self._handle_message_common(message)
-
-    @subscribe(threadMode=Mode.PARALLEL, onEvent=WorldUpdateMessage)
-    def handle_world_update_message(self, message):
-        """Gestionnaire pour les messages WorldUpdateMessage"""
-        self._handle_message_common(message)
-    
-    @subscribe(threadMode=Mode.PARALLEL, onEvent=IdAnnouncementMessage)
-    def handle_id_announcement_message(self, message):
-        """Gestionnaire pour les messages IdAnnouncementMessage"""
-        self._handle_message_common(message)
-    
-    @subscribe(threadMode=Mode.PARALLEL, onEvent=IdConfirmationMessage)
-    def handle_id_confirmation_message(self, message):
-        """Gestionnaire pour les messages IdConfirmationMessage"""
-        self._handle_message_common(message)
-    
-    @subscribe(threadMode=Mode.PARALLEL, onEvent=WorldInfoMessage)
-    def handle_world_info_message(self, message):
-        """Gestionnaire pour les messages WorldInfoMessage"""
-        self._handle_message_common(message)
-    
-    @subscribe(threadMode=Mode.PARALLEL, onEvent=SynchronizeMessage)
-    def handle_synchronize_message_subscribe(self, message):
-        """Gestionnaire pour les messages SynchronizeMessage"""
-        self._handle_message_common(message)
-    
-    @subscribe(threadMode=Mode.PARALLEL, onEvent=SynchronizeConfirmedMessage)
-    def handle_synchronize_confirmed_message_subscribe(self, message):
-        """Gestionnaire pour les messages SynchronizeConfirmedMessage"""
-        self._handle_message_common(message)
-    
-    @subscribe(threadMode=Mode.PARALLEL, onEvent=AllSynchronizedMessage)
-    def handle_all_synchronized_message_subscribe(self, message):
-        """Gestionnaire pour les messages AllSynchronizedMessage"""
-        self._handle_message_common(message)
-    
-    @subscribe(threadMode=Mode.PARALLEL, onEvent=BroadcastSyncMessage)
-    def handle_broadcast_sync_message_subscribe(self, message):
-        """Gestionnaire pour les messages BroadcastSyncMessage"""
-        self._handle_message_common(message)
-    
-    @subscribe(threadMode=Mode.PARALLEL, onEvent=BroadcastSyncAckMessage)
-    def handle_broadcast_sync_ack_message_subscribe(self, message):
-        """Gestionnaire pour les messages BroadcastSyncAckMessage"""
-        self._handle_message_common(message)
-    
-    @subscribe(threadMode=Mode.PARALLEL, onEvent=SendToSyncMessage)
-    def handle_send_to_sync_message_subscribe(self, message):
-        """Gestionnaire pour les messages SendToSyncMessage"""
-        self._handle_message_common(message)
-    
-    @subscribe(threadMode=Mode.PARALLEL, onEvent=SendToSyncAckMessage)
-    def handle_send_to_sync_ack_message_subscribe(self, message):
-        """Gestionnaire pour les messages SendToSyncAckMessage"""
-        self._handle_message_common(message)
-    
     def handle_registration_response(self, message):
         """Traite la réponse d'enregistrement du leader"""
         if self.registration_timer:
             self.registration_timer.cancel()
         
-        print(f"Nœud reçoit ID {message.assigned_id} du leader {message.source}")
+        log.info("Nœud reçoit ID %s du leader %s", message.assigned_id, message.source)
         
         # Assigner l'ID permanent et mettre à jour le monde
-        self.id = message.assigned_id
+        self.assign_id(message.assigned_id)
         self.world = message.world_nodes
         self.leader_id = message.source
         self.is_registered = True
         
         # Rester en état FOLLOWER
-        print(f"Nœud {self.id} enregistré avec succès")
+        log.info("Nœud %s enregistré avec succès", self.id)
     
     def handle_world_update(self, message):
         """Traite une mise à jour du monde depuis le leader"""
         if message.source == self.leader_id:
             self.world = message.nodes
-            print(f"Nœud {self.id} met à jour son monde: {self.world}")
+            log.debug("Nœud %s met à jour son monde: %s", self.id, self.world)
     
     def handle_heartbeat_during_initialization(self, message):
         """Traite un heartbeat reçu pendant l'initialisation - demande l'enregistrement"""
         if not self.is_registered:
-            print(f"Nœud (temp_id: {self.temp_id}) détecte un leader {message.source}, demande l'enregistrement")
+            log.info("Nœud (temp_id: %s) détecte un leader %s, demande l'enregistrement", self.temp_id, message.source)
             self.leader_id = message.source
             self.current_term = message.term
             
@@ -384,66 +478,14 @@ class Communication:
             registration_req = RegistrationRequest(self.temp_id, self.get_lamport_timestamp())
             self.send_message_to(self.leader_id, registration_req)
     
-    def handle_synchronize_message(self, message):
-        """
-        Traite un message SynchronizeMessage.
-        Si c'est un follower, envoie une confirmation au leader.
-        Si c'est le leader, commence à attendre les confirmations.
-        """
-        print(f"Nœud {self.id} reçoit demande de synchronisation de {message.source}")
-        
-        if self.state == NodeState.LEADER:
-            # Le leader a reçu sa propre demande de synchronisation
-            # Commencer à attendre les confirmations de tous les autres nœuds
-            expected_nodes = self.world - {self.id}  # Tous les nœuds sauf lui-même
-            print(f"Leader {self.id} attend confirmations de: {expected_nodes}")
-        else:
-            # Les followers envoient une confirmation au leader
-            if self.leader_id:
-                confirm_msg = SynchronizeConfirmedMessage(
-                    self.id, 
-                    self.get_lamport_timestamp(), 
-                    target=self.leader_id
-                )
-                self.send_message_to(self.leader_id, confirm_msg)
-                print(f"Nœud {self.id} envoie confirmation de synchronisation au leader {self.leader_id}")
-    
-    def handle_synchronize_confirmed_message(self, message):
-        """
-        Traite un message SynchronizeConfirmedMessage (seulement pour le leader).
-        Quand toutes les confirmations sont reçues, envoie AllSynchronizedMessage.
-        """
-        if self.state != NodeState.LEADER:
-            print(f"Nœud {self.id} reçoit confirmation de synchronisation mais n'est pas leader")
-            return
-            
-        print(f"Leader {self.id} reçoit confirmation de synchronisation de {message.source}")
-        self.synchronize_confirmations.add(message.source)
-        
-        # Vérifier si on a toutes les confirmations
-        expected_nodes = self.world - {self.id}  # Tous les nœuds sauf le leader
-        if self.synchronize_confirmations >= expected_nodes:
-            print(f"Leader {self.id} a reçu toutes les confirmations - envoie AllSynchronizedMessage")
-            
-            # Envoyer le message de fin de synchronisation en broadcast
-            all_sync_msg = AllSynchronizedMessage(self.id, self.get_lamport_timestamp())
-            self.broadcast_message(all_sync_msg)
-            
-            # Le leader se synchronise aussi
-            self._complete_synchronization()
-    
-    def handle_all_synchronized_message(self, message):
-        """
-        Traite un message AllSynchronizedMessage.
-        Signale que la synchronisation est terminée.
-        """
-        print(f"Nœud {self.id} reçoit signal de fin de synchronisation du leader {message.source}")
-        self._complete_synchronization()
-    
     def _complete_synchronization(self):
         """Termine le processus de synchronisation"""
+        latency = time() - self.synchronize_started
+        self.barrier.record_latency(latency)
         self.is_synchronizing = False
-        self.synchronize_confirmations.clear()
+        future, self.synchronize_future = self.synchronize_future, None
+        if future:
+            future.set_result(True)  # Débloque synchronize() / synchronize_async()
         
         # Appeler le callback si défini
         if self.synchronize_callback:
@@ -451,78 +493,96 @@ class Communication:
             self.synchronize_callback = None
             callback()
         
-        print(f"Nœud {self.id} synchronisation terminée")
+        sync_log.info("Nœud %s synchronisation terminée en %.3f ms", self.id, latency * 1000)
     
     def handle_broadcast_sync_message(self, message):
         """
         Traite un message BroadcastSyncMessage.
-        Récepteur: reçoit le message et envoie un ACK à l'émetteur.
+        Récepteur: acquitte le message, puis le livre dans l'ordre des numéros de l'émetteur,
+        au premier broadcastSync(from_id) en attente ou, à défaut, au prochain appel.
         """
         from_id = message.original_sender
-        payload = message.payload
         
-        print(f"Nœud {self.id} reçoit broadcastSync de {from_id}: {payload}")
-        
-        # Envoyer un ACK à l'émetteur
-        ack_msg = BroadcastSyncAckMessage(
-            self.id,
-            self.get_lamport_timestamp(),
-            from_id,
-            target=from_id  # Envoyer directement à l'émetteur
-        )
-        self.send_message_to(from_id, ack_msg)
+        sync_log.debug("Nœud %s reçoit broadcastSync %s de %s: %s", self.id, message.sequence, from_id, message.payload)
+        
+        if message.fan_out:
+            # Diffusion en arbre : relayer aux fils, l'ACK remontera quand tout le sous-arbre aura reçu
+            children = self._spanning_tree(message.members, message.fan_out).children(from_id, self.id)
+            if children:
+                with self.broadcast_sync_lock:
+                    self.broadcast_sync_relays[(from_id, message.sequence)] = {'parent': message.source, 'pending': set(children)}
+                relayed = BroadcastSyncMessage(self.id, self.get_clock(), message.payload, from_id,
+                                               message.sequence, message.fan_out, message.members)
+                for child in children:
+                    self.send_message_to(child, relayed)
+            else:
+                self._send_broadcast_sync_ack(message.source, from_id, message.sequence)
+        else:
+            # Envoyer un ACK directement à l'émetteur
+            self._send_broadcast_sync_ack(from_id, from_id, message.sequence)
         
-        # Débloquer l'attente si on était en attente de ce message
         with self.broadcast_sync_lock:
-            if from_id in self.broadcast_sync_waiting:
-                sync_info = self.broadcast_sync_waiting[from_id]
-                sync_info['payload'] = payload
-                sync_info['received'] = True
-                
-                # Appeler le callback si défini
-                if sync_info['callback']:
-                    callback = sync_info['callback']
-                    callback(payload)
-                
-                # Débloquer l'attente
-                sync_info['event'].set()
-                
-                # Nettoyer
-                del self.broadcast_sync_waiting[from_id]
+            inbox = self.broadcast_sync_inbox.setdefault(from_id, BroadcastSyncInbox())
+            deliveries = inbox.receive(message.sequence, message.payload)
+        
+        # Débloquer les attentes servies (callbacks hors verrou)
+        for waiter, payload in deliveries:
+            waiter['payload'] = payload
+            if waiter['callback']:
+                waiter['callback'](payload)
+            waiter['event'].set()
     
     def handle_broadcast_sync_ack_message(self, message):
         """
         Traite un message BroadcastSyncAckMessage.
-        Émetteur: reçoit un ACK d'un récepteur.
+        Émetteur: reçoit l'ACK d'un récepteur pour le broadcast numéro 'sequence'.
         """
         from_id = message.original_sender
         ack_from = message.source
         
-        print(f"Nœud {self.id} reçoit ACK de {ack_from} pour broadcastSync de {from_id}")
+        sync_log.debug("Nœud %s reçoit ACK de %s pour broadcastSync %s de %s", self.id, ack_from, message.sequence, from_id)
         
-        # Si je ne suis pas l'émetteur original, ignorer
         if self.id != from_id:
+            # Relais d'une diffusion en arbre : ACK agrégé au parent quand tous les fils ont acquitté
+            with self.broadcast_sync_lock:
+                relay = self.broadcast_sync_relays.get((from_id, message.sequence))
+                if relay is None:
+                    return
+                relay['pending'].discard(ack_from)
+                if relay['pending']:
+                    return
+                del self.broadcast_sync_relays[(from_id, message.sequence)]
+            self._send_broadcast_sync_ack(relay['parent'], from_id, message.sequence)
             return
         
         with self.broadcast_sync_lock:
-            if from_id in self.broadcast_sync_waiting:
-                sync_info = self.broadcast_sync_waiting[from_id]
-                sync_info['acks'].add(ack_from)
-                
-                # Vérifier si on a tous les ACKs
-                if sync_info['acks'] >= sync_info['expected_acks']:
-                    print(f"Nœud {self.id} a reçu tous les ACKs pour broadcastSync")
-                    
-                    # Appeler le callback si défini
-                    if sync_info['callback']:
-                        callback = sync_info['callback']
-                        callback(sync_info['payload'])
-                    
-                    # Débloquer l'attente
-                    sync_info['event'].set()
-                    
-                    # Nettoyer
-                    del self.broadcast_sync_waiting[from_id]
+            sync_info = self.broadcast_sync_waiting.get(message.sequence)
+            if sync_info is None:
+                return
+            sync_info['acks'].add(ack_from)
+            if not sync_info['acks'] >= sync_info['expected_acks']:
+                return
+            del self.broadcast_sync_waiting[message.sequence]
+        
+        sync_log.debug("Nœud %s a reçu tous les ACKs pour broadcastSync %s", self.id, message.sequence)
+        self._complete_broadcast_sync(sync_info)
+
+    def _send_broadcast_sync_ack(self, target_id, from_id, sequence):
+        """Acquitte le broadcast 'sequence' de from_id auprès de target_id (l'émetteur, ou le parent dans l'arbre)"""
+        self.send_message_to(target_id, BroadcastSyncAckMessage(self.id, self.get_clock(), from_id, sequence, target=target_id))
+
+    def _spanning_tree(self, members, fan_out):
+        """Arbre couvrant de 'members' ; reconstruit seulement quand le monde ou l'arité change"""
+        tree = self.broadcast_tree
+        if tree is None or tree.key != (frozenset(members), fan_out):
+            tree = self.broadcast_tree = SpanningTree(members, fan_out)
+        return tree
+
+    def _complete_broadcast_sync(self, sync_info):
+        """Émetteur : tous les récepteurs ont acquitté"""
+        if sync_info['callback']:
+            sync_info['callback'](sync_info['payload'])
+        sync_info['event'].set()
     
     def handle_send_to_sync_message(self, message):
         """
@@ -533,33 +593,34 @@ class Communication:
         sync_id = message.sync_id
         payload = message.payload
         
-        print(f"Nœud {self.id} reçoit sendToSync de {from_id} (sync_id: {sync_id}): {payload}")
+        sync_log.debug("Nœud %s reçoit sendToSync de %s (sync_id: %s): %s", self.id, from_id, sync_id, payload)
         
         # Envoyer un ACK à l'expéditeur
         ack_msg = SendToSyncAckMessage(
             self.id,
-            self.get_lamport_timestamp(),
+            self.get_clock(),
             sync_id,
             target=from_id
         )
         self.send_message_to(from_id, ack_msg)
         
-        # Vérifier si quelqu'un attend ce message
+        # Remettre le message à la plus ancienne réception correspondante, sinon le garder pour la prochaine
         with self.send_to_sync_lock:
-            if from_id in self.receive_from_sync_waiting:
-                wait_info = self.receive_from_sync_waiting[from_id]
-                wait_info['payload'] = payload
-                wait_info['sync_id'] = sync_id
-                
-                # Appeler le callback si défini
-                if wait_info['callback']:
-                    callback = wait_info['callback']
-                    callback(payload)
-                
-                # Débloquer l'attente
-                wait_info['event'].set()
-                # Note: on ne supprime pas de receive_from_sync_waiting ici,
-                # c'est fait dans receiveFromSync pour récupérer le payload
+            while True:
+                receive = self.receive_from_sync_matches.arrive(from_id, message.tag, payload)
+                # Une réception annulée (irecv) juste avant l'appariement cède le message à la suivante
+                if receive is None or receive['future'].set_running_or_notify_cancel():
+                    break
+        if receive:
+            self._complete_receive(receive, from_id, message.tag, payload)
+    
+    def _complete_receive(self, receive, source, tag, payload):
+        """Remet un message apparié à un receiveFromSync / irecv"""
+        if receive['status'] is not None:
+            receive['status'].update(source=source, tag=tag)
+        if receive['callback']:
+            receive['callback'](payload)
+        self._resolve_request(receive['future'], payload)
     
     def handle_send_to_sync_ack_message(self, message):
         """
@@ -569,21 +630,14 @@ class Communication:
         sync_id = message.sync_id
         ack_from = message.source
         
-        print(f"Nœud {self.id} reçoit ACK de {ack_from} pour sendToSync (sync_id: {sync_id})")
+        sync_log.debug("Nœud %s reçoit ACK de %s pour sendToSync (sync_id: %s)", self.id, ack_from, sync_id)
         
         with self.send_to_sync_lock:
-            if sync_id in self.send_to_sync_waiting:
-                wait_info = self.send_to_sync_waiting[sync_id]
-                
-                # Appeler le callback si défini
-                if wait_info['callback']:
-                    callback = wait_info['callback']
-                    callback()
-                
-                # Débloquer l'attente
-                wait_info['event'].set()
-                # Note: on ne supprime pas de send_to_sync_waiting ici,
-                # c'est fait dans sendToSync pour nettoyer
+            wait_info = self.send_to_sync_waiting.pop(sync_id, None)
+        if wait_info:
+            if wait_info['callback']:
+                wait_info['callback']()
+            self._resolve_request(wait_info['future'], True)
     
     def get_status(self):
         """Retourne le statut actuel du nœud (pour debug)"""
@@ -594,31 +648,68 @@ class Communication:
             'term': self.current_term,
             'leader_id': self.leader_id,
             'world': list(self.world),
-            'is_registered': self.is_registered
+            'is_registered': self.is_registered,
+            'mailbox': self.mailbox.stats(),
+            'barrier': self.barrier.stats(),
+            'causal': self.causal.stats()
         }
     
-    def synchronize(self, callback=None):
+    def synchronize(self, callback=None, timeout=None):
         """
         Démarre le processus de synchronisation.
         Le processus est bloqué jusqu'à ce que tous les nœuds soient synchronisés.
+        Avec barrier="tree" ou "dissemination", la barrière n'est franchie que lorsque
+        tous les nœuds du monde ont appelé synchronize().
         
         Args:
-            callback: Fonction à appeler quand la synchronisation est terminée (optionnel)
+            callback: Fonction à appeler quand la synchronisation est terminée (optionnel) ;
+                      avec un callback, l'appel ne bloque pas
+            timeout: Attente maximale en secondes (None = illimitée) ; à l'expiration,
+                     la barrière reste en cours
+            
+        Returns:
+            True si la barrière est franchie (ou démarrée, avec un callback),
+            False si elle ne peut pas démarrer, sur timeout ou arrêt du nœud
         """
-        if self.is_synchronizing:
-            print(f"Nœud {self.id} est déjà en cours de synchronisation")
+        if callback is None and self.dispatcher.is_dispatcher_thread():
+            raise RuntimeError("synchronize() bloquant depuis le dispatcher : utiliser callback ou synchronize_async()")
+        future = self.synchronize_async(callback)
+        if callback and not future.done():
+            return True
+        try:
+            return future.result(timeout)
+        except TimeoutError:
+            sync_log.warning("Nœud %s - timeout de synchronisation (barrière %s)", self.id, self.barrier.generation)
             return False
+
+    def synchronize_async(self, callback=None):
+        """
+        Démarre la synchronisation sans bloquer.
+
+        Returns:
+            Future dont le résultat est True quand la barrière est franchie,
+            False si elle ne peut pas démarrer ou si le nœud s'arrête
+        """
+        future = Future()
+        if self.is_synchronizing:
+            sync_log.warning("Nœud %s est déjà en cours de synchronisation", self.id)
+            future.set_result(False)
+            return future
+        if self.id is None or not self.world:
+            sync_log.warning("Nœud %s non enregistré, synchronisation impossible", self.temp_id)
+            future.set_result(False)
+            return future
             
-        print(f"Nœud {self.id} démarre la synchronisation")
+        sync_log.info("Nœud %s démarre la synchronisation (barrière %s)", self.id, self.barrier.generation)
         self.is_synchronizing = True
         self.synchronize_callback = callback
-        self.synchronize_confirmations.clear()
+        self.synchronize_future = future
+        self.synchronize_started = time()
         
-        # Envoyer le message de synchronisation en broadcast
-        sync_msg = SynchronizeMessage(self.id, self.get_lamport_timestamp())
-        self.broadcast_message(sync_msg)
+        # La barrière s'exécute dans le thread du dispatcher, comme le traitement de ses messages
+        self.dispatcher.schedule(self.barrier.arrive)
         
-        return True
+        return future
     
     def broadcastSync(self, payload, from_id, callback=None):
         """
@@ -627,6 +718,13 @@ class Communication:
           processus et attend que tous les autres aient reçu le message
         - Si le processus n'a pas l'identifiant 'from_id', il attend de recevoir le message de 'from_id'
         
+        Chaque broadcast porte un numéro propre à l'émetteur : un émetteur peut avoir plusieurs
+        broadcasts en cours (avec callback, l'appel ne bloque pas), dont les ACKs sont associés
+        par numéro. Un récepteur reçoit les broadcasts de 'from_id' dans l'ordre d'émission,
+        un par appel, y compris ceux arrivés avant l'appel.
+        Avec broadcast_fan_out=k, le message descend un arbre k-aire couvrant le monde de
+        l'émetteur et les ACKs sont agrégés en remontant : l'émetteur traite O(k) messages.
+        
         Args:
             payload: Le contenu du message à broadcaster
             from_id: L'identifiant de l'émetteur
@@ -639,222 +737,323 @@ class Communication:
         
         if self.id == from_id:
             # Je suis l'émetteur
-            print(f"Nœud {self.id} démarre broadcastSync en tant qu'émetteur")
-            
+            event = threading.Event()
+            members = frozenset(self.world)
+            if self.broadcast_fan_out:
+                # Diffusion en arbre : seuls les fils de la racine acquittent (chacun pour son sous-arbre)
+                children = self._spanning_tree(members, self.broadcast_fan_out).children(self.id, self.id)
+                expected_acks = set(children)
+            else:
+                expected_acks = members - {self.id}  # Tous les nœuds sauf moi
             with self.broadcast_sync_lock:
-                # Vérifier qu'on n'a pas déjà un broadcast en cours pour ce from_id
-                if from_id in self.broadcast_sync_waiting:
-                    print(f"Nœud {self.id} a déjà un broadcastSync en cours pour l'émetteur {from_id}")
-                    return False
-                
-                # Initialiser l'état d'attente
-                expected_acks = self.world - {self.id}  # Tous les nœuds sauf moi
-                self.broadcast_sync_waiting[from_id] = {
+                self.broadcast_sync_sequence += 1
+                sequence = self.broadcast_sync_sequence
+                sync_info = {
                     'payload': payload,
                     'callback': callback,
                     'acks': set(),
                     'expected_acks': expected_acks,
-                    'event': threading.Event()
+                    'event': event
                 }
+                if sync_info['expected_acks']:
+                    self.broadcast_sync_waiting[sequence] = sync_info
             
-            # Envoyer le message en broadcast
-            broadcast_msg = BroadcastSyncMessage(
-                self.id,
-                self.get_lamport_timestamp(),
-                payload,
-                from_id
-            )
-            self.broadcast_message(broadcast_msg)
-            
-            # Si on a un callback, on ne bloque pas
-            if callback:
-                return True
-            
-            # Sinon, attendre que tous les nœuds aient acquitté
-            event = self.broadcast_sync_waiting[from_id]['event']
-            event.wait()  # Bloquant jusqu'à ce que tous les ACKs soient reçus
+            sync_log.debug("Nœud %s démarre broadcastSync %s en tant qu'émetteur", self.id, sequence)
             
-            return True
+            if self.broadcast_fan_out:
+                broadcast_msg = BroadcastSyncMessage(self.id, self.get_clock(), payload, from_id,
+                                                     sequence, self.broadcast_fan_out, members)
+                for child in children:
+                    self.send_message_to(child, broadcast_msg)
+            else:
+                # Envoyer le message en broadcast
+                broadcast_msg = BroadcastSyncMessage(
+                    self.id,
+                    self.get_clock(),
+                    payload,
+                    from_id,
+                    sequence
+                )
+                self.broadcast_message(broadcast_msg)
+            if not sync_info['expected_acks']:
+                self._complete_broadcast_sync(sync_info)  # Seul nœud du monde
             
         else:
-            # Je suis un récepteur - attendre le message de from_id
-            print(f"Nœud {self.id} attend broadcastSync de l'émetteur {from_id}")
+            # Je suis un récepteur - attendre le prochain message de from_id
+            sync_log.debug("Nœud %s attend broadcastSync de l'émetteur %s", self.id, from_id)
             
+            waiter = {'payload': None, 'callback': callback, 'event': threading.Event()}
             with self.broadcast_sync_lock:
-                # Si on a déjà une attente pour ce from_id, rejoindre l'attente existante
-                if from_id not in self.broadcast_sync_waiting:
-                    self.broadcast_sync_waiting[from_id] = {
-                        'payload': None,
-                        'callback': callback,
-                        'acks': set(),
-                        'expected_acks': set(),
-                        'event': threading.Event(),
-                        'received': False
-                    }
-            
-            # Si on a un callback, on ne bloque pas
-            if callback:
-                return True
-            
-            # Sinon, attendre de recevoir le message
-            event = self.broadcast_sync_waiting[from_id]['event']
-            event.wait()  # Bloquant jusqu'à réception du message
-            
+                inbox = self.broadcast_sync_inbox.setdefault(from_id, BroadcastSyncInbox())
+                delivered = inbox.wait(waiter)
+            if delivered:
+                # Message déjà arrivé : servi immédiatement
+                if callback:
+                    callback(waiter['payload'])
+                waiter['event'].set()
+            event = waiter['event']
+        
+        # Si on a un callback, on ne bloque pas
+        if callback:
             return True
+        
+        # Sinon, attendre les ACKs (émetteur) ou le message (récepteur), ou l'arrêt du nœud
+        event.wait()
+        return self.alive
     
-    def sendToSync(self, payload, dest_id, callback=None):
+    def sendToSync(self, payload, dest_id, callback=None, tag=0):
         """
         Envoie un message de manière synchrone à un destinataire spécifique.
-        Bloque jusqu'à ce que le destinataire ait reçu le message.
+        Bloque jusqu'à ce que le destinataire ait reçu le message ; s'il n'a pas encore appelé
+        receiveFromSync, le message l'attend dans sa file des messages inattendus.
         
         Args:
             payload: Le contenu du message à envoyer
             dest_id: L'identifiant du destinataire
             callback: Fonction à appeler quand l'ACK est reçu (optionnel)
+            tag: Étiquette (>= 0) permettant au destinataire de séparer plusieurs conversations
             
         Returns:
             True si l'envoi a réussi, False en cas d'erreur ou d'arrêt
         """
-        import threading
+        future = self.isend(payload, dest_id, tag, callback)
+        # Si on a un callback, on ne bloque pas
+        if callback:
+            return future.result() if future.done() else True
+        try:
+            return future.result(timeout=30)  # Timeout de 30 secondes
+        except TimeoutError:
+            sync_log.warning("Nœud %s - timeout sendToSync vers %s", self.id, dest_id)
+            with self.send_to_sync_lock:
+                self.send_to_sync_waiting.pop(future.sync_id, None)
+            self._resolve_request(future, False)
+            return False
+    
+    def isend(self, payload, dest_id, tag=0, callback=None):
+        """
+        Envoi non bloquant : comme sendToSync, mais retourne aussitôt un Future.
         
+        Returns:
+            Future dont le résultat est True quand le destinataire a reçu le message,
+            False en cas d'erreur ou d'arrêt du nœud (un envoi parti ne s'annule pas)
+        """
+        future = Future()
+        future.set_running_or_notify_cancel()
         if not self.alive:
-            print(f"Nœud {self.id} arrêté - sendToSync annulé")
-            return False
+            sync_log.info("Nœud %s arrêté - sendToSync annulé", self.id)
+            future.set_result(False)
+            return future
             
         if dest_id not in self.world:
-            print(f"Nœud {self.id} - destinataire {dest_id} inconnu")
-            return False
+            sync_log.warning("Nœud %s - destinataire %s inconnu", self.id, dest_id)
+            future.set_result(False)
+            return future
+        if tag < 0:
+            raise ValueError(f"Étiquette négative réservée aux jokers: {tag}")
         
         # Générer un ID unique pour cette communication
         with self.send_to_sync_lock:
             self.sync_id_counter += 1
             sync_id = f"{self.id}-{dest_id}-{self.sync_id_counter}"
-        
-        print(f"Nœud {self.id} démarre sendToSync vers {dest_id} (sync_id: {sync_id})")
-        
-        # Préparer l'attente de l'ACK
-        event = threading.Event()
-        with self.send_to_sync_lock:
+            future.sync_id = sync_id
             self.send_to_sync_waiting[sync_id] = {
-                'event': event,
+                'future': future,
                 'callback': callback,
                 'dest_id': dest_id
             }
+        self._track_request(future, False)
+        
+        sync_log.debug("Nœud %s démarre sendToSync vers %s (sync_id: %s)", self.id, dest_id, sync_id)
         
         # Envoyer le message
         sync_msg = SendToSyncMessage(
             self.id,
-            self.get_lamport_timestamp(),
+            self.get_clock(),
             payload,
             sync_id,
-            target=dest_id
+            target=dest_id,
+            tag=tag
         )
         self.send_message_to(dest_id, sync_msg)
-        
-        # Si on a un callback, on ne bloque pas
-        if callback:
-            return True
-        
-        # Sinon, attendre l'ACK ou l'arrêt du système
-        if not self.alive:
-            return False
-            
-        success = event.wait(timeout=30)  # Timeout de 30 secondes
-        
-        # Nettoyer
-        with self.send_to_sync_lock:
-            if sync_id in self.send_to_sync_waiting:
-                del self.send_to_sync_waiting[sync_id]
-        
-        if not success:
-            print(f"Nœud {self.id} - timeout sendToSync vers {dest_id}")
-            return False
-        
-        return True
+        return future
     
-    def receiveFromSync(self, from_id, callback=None):
+    def receiveFromSync(self, from_id=ANY_SOURCE, callback=None, tag=ANY_TAG, status=None):
         """
         Attend de recevoir un message synchrone d'un expéditeur spécifique.
         Bloque jusqu'à ce que le message arrive.
         
+        Appariement à la MPI (voir Network/MatchQueue.py) : un message arrivé avant l'appel
+        est gardé dans la file des messages inattendus, et plusieurs réceptions peuvent attendre
+        le même expéditeur ; elles sont servies dans l'ordre où elles ont été postées.
+        
         Args:
-            from_id: L'identifiant de l'expéditeur attendu
+            from_id: L'identifiant de l'expéditeur attendu, ou ANY_SOURCE
             callback: Fonction à appeler avec le payload reçu (optionnel)
+            tag: Étiquette attendue, ou ANY_TAG (défaut : toutes)
+            status: Dict (optionnel) complété avec 'source' et 'tag' du message reçu
             
         Returns:
             Le payload reçu, ou None en cas d'erreur ou d'arrêt
         """
-        import threading
-        
-        if not self.alive:
-            print(f"Nœud {self.id} arrêté - receiveFromSync annulé")
-            return None
-            
-        if from_id not in self.world:
-            print(f"Nœud {self.id} - expéditeur {from_id} inconnu")
-            return None
-        
-        print(f"Nœud {self.id} attend receiveFromSync de {from_id}")
-        
-        # Préparer l'attente du message
-        event = threading.Event()
-        with self.send_to_sync_lock:
-            self.receive_from_sync_waiting[from_id] = {
-                'event': event,
-                'payload': None,
-                'callback': callback,
-                'sync_id': None
-            }
-        
+        future = self.irecv(from_id, tag, status, callback)
         # Si on a un callback, on ne bloque pas
         if callback:
-            return True
+            return True if not future.done() or future.result() is not None else None
+        try:
+            return future.result(timeout=30)  # Timeout de 30 secondes
+        except TimeoutError:
+            if future.cancel():  # Retirée : un message arrivé ensuite ira à une autre réception
+                sync_log.warning("Nœud %s - timeout receiveFromSync de %s", self.id, from_id)
+                return None
+            return future.result()  # Appariée entre-temps : remise en cours
+    
+    def irecv(self, from_id=ANY_SOURCE, tag=ANY_TAG, status=None, callback=None):
+        """
+        Réception non bloquante : comme receiveFromSync, mais retourne aussitôt un Future.
         
-        # Sinon, attendre le message ou l'arrêt du système
+        Returns:
+            Future dont le résultat est le payload reçu, None en cas d'erreur ou d'arrêt ;
+            future.cancel() retire la réception tant qu'aucun message ne lui a été apparié
+        """
+        future = Future()
         if not self.alive:
-            return None
+            sync_log.info("Nœud %s arrêté - receiveFromSync annulé", self.id)
+            future.set_result(None)
+            return future
             
-        success = event.wait(timeout=30)  # Timeout de 30 secondes
-        
-        # Récupérer le payload
-        payload = None
+        if from_id != ANY_SOURCE and from_id not in self.world:
+            sync_log.warning("Nœud %s - expéditeur %s inconnu", self.id, from_id)
+            future.set_result(None)
+            return future
+        
+        sync_log.debug("Nœud %s attend receiveFromSync de %s (étiquette %s)", self.id, from_id, tag)
+        
+        # Poster la réception : elle prend le plus ancien message inattendu correspondant, ou attend
+        receive = {
+            'source': from_id,
+            'tag': tag,
+            'future': future,
+            'callback': callback,
+            'status': status
+        }
         with self.send_to_sync_lock:
-            if from_id in self.receive_from_sync_waiting:
-                payload = self.receive_from_sync_waiting[from_id]['payload']
-                del self.receive_from_sync_waiting[from_id]
-        
-        if not success:
-            print(f"Nœud {self.id} - timeout receiveFromSync de {from_id}")
-            return None
+            envelope = self.receive_from_sync_matches.post(receive)
+        if envelope:
+            future.set_running_or_notify_cancel()
+            self._complete_receive(receive, envelope.source, envelope.tag, envelope.payload)
+            return future
+        self._track_request(future, None)
+        future.add_done_callback(lambda future: self._cancel_receive(receive) if future.cancelled() else None)
+        return future
+    
+    def _cancel_receive(self, receive):
+        with self.send_to_sync_lock:
+            receive['cancelled'] = True  # Écartée par la file à son prochain passage en tête
+    
+    def ibroadcast(self, payload, from_id):
+        """
+        broadcastSync non bloquant : retourne aussitôt un Future.
         
-        return payload
+        Returns:
+            Future dont le résultat est, chez l'émetteur, True quand tous les nœuds ont reçu le message ;
+            chez un récepteur, le payload reçu de 'from_id'. False (émetteur) ou None (récepteur) si le nœud s'arrête
+        """
+        future = Future()
+        future.set_running_or_notify_cancel()
+        sender = self.id == from_id
+        if not self.alive:
+            future.set_result(False if sender else None)
+            return future
+        self._track_request(future, False if sender else None)
+        if sender:
+            self.broadcastSync(payload, from_id, callback=lambda _: self._resolve_request(future, True))
+        else:
+            self.broadcastSync(payload, from_id, callback=lambda received: self._resolve_request(future, received))
+        return future
+    
+    def wait_all(self, requests, timeout=None):
+        """Attend la fin de toutes les requêtes (isend, irecv, ibroadcast) et retourne leurs résultats, dans l'ordre"""
+        return wait_all(requests, timeout)
     
-    def addLetterMessage(self, message):
+    def wait_any(self, requests, timeout=None):
+        """Attend la fin d'une requête et retourne (indice, résultat) ; (None, None) sur timeout"""
+        return wait_any(requests, timeout)
+    
+    def test(self, request):
+        """Sans bloquer : (True, résultat) si la requête est terminée, (False, None) sinon"""
+        return test(request)
+    
+    def _track_request(self, future, on_stop):
+        """Une requête en cours est résolue avec 'on_stop' si le nœud s'arrête avant elle"""
+        with self.requests_lock:
+            self.pending_requests[future] = on_stop
+        future.add_done_callback(self._untrack_request)
+    
+    def _untrack_request(self, future):
+        with self.requests_lock:
+            self.pending_requests.pop(future, None)
+    
+    @staticmethod
+    def _resolve_request(future, result):
+        try:
+            future.set_result(result)
+        except InvalidStateError:
+            pass  # Déjà résolue, ou annulée
+    
+    def addLetterMessage(self, message, ordered=False):
         """
         Ajoute un message à la boîte aux lettres.
         Si le nœud est en cours de synchronisation, seuls les messages système sont acceptés.
+        
+        Args:
+            ordered: Message remis par une diffusion ordonnée, jamais écarté : sa place dans
+                l'ordre est déjà consommée, le perdre fausserait l'ordre vu par ce nœud
         """
         # Si on est en cours de synchronisation, ne traiter que les messages système
-        if self.is_synchronizing and not message.is_system():
-            print(f"Nœud {self.id} en synchronisation - message non-système ignoré: {type(message).__name__}")
+        if self.is_synchronizing and not message.is_system() and not ordered:
+            sync_log.warning("Nœud %s en synchronisation - message non-système ignoré: %s", self.id, type(message).__name__)
             return
             
-        with self.mailbox_lock:
-            self.mailbox.append(message)
+        self.mailbox.put(message)
 
-    def hasLetterMessage(self):
-        """Vérifie s'il y a des messages dans la boîte aux lettres"""
-        with self.mailbox_lock:
+    def hasLetterMessage(self, source=None, type=None, predicate=None):
+        """Vérifie s'il y a des messages (correspondant aux filtres) dans la boîte aux lettres"""
+        if source is None and type is None and predicate is None:
             return len(self.mailbox) > 0
+        return self.mailbox.has(source, type, predicate)
         
-    def retrieveLetterMessage(self):
-        """Récupère et supprime le premier message de la boîte aux lettres"""
-        
-        with self.mailbox_lock:
-            if self.mailbox:
-                return self.mailbox.pop(0)
-            else:
-                return None
+    def retrieveLetterMessage(self, source=None, type=None, predicate=None):
+        """
+        Récupère et supprime le premier message de la boîte aux lettres.
+        Les filtres permettent une réception sélective : les autres messages restent en place.
+
+        Args:
+            source: ID de l'émetteur attendu (indexé)
+            type: Classe exacte du message attendu (indexée)
+            predicate: Fonction message -> bool, évaluée sur les candidats restants
+
+        Returns:
+            Le plus ancien message correspondant, ou None
+        """
+        return self.mailbox.get(source, type, predicate)
+
+    def waitLetterMessage(self, timeout=None, source=None, type=None, predicate=None):
+        """
+        Attend l'arrivée d'un message (correspondant aux filtres) et le retire de la boîte aux lettres.
+        Retourne immédiatement si un message est déjà présent.
+
+        Args:
+            timeout: Durée maximale d'attente en secondes (None = illimitée)
+            source, type, predicate: Filtres, comme pour retrieveLetterMessage
+
+        Returns:
+            Le message, ou None si le délai expire ou si la communication est arrêtée
+        """
+        return self.mailbox.wait(timeout, source, type, predicate)
+
+    def drainLetterMessages(self, max_n=None, source=None, type=None, predicate=None):
+        """Récupère d'un coup jusqu'à 'max_n' messages (correspondant aux filtres) de la boîte aux lettres (tous si None)"""
+        return self.mailbox.drain(max_n, source, type, predicate)
             
     def get_rank(self):
         """Retourne l'ID du nœud"""
@@ -870,6 +1069,17 @@ class Communication:
         if self.registration_timer:
             self.registration_timer.cancel()
         
+        # Envoyer les lots en attente, puis ne plus recevoir de messages et arrêter le dispatcher
+        if self.batcher:
+            self.batcher.stop()
+        self.router.unregister_endpoint(self)
+        self.dispatcher.stop()
+        self.mutex.stop()  # Débloque un requestToken en attente
+        self.locks.stop()  # Débloque les acquire en attente
+        self.total_order.stop()
+        self.collectives.stop()  # Débloque les collectives en attente
+        self.mailbox.close()  # Réveille les lecteurs bloqués dans waitLetterMessage
+        
         # Débloquer toutes les attentes synchrones
         self._cleanup_sync_operations()
         
@@ -877,93 +1087,140 @@ class Communication:
         if self.state_machine:
             self.state_machine.cleanup()
         
-        print(f"Nœud {self.id or self.temp_id} arrêté proprement")
+        log.info("Nœud %s arrêté proprement", self.id or self.temp_id)
     
     def _cleanup_sync_operations(self):
         """Nettoie et débloque toutes les opérations synchrones en cours"""
-        # Débloquer sendToSync
+        # Débloquer sendToSync / receiveFromSync, et toutes les requêtes isend / irecv / ibroadcast
         with self.send_to_sync_lock:
-            for sync_id, wait_info in self.send_to_sync_waiting.items():
-                wait_info['event'].set()
             self.send_to_sync_waiting.clear()
-            
-            # Débloquer receiveFromSync
-            for from_id, wait_info in self.receive_from_sync_waiting.items():
-                wait_info['event'].set()
-            self.receive_from_sync_waiting.clear()
+            for receive in self.receive_from_sync_matches.pending():
+                receive['cancelled'] = True
+        with self.requests_lock:
+            pending, self.pending_requests = self.pending_requests, {}
+        for future, result in pending.items():
+            self._resolve_request(future, result)
+        
+        # Débloquer synchronize
+        future, self.synchronize_future = self.synchronize_future, None
+        self.is_synchronizing = False
+        if future and not future.done():
+            future.set_result(False)
         
         # Débloquer broadcastSync
         with self.broadcast_sync_lock:
-            for from_id, sync_info in self.broadcast_sync_waiting.items():
+            for sync_info in self.broadcast_sync_waiting.values():
                 sync_info['event'].set()
             self.broadcast_sync_waiting.clear()
-
-    def sendToken(self):
-        """Envoie le token au prochain voisin dans le monde"""
-        if not self.world or self.id is None:
-            print("Nœud n'a pas de voisins ou d'ID assigné")
-            return
-        
-        # Trier les IDs pour déterminer l'ordre circulaire
-        sorted_world = sorted(self.world)
-        my_index = sorted_world.index(self.id)
-        
-        # Trouver le prochain voisin dans l'ordre circulaire
-        next_index = (my_index + 1) % len(sorted_world)
-        next_neighbor = sorted_world[next_index]
-        
-        # Créer et envoyer le message de token
-        with self.token_lock:
-            token_id = self.token
-            self.token = None  # Libérer le token localement
-
-        if self.alive:
-            print("------------------------------------------------")
-            print("-----------------ENVOIE DU TOKEN---------------")
-            print("------------------------------------------------")
-            self.have_token = False
-            token_msg = TokenMessage(self.id, self.get_lamport_timestamp(), token_id=token_id)
-            self.send_message_to(next_neighbor, token_msg)
-            print(f"Nœud {self.id} envoie le token au voisin {next_neighbor}")
+            for inbox in self.broadcast_sync_inbox.values():
+                for waiter in inbox.waiters:
+                    waiter['event'].set()
+            self.broadcast_sync_inbox.clear()
+            self.broadcast_sync_relays.clear()
 
     def requestToken(self):
-        self.request = True
-        self.release = False
-        print("------------------------------------------------")
-        print("-----------------DEMANDE DU TOKEN---------------")
-        print("------------------------------------------------")
-        while not self.have_token and self.alive:
-            sleep(1)  # Attente active, peut être optimisée avec des événements
-        print(f"Nœud {self.id} a reçu le token {self.have_token}")
-        return
+        """Bloque jusqu'à l'obtention de la section critique"""
+        return self.mutex.request()
 
     def releaseToken(self):
-        print("------------------------------------------------")
-        print("-----------------RELEASE DU TOKEN---------------")
-        print("------------------------------------------------")
-        self.request = False
-        self.release = True
-        return
-
-    @subscribe(threadMode=Mode.PARALLEL, onEvent=TokenMessage)
-    def handle_token_message(self, message):
-        """Gestionnaire pour les messages TokenMessage"""
-        if (message.target != self.id):
-            return  # Message pas pour nous
-        if self.request:
-            with self.token_lock:
-                self.token = message.token_id
-                self.have_token = True
-        
-        while not self.release and self.alive:
-            sleep(1)
-        if self.alive:
-            self.sendToken()
+        """Libère la section critique"""
+        self.mutex.release()
+
+    def acquire(self, name, mode="w", lease=None, timeout=None):
+        """
+        Bloque jusqu'à l'obtention du verrou nommé 'name' (voir Mutex/LockService.py).
+
+        Args:
+            name: Nom du verrou
+            mode: "r" (lecture, partagé) ou "w" (écriture, exclusif)
+            lease: Durée du bail en secondes (None = sans bail, par défaut). Au-delà, le verrou
+                   est libéré d'office même si son détenteur est vivant : renew(name) le prolonge
+            timeout: Attente maximale en secondes (None = illimitée)
+
+        Returns:
+            True si le verrou est obtenu, False sur timeout ou arrêt
+        """
+        return self.locks.acquire(name, mode, lease, timeout)
+
+    def release(self, name):
+        """Libère le verrou nommé 'name'"""
+        self.locks.release(name)
+
+    def renew(self, name, lease=None):
+        """Prolonge le bail du verrou nommé 'name' (de sa durée initiale si lease=None)"""
+        return self.locks.renew(name, lease)
+
+    def broadcastTotalOrder(self, payload):
+        """
+        Diffuse 'payload' à tous les nœuds, y compris celui-ci, dans un ordre global identique partout
+        (voir Broadcast/TotalOrderBroadcast.py). Ne bloque pas : chaque nœud reçoit un TotalOrderMessage
+        dans sa boîte aux lettres, dont 'sequence' est le rang dans l'ordre global.
+
+        Returns:
+            Le numéro de la diffusion chez cet émetteur
+        """
+        return self.total_order.broadcast(payload)
+
+    def broadcastCausal(self, payload):
+        """
+        Diffuse 'payload' à tous les nœuds en respectant la causalité (voir Broadcast/CausalBroadcast.py) :
+        un CausalMessage n'est déposé dans une boîte aux lettres qu'après ceux qui le précèdent causalement
+        (diffusés ou remis chez l'émetteur avant lui). Ne bloque pas ; remis ici immédiatement.
+        """
+        self.causal.broadcast(payload)
+
+    def scatter(self, values, root=None, timeout=None):
+        """
+        Opération collective : 'root' (par défaut le plus petit ID du monde) distribue values[i]
+        au i-ème nœud du monde trié. Tous les nœuds du monde doivent l'appeler (voir Collective/Collectives.py).
+
+        Returns:
+            La valeur reçue par ce nœud
+        """
+        return self.collectives.scatter(values, root, timeout)
+
+    def gather(self, value, root=None, timeout=None):
+        """Opération collective : 'root' reçoit la liste des valeurs de tous les nœuds (ordre du monde trié), les autres None"""
+        return self.collectives.gather(value, root, timeout)
+
+    def reduce(self, value, op=SUM, root=None, timeout=None):
+        """Opération collective : 'root' reçoit la réduction des valeurs de tous les nœuds par 'op', les autres None"""
+        return self.collectives.reduce(value, op, root, timeout)
+
+    def allgather(self, value, timeout=None):
+        """Opération collective : chaque nœud reçoit la liste des valeurs de tous les nœuds (ordre du monde trié)"""
+        return self.collectives.allgather(value, timeout)
+
+    def allreduce(self, value, op=SUM, timeout=None):
+        """
+        Opération collective : chaque nœud reçoit la réduction des valeurs de tous les nœuds par 'op'
+        (SUM, PROD, MIN, MAX de Collective, vectorisées sur les tableaux NumPy, ou toute fonction
+        associative et commutative).
+
+        Raises:
+            TimeoutError: si un message attendu n'arrive pas avant 'timeout' secondes
+            RuntimeError: si le nœud s'arrête pendant l'opération
+        """
+        return self.collectives.allreduce(value, op, timeout)
+
+    def ring_allreduce(self, array, op=SUM, chunk_bytes=RING_CHUNK_BYTES, timeout=None):
+        """
+        allreduce en anneau pour les grands tableaux NumPy (ordre du monde trié, comme le jeton) :
+        chaque nœud n'envoie et ne reçoit que 2(N-1)/N du tableau, en morceaux de 'chunk_bytes'
+        dont l'envoi recouvre la réduction des précédents.
+        """
+        return self.collectives.ring_allreduce(array, op, chunk_bytes, timeout)
+
+    def init_sequencer(self):
+        """Appelé par le leader élu : reprend la numérotation de la diffusion totalement ordonnée"""
+        if self.state == NodeState.LEADER:
+            self.total_order.on_leader_elected()
 
     def init_token_ring(self):
+        """
+        Appelé par le premier leader du cluster : initialise le moteur d'exclusion mutuelle (création du jeton).
+        Un leader réélu ne l'appelle pas : le jeton existe déjà (détenu ou en route), en créer un
+        second laisserait deux nœuds en section critique.
+        """
         if self.state == NodeState.LEADER and self.world:
-            # Le leader initialise le token
-            self.token = random.randint(1000, 9999)  # ID de token aléatoire
-            self.have_token = True
-            print(f"Leader {self.id} initialise le token: {self.token}")
-            self.sendToken()
+            self.mutex.on_leader_elected()
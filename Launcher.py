@@ -1,25 +1,93 @@
 from time import sleep
 from Process import Process
+from Network import MultiprocessRouter, SocketRouter
+from Log import flush, get_logger
+import multiprocessing
+import shutil
+import tempfile
+
+log = get_logger("launcher")
+
+TCP_BASE_PORT = 47000  # Port du slot 0 pour le transport "tcp" (slot i -> port TCP_BASE_PORT + i)
+
+def run_node(name, router, slot, stop_event, process_class=Process, options=None):
+    """Point d'entrée d'un nœud dans son propre processus OS"""
+    router.bind(slot)
+    p = process_class(name, router, **(options or {}))
+    stop_event.wait()
+    p.stop()
+    p.waitStopped()
+    router.close()
+    flush()
+
+def launch(nbProcess, runningTime=5, transport="thread", process_class=Process, **options):
+    """
+    Lance un cluster de nbProcess nœuds.
+
+    Args:
+        transport: "thread" (tous les nœuds dans cet interpréteur), ou un processus OS
+                   par nœud pour utiliser tous les cœurs, reliés par des files
+                   "multiprocess", des sockets "unix" ou TCP "tcp" (loopback)
+        process_class: Classe du processus à lancer (sous-classe de Process)
+        options: Options des communicateurs (voir Communication.__init__), ex. batch_window=0.002
+    """
+    match transport:
+        case "multiprocess":
+            launch_multiprocess(nbProcess, runningTime, process_class, MultiprocessRouter(nbProcess), options)
+            return
+        case "unix":
+            directory = tempfile.mkdtemp(prefix="algo-distribue-")
+            launch_multiprocess(nbProcess, runningTime, process_class, SocketRouter(directory=directory), options)
+            shutil.rmtree(directory, ignore_errors=True)
+            return
+        case "tcp":
+            router = SocketRouter(base_port=TCP_BASE_PORT, nb_slots=nbProcess)
+            launch_multiprocess(nbProcess, runningTime, process_class, router, options)
+            return
 
-def launch(nbProcess, runningTime=5):
     processes = []
 
     # Attribution directe d'IDs uniques au démarrage
     for i in range(nbProcess):
-        p = Process("P"+str(i))
+        p = process_class("P"+str(i), **options)
         processes.append(p)
 
     # Attendre que les processus s'initialisent et élisent un leader
     sleep(runningTime)
 
-    print("=== Arrêt des processus ===")
+    log.info("=== Arrêt des processus ===")
 
     for p in processes:
         p.stop()
 
     for p in processes:
         p.waitStopped()
+    flush()
+
+def launch_multiprocess(nbProcess, runningTime, process_class, router, options=None):
+    """Lance chaque nœud dans son propre processus OS, reliés par 'router' (MultiprocessRouter ou SocketRouter)"""
+    stop_event = multiprocessing.Event()
+    nodes = []
+
+    for i in range(nbProcess):
+        node = multiprocessing.Process(
+            target=run_node,
+            args=("P"+str(i), router, i, stop_event, process_class, options),
+            name="Node-P"+str(i)
+        )
+        node.start()
+        nodes.append(node)
+
+    # Attendre que les processus s'initialisent et élisent un leader
+    sleep(runningTime)
+
+    log.info("=== Arrêt des processus ===")
+    stop_event.set()
+
+    for node in nodes:
+        node.join()
+    router.shutdown()
 
 if __name__ == '__main__':
     # Augmenter le temps pour permettre plus de chances d'élection
-    launch(nbProcess=3, runningTime=20)  # Temps augmenté pour laisser plus de chances à l'élection
\ No newline at end of file
+    launch(nbProcess=3, runningTime=20)  # Temps augmenté pour laisser plus de chances à l'élection
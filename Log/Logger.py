@@ -0,0 +1,208 @@
+from collections import deque
+from copy import copy
+from threading import Event, Lock, Thread
+from time import time
+import atexit
+import os
+import sys
+
+# Niveaux de log
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+OFF = 100
+
+LEVEL_NAMES = {DEBUG: "DEBUG", INFO: "INFO", WARNING: "WARNING", ERROR: "ERROR", OFF: "OFF"}
+
+ENV_VARIABLE = "ALGO_LOG"  # ex. ALGO_LOG="warning,raft=debug,token=off"
+
+def parse_level(level):
+    """Accepte un niveau numérique ou son nom ("debug", "INFO"...)"""
+    if isinstance(level, int):
+        return level
+    for value, name in LEVEL_NAMES.items():
+        if name == level.upper():
+            return value
+    raise ValueError(f"Niveau de log inconnu: {level}")
+
+class LogWriter:
+    """
+    Écriture asynchrone des logs.
+    Les enregistrements sont déposés dans un tampon circulaire (deque bornée) et
+    formatés puis écrits par un thread dédié : l'appelant ne fait ni formatage ni I/O.
+    Si le tampon est plein, les plus anciens enregistrements sont perdus (et comptés).
+    """
+
+    def __init__(self, stream=None, capacity=10000, format="{level} [{component}] {message}"):
+        self.stream = stream
+        self.format = format
+        self.buffer = deque(maxlen=capacity)  # Enregistrements (heure, niveau, composant, message, args)
+        self.dropped = 0                      # Enregistrements perdus faute de place (approximatif)
+        self.wakeup = Event()
+        self.pending = False                  # Un réveil du thread d'écriture est déjà demandé
+        self.idle = Event()                   # Positionné quand tout ce qui a été déposé est écrit
+        self.idle.set()
+        self.lock = Lock()
+        self.pid = None                       # Processus propriétaire du thread d'écriture
+        self.thread = None
+
+    def emit(self, level, component, message, args):
+        if len(self.buffer) == self.buffer.maxlen:
+            self.dropped += 1
+        self.buffer.append((time(), level, component, message, args))
+        if not self.pending:
+            # Le thread d'écriture n'est réveillé qu'une fois par lot d'enregistrements
+            self.pending = True
+            if self.pid != os.getpid():
+                self._start()
+            self.idle.clear()
+            self.wakeup.set()
+
+    def flush(self, timeout=1.0):
+        """Attend que les enregistrements en attente soient écrits"""
+        if self.thread is not None and self.pid == os.getpid():
+            self.wakeup.set()
+            self.idle.wait(timeout)
+
+    def _start(self):
+        """Démarre le thread d'écriture (une fois par processus, y compris après un fork)"""
+        with self.lock:
+            if self.pid == os.getpid():
+                return
+            self.pid = os.getpid()
+            self.thread = Thread(target=self.run, name="LogWriter", daemon=True)
+            self.thread.start()
+
+    def run(self):
+        while True:
+            self.wakeup.wait()
+            self.wakeup.clear()
+            self.pending = False
+            lines = []
+            while self.buffer:
+                lines.append(self.format_record(*self.buffer.popleft()))
+            if lines:
+                stream = self.stream or sys.stdout
+                try:
+                    stream.write("\n".join(lines) + "\n")
+                    stream.flush()
+                except (OSError, ValueError):
+                    pass  # Flux fermé (fin de processus)
+            if not self.buffer:
+                self.idle.set()
+
+    def format_record(self, timestamp, level, component, message, args):
+        """Formatage paresseux : fait dans le thread d'écriture, uniquement pour les logs émis"""
+        if args:
+            try:
+                message = message % args
+            except (TypeError, ValueError):
+                message = f"{message} {args}"
+        return self.format.format(time=timestamp, level=LEVEL_NAMES.get(level, level),
+                                  component=component, message=message)
+
+class Logger:
+    """
+    Logger d'un composant ("comm", "raft", "sync", "token"...).
+    Le message est un gabarit '%' formaté plus tard par le LogWriter ;
+    un appel filtré par le niveau ne coûte qu'une comparaison.
+
+        log = get_logger("raft")
+        log.debug("Nœud %s reçoit heartbeat de %s", node_id, leader_id)
+    """
+
+    def __init__(self, component, level, writer):
+        self.component = component
+        self.level = level
+        self.writer = writer
+
+    def is_enabled(self, level):
+        return level >= self.level
+
+    def log(self, level, message, *args):
+        if level >= self.level:
+            # Les conteneurs mutables sont copiés : le formatage a lieu plus tard, dans un autre thread
+            args = tuple(copy(arg) if isinstance(arg, (set, dict, list)) else arg for arg in args)
+            self.writer.emit(level, self.component, message, args)
+
+    def debug(self, message, *args):
+        if DEBUG >= self.level:
+            self.log(DEBUG, message, *args)
+
+    def info(self, message, *args):
+        if INFO >= self.level:
+            self.log(INFO, message, *args)
+
+    def warning(self, message, *args):
+        if WARNING >= self.level:
+            self.log(WARNING, message, *args)
+
+    def error(self, message, *args):
+        if ERROR >= self.level:
+            self.log(ERROR, message, *args)
+
+# Configuration globale (par processus)
+writer = LogWriter()
+default_level = INFO
+component_levels = {}  # Dict: {composant: niveau} (surcharge le niveau par défaut)
+loggers = {}           # Dict: {composant: Logger}
+
+def get_logger(component):
+    """Retourne le Logger (unique) d'un composant"""
+    logger = loggers.get(component)
+    if logger is None:
+        logger = loggers.setdefault(component, Logger(component, component_levels.get(component, default_level), writer))
+    return logger
+
+def set_level(level, component=None):
+    """Change le niveau par défaut, ou celui d'un seul composant (OFF pour le couper)"""
+    global default_level
+    level = parse_level(level)
+    if component is None:
+        default_level = level
+    else:
+        component_levels[component] = level
+    for name, logger in loggers.items():
+        logger.level = component_levels.get(name, default_level)
+
+def configure(level=None, components=None, stream=None, capacity=None, format=None):
+    """
+    Configure le logging du processus.
+
+    Args:
+        level: Niveau par défaut (DEBUG, INFO, WARNING, ERROR, OFF ou leur nom)
+        components: Dict {composant: niveau}, ex. {"raft": DEBUG, "token": OFF}
+        stream: Flux de sortie (sys.stdout par défaut)
+        capacity: Taille du tampon circulaire
+        format: Gabarit d'une ligne, champs {time}, {level}, {component}, {message}
+    """
+    if stream is not None:
+        writer.stream = stream
+    if capacity is not None:
+        writer.buffer = deque(writer.buffer, maxlen=capacity)
+    if format is not None:
+        writer.format = format
+    if level is not None:
+        set_level(level)
+    for component, component_level in (components or {}).items():
+        set_level(component_level, component)
+
+def configure_from_env():
+    """Lit la configuration dans la variable ALGO_LOG (héritée par les processus fils)"""
+    spec = os.environ.get(ENV_VARIABLE)
+    if not spec:
+        return
+    for part in spec.split(","):
+        if "=" in part:
+            component, level = part.split("=", 1)
+            set_level(level.strip(), component.strip())
+        elif part.strip():
+            set_level(part.strip())
+
+def flush(timeout=1.0):
+    """Attend l'écriture des logs en attente"""
+    writer.flush(timeout)
+
+configure_from_env()
+atexit.register(flush)
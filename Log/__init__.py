@@ -0,0 +1,27 @@
+from .Logger import (
+    DEBUG,
+    INFO,
+    WARNING,
+    ERROR,
+    OFF,
+    Logger,
+    LogWriter,
+    configure,
+    flush,
+    get_logger,
+    set_level,
+)
+
+__all__ = [
+    "DEBUG",
+    "INFO",
+    "WARNING",
+    "ERROR",
+    "OFF",
+    "Logger",
+    "LogWriter",
+    "configure",
+    "flush",
+    "get_logger",
+    "set_level",
+]
@@ -7,6 +7,7 @@ class AbstractMessage:
         self.timestamp = timestamp
         self.target = target  # None pour broadcast, ID spécifique pour send_to
         self.is_system_message = False  # Par défaut, les messages ne sont pas système
+        self.vector = None  # Horloge vectorielle {nœud: compteur}, si activée (éventuellement différentielle)
     
     def get_timestamp(self):
         return self.timestamp
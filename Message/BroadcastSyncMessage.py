@@ -4,16 +4,20 @@ from .AbstractMessage import AbstractMessage
 @dataclass
 class BroadcastSyncMessage(AbstractMessage):
     """Message pour broadcast synchrone - contient le payload et l'émetteur"""
-    def __init__(self, source, timestamp, payload, original_sender, target=None):
+    def __init__(self, source, timestamp, payload, original_sender, sequence=0, fan_out=0, members=frozenset(), target=None):
         super().__init__(source, timestamp, target)
         self.payload = payload  # Le contenu du message à broadcaster
         self.original_sender = original_sender  # L'émetteur original (from)
+        self.sequence = sequence  # Numéro du broadcast chez l'émetteur (1, 2, ...)
+        self.fan_out = fan_out    # Diffusion en arbre : arité de l'arbre (0 = diffusion directe)
+        self.members = members    # Diffusion en arbre : monde de l'émetteur, sur lequel l'arbre est construit
         self.is_system_message = True  # Message système pour ne pas être bloqué
 
 @dataclass
 class BroadcastSyncAckMessage(AbstractMessage):
     """Message d'acquittement pour broadcast synchrone"""
-    def __init__(self, source, timestamp, original_sender, target=None):
+    def __init__(self, source, timestamp, original_sender, sequence=0, target=None):
         super().__init__(source, timestamp, target)
         self.original_sender = original_sender  # L'émetteur original du broadcast
+        self.sequence = sequence  # Numéro du broadcast acquitté (en arbre : pour tout le sous-arbre de 'source')
         self.is_system_message = True  # Message système
\ No newline at end of file
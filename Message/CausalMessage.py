@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+from .AbstractMessage import AbstractMessage
+
+@dataclass
+class CausalMessage(AbstractMessage):
+    """Diffusion causale : remis seulement après les diffusions dont il dépend"""
+    def __init__(self, source, timestamp, dependencies, payload, target=None):
+        super().__init__(source, timestamp, target)
+        self.dependencies = dependencies  # Dict: {nœud: diffusions causales de ce nœud remises chez 'source'}, entrée 'source' comprise
+        self.payload = payload
@@ -0,0 +1,272 @@
+from .AliveMessage import AliveMessage
+from .BroadcastMessage import BroadcastMessage
+from .BroadcastSyncMessage import BroadcastSyncMessage, BroadcastSyncAckMessage
+from .CausalMessage import CausalMessage
+from .CollectiveMessage import CollectiveMessage
+from .EnvelopeMessage import EnvelopeMessage
+from .HeartbeatConfirmationMessage import HeartbeatConfirmationMessage
+from .HeartbeatMessage import HeartbeatMessage
+from .IdDistributionMessage import IdAnnouncementMessage, IdConfirmationMessage, WorldInfoMessage
+from .LockMessage import LockRequestMessage, LockGrantMessage, LockReleaseMessage, LockRenewMessage
+from .RegistrationMessage import RegistrationRequest, RegistrationResponse
+from .SendToSyncMessage import SendToSyncMessage, SendToSyncAckMessage
+from .Serializer import PickleSerializer
+from .PermissionMessage import PermissionMessage
+from .SuzukiKasamiMessage import TokenRequestMessage, TokenGrantMessage
+from .SynchronizeMessage import SynchronizeMessage, SynchronizeConfirmedMessage, AllSynchronizedMessage, BarrierMessage
+from .TokenMessage import TokenMessage
+from .TotalOrderMessage import TotalOrderRequestMessage, TotalOrderBatchMessage, TotalOrderMessage
+from .VoteMessage import RequestVoteMessage, VoteResponseMessage
+from .WorldUpdateMessage import WorldUpdateMessage
+from array import array
+from itertools import chain
+import pickle
+import struct
+import sys
+
+# Types de champs d'un schéma
+INT = "q"          # Entier signé 64 bits (terme, ID, timestamp...)
+BOOL = "?"         # Booléen
+OPT_INT = "opt"    # Entier ou None
+INT_SET = "set"    # Ensemble d'entiers, encodé en tableau d'entiers packés
+INT_LIST = "list"  # Liste ordonnée d'entiers, encodée en tableau d'entiers packés
+INT_MAP = "map"    # Dict entier -> entier, encodé en tableau de paires packées
+STR = "str"        # Chaîne UTF-8
+PAYLOAD = "any"    # Objet quelconque, encodé par le sérialiseur du codec
+MESSAGES = "msgs"  # Liste de messages, chacun encodé par le codec lui-même
+
+FIXED_KINDS = (INT, BOOL)
+
+FLAG_TARGET = 0x01  # Le message est ciblé (target présent après les champs fixes)
+FLAG_SYSTEM = 0x02  # Message système (is_system_message)
+FLAG_VECTOR = 0x04  # Horloge vectorielle présente (paires packées après target)
+
+FALLBACK_TAG = 0    # Message sans schéma : encodé entièrement avec pickle
+
+LENGTH = struct.Struct("!I")
+TARGET = struct.Struct("!q")
+OPTIONAL_INT = struct.Struct("!?q")
+ARRAY_HEADER = struct.Struct("!Ic")  # Nombre d'entiers, puis format d'un entier
+
+# Formats array d'entiers signés de 1, 2, 4 et 8 octets
+INT_WIDTHS = ("b", "h", "i", "q")
+LITTLE_ENDIAN = sys.byteorder == "little"
+
+def pack_ints(values):
+    """Packe des entiers (big-endian) dans le format signé le plus compact qui les contient tous"""
+    for typecode in INT_WIDTHS:
+        try:
+            packed = array(typecode, values)  # array vérifie que chaque entier tient dans le format
+            break
+        except OverflowError:
+            continue
+    else:
+        raise ValueError(f"Entier hors du format 64 bits: {max(values, key=abs)}")
+    if LITTLE_ENDIAN:
+        packed.byteswap()
+    return ARRAY_HEADER.pack(len(packed), packed.typecode.encode()) + packed.tobytes()
+
+def unpack_ints(data, offset):
+    """Inverse de pack_ints : retourne (array d'entiers, offset suivant)"""
+    count, code = ARRAY_HEADER.unpack_from(data, offset)
+    offset += ARRAY_HEADER.size
+    values = array(code.decode())
+    end = offset + count * values.itemsize
+    values.frombytes(data[offset:end])
+    if LITTLE_ENDIAN:
+        values.byteswap()
+    return values, end
+
+# Schémas des messages standards : (tag, classe, ((attribut, type), ...))
+STANDARD_SCHEMAS = (
+    (1, AliveMessage, ()),
+    (2, RegistrationRequest, ()),
+    (3, RegistrationResponse, (("assigned_id", INT), ("world_nodes", INT_SET))),
+    (4, HeartbeatMessage, (("term", INT), ("world_nodes", INT_SET))),
+    (5, HeartbeatConfirmationMessage, (("term", INT),)),
+    (6, RequestVoteMessage, (("term", INT), ("candidate_id", INT))),
+    (7, VoteResponseMessage, (("term", INT), ("vote_granted", BOOL))),
+    (8, WorldUpdateMessage, (("nodes", INT_SET),)),
+    (9, IdAnnouncementMessage, (("proposed_id", INT), ("temp_id", INT))),
+    (10, IdConfirmationMessage, (("id_mapping", INT_MAP),)),
+    (11, WorldInfoMessage, (("world_nodes", INT_SET),)),
+    (12, SynchronizeMessage, (("generation", INT),)),
+    (13, SynchronizeConfirmedMessage, (("generation", INT),)),
+    (14, AllSynchronizedMessage, (("generation", INT),)),
+    (15, BroadcastMessage, (("content", PAYLOAD),)),
+    (16, BroadcastSyncMessage, (("original_sender", INT), ("sequence", INT), ("fan_out", INT),
+                                ("members", INT_SET), ("payload", PAYLOAD))),
+    (17, BroadcastSyncAckMessage, (("original_sender", INT), ("sequence", INT))),
+    (18, SendToSyncMessage, (("tag", INT), ("sync_id", STR), ("payload", PAYLOAD))),
+    (19, SendToSyncAckMessage, (("sync_id", STR),)),
+    (20, TokenMessage, (("token_id", OPT_INT),)),
+    (21, EnvelopeMessage, (("messages", MESSAGES),)),
+    (22, TokenRequestMessage, (("sequence_number", INT),)),
+    (23, TokenGrantMessage, (("last_granted", INT_MAP), ("queue", INT_LIST))),
+    (24, PermissionMessage, (("kind", INT), ("priority", INT))),
+    (25, LockRequestMessage, (("name", STR), ("mode", STR), ("request_id", INT), ("lease_ms", INT))),
+    (26, LockGrantMessage, (("name", STR), ("request_id", INT))),
+    (27, LockReleaseMessage, (("name", STR), ("request_id", INT))),
+    (28, BarrierMessage, (("generation", INT), ("round", INT))),
+    (29, TotalOrderRequestMessage, (("sender_sequence", INT), ("payload", PAYLOAD))),
+    (30, TotalOrderBatchMessage, (("epoch", INT), ("first_sequence", INT), ("senders", INT_LIST),
+                                  ("sender_sequences", INT_LIST), ("timestamps", INT_LIST), ("payloads", PAYLOAD))),
+    (31, TotalOrderMessage, (("sequence", INT), ("payload", PAYLOAD))),
+    (32, CausalMessage, (("dependencies", INT_MAP), ("payload", PAYLOAD))),
+    (33, CollectiveMessage, (("sequence", INT), ("round", INT), ("payload", PAYLOAD))),
+    (34, LockRenewMessage, (("name", STR), ("request_id", INT), ("lease_ms", INT))),
+)
+
+class MessageSchema:
+    """Disposition binaire d'un type de message : en-tête et champs fixes d'un bloc, puis champs variables"""
+
+    def __init__(self, tag, message_class, fields):
+        self.tag = tag
+        self.message_class = message_class
+        self.fixed = [name for name, kind in fields if kind in FIXED_KINDS]
+        self.variable = [(name, kind) for name, kind in fields if kind not in FIXED_KINDS]
+        # tag, flags, source, timestamp, puis les champs fixes
+        fixed_format = "".join(kind for _, kind in fields if kind in FIXED_KINDS)
+        self.head = struct.Struct("!BBqq" + fixed_format)
+
+class MessageCodec:
+    """
+    Codec binaire compact des messages.
+    Chaque type de message a un tag numérique et une disposition de champs fixe
+    (termes, IDs et timestamps en entiers packés, world_nodes en tableau d'entiers) ;
+    les payloads applicatifs passent par un sérialiseur interchangeable.
+    Les types sans schéma enregistré sont encodés avec pickle (tag 0).
+    """
+
+    def __init__(self, serializer=None):
+        self.serializer = serializer or PickleSerializer()  # Objet avec dumps(obj) / loads(data)
+        self.schemas_by_tag = {}    # Dict: {tag: MessageSchema}
+        self.schemas_by_class = {}  # Dict: {classe: MessageSchema}
+        self.registrations = []     # Schémas enregistrés, pour reconstruire le codec dans un autre processus
+        for tag, message_class, fields in STANDARD_SCHEMAS:
+            self.register(tag, message_class, fields)
+
+    def __getstate__(self):
+        """Les structures compilées ne sont pas sérialisables : seuls les schémas sont transmis"""
+        return {'serializer': self.serializer, 'registrations': self.registrations}
+
+    def __setstate__(self, state):
+        self.serializer = state['serializer']
+        self.schemas_by_tag = {}
+        self.schemas_by_class = {}
+        self.registrations = []
+        for tag, message_class, fields in state['registrations']:
+            self.register(tag, message_class, fields)
+
+    def register(self, tag, message_class, fields=()):
+        """Enregistre le schéma d'un type de message sous un tag (1-255) unique"""
+        if not 0 < tag < 256:
+            raise ValueError(f"Tag {tag} hors de l'intervalle 1-255")
+        if tag in self.schemas_by_tag and self.schemas_by_tag[tag].message_class is not message_class:
+            raise ValueError(f"Tag {tag} déjà utilisé par {self.schemas_by_tag[tag].message_class.__name__}")
+        schema = MessageSchema(tag, message_class, fields)
+        self.registrations.append((tag, message_class, tuple(fields)))
+        self.schemas_by_tag[tag] = schema
+        self.schemas_by_class[message_class] = schema
+
+    def encode(self, message):
+        """Encode un message en bytes"""
+        schema = self.schemas_by_class.get(type(message))
+        if schema is None:
+            return bytes((FALLBACK_TAG,)) + pickle.dumps(message, protocol=pickle.HIGHEST_PROTOCOL)
+
+        flags = FLAG_SYSTEM if message.is_system() else 0
+        if message.target is not None:
+            flags |= FLAG_TARGET
+        vector = getattr(message, 'vector', None)
+        if vector:
+            flags |= FLAG_VECTOR
+        parts = [schema.head.pack(schema.tag, flags, message.source, message.timestamp,
+                                  *[getattr(message, name) for name in schema.fixed])]
+        if message.target is not None:
+            parts.append(TARGET.pack(message.target))
+        if vector:
+            parts.append(self._encode_field(INT_MAP, vector))
+        for name, kind in schema.variable:
+            parts.append(self._encode_field(kind, getattr(message, name)))
+        return b"".join(parts)
+
+    def decode(self, data):
+        """Décode des bytes produits par encode()"""
+        if data[0] == FALLBACK_TAG:
+            return pickle.loads(memoryview(data)[1:])
+
+        schema = self.schemas_by_tag[data[0]]
+        values = schema.head.unpack_from(data, 0)
+        offset = schema.head.size
+
+        message = schema.message_class.__new__(schema.message_class)
+        message.source = values[2]
+        message.timestamp = values[3]
+        for name, value in zip(schema.fixed, values[4:]):
+            setattr(message, name, value)
+        message.is_system_message = bool(values[1] & FLAG_SYSTEM)
+        if values[1] & FLAG_TARGET:
+            message.target = TARGET.unpack_from(data, offset)[0]
+            offset += TARGET.size
+        else:
+            message.target = None
+        if values[1] & FLAG_VECTOR:
+            message.vector, offset = self._decode_field(INT_MAP, data, offset)
+        else:
+            message.vector = None
+        for name, kind in schema.variable:
+            value, offset = self._decode_field(kind, data, offset)
+            setattr(message, name, value)
+        return message
+
+    def _encode_field(self, kind, value):
+        if kind == OPT_INT:
+            return OPTIONAL_INT.pack(value is not None, value or 0)
+        if kind in (INT_SET, INT_LIST):
+            return pack_ints(list(value))
+        if kind == INT_MAP:
+            return pack_ints(list(chain.from_iterable(value.items())))
+        if kind == STR:
+            encoded = value.encode("utf-8")
+            return LENGTH.pack(len(encoded)) + encoded
+        if kind == PAYLOAD:
+            encoded = self.serializer.dumps(value)
+            return LENGTH.pack(len(encoded)) + encoded
+        if kind == MESSAGES:
+            parts = [LENGTH.pack(len(value))]
+            for message in value:
+                encoded = self.encode(message)
+                parts.append(LENGTH.pack(len(encoded)))
+                parts.append(encoded)
+            return b"".join(parts)
+        raise ValueError(f"Type de champ inconnu: {kind}")
+
+    def _decode_field(self, kind, data, offset):
+        if kind == OPT_INT:
+            present, value = OPTIONAL_INT.unpack_from(data, offset)
+            return (value if present else None), offset + OPTIONAL_INT.size
+        if kind == INT_SET:
+            values, offset = unpack_ints(data, offset)
+            return set(values), offset
+        if kind == INT_LIST:
+            values, offset = unpack_ints(data, offset)
+            return list(values), offset
+        if kind == INT_MAP:
+            flat, offset = unpack_ints(data, offset)
+            return dict(zip(flat[::2], flat[1::2])), offset
+        length = LENGTH.unpack_from(data, offset)[0]
+        offset += LENGTH.size
+        if kind == STR:
+            return bytes(data[offset:offset + length]).decode("utf-8"), offset + length
+        if kind == PAYLOAD:
+            return self.serializer.loads(data[offset:offset + length]), offset + length
+        if kind == MESSAGES:
+            messages = []
+            for _ in range(length):
+                size = LENGTH.unpack_from(data, offset)[0]
+                offset += LENGTH.size
+                messages.append(self.decode(data[offset:offset + size]))
+                offset += size
+            return messages, offset
+        raise ValueError(f"Type de champ inconnu: {kind}")
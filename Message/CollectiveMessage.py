@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+from .AbstractMessage import AbstractMessage
+
+@dataclass
+class CollectiveMessage(AbstractMessage):
+    """Étape d'une opération collective (scatter, gather, reduce, allgather, allreduce)"""
+    def __init__(self, source, timestamp, sequence, round, payload, target=None):
+        super().__init__(source, timestamp, target)
+        self.sequence = sequence  # Numéro de l'opération collective (même ordre d'appel sur tous les nœuds)
+        self.round = round        # Tour de l'algorithme
+        self.payload = payload
+        self.is_system_message = True  # Message système - traité par le moteur des collectives
@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+from .AbstractMessage import AbstractMessage
+
+@dataclass
+class EnvelopeMessage(AbstractMessage):
+    """Enveloppe regroupant plusieurs messages vers un même destinataire (batching)"""
+    def __init__(self, source, timestamp, messages, target=None):
+        super().__init__(source, timestamp, target)
+        self.messages = messages  # Messages regroupés, dans l'ordre d'envoi
+        self.is_system_message = True  # Message système - n'impacte pas l'horloge Lamport
@@ -0,0 +1,41 @@
+from dataclasses import dataclass
+from .AbstractMessage import AbstractMessage
+
+@dataclass
+class LockRequestMessage(AbstractMessage):
+    """Demande d'un verrou nommé, envoyée au nœud qui gère ce nom"""
+    def __init__(self, source, timestamp, name, mode, request_id, lease_ms, target=None):
+        super().__init__(source, timestamp, target)
+        self.name = name              # Nom du verrou
+        self.mode = mode              # "r" (lecture, partagé) ou "w" (écriture, exclusif)
+        self.request_id = request_id  # Identifiant de la demande chez 'source'
+        self.lease_ms = lease_ms      # Durée du bail en millisecondes (0 = sans bail)
+        self.is_system_message = True  # Message système - traité par le service de verrous
+
+@dataclass
+class LockGrantMessage(AbstractMessage):
+    """Verrou accordé au demandeur"""
+    def __init__(self, source, timestamp, name, request_id, target=None):
+        super().__init__(source, timestamp, target)
+        self.name = name
+        self.request_id = request_id
+        self.is_system_message = True  # Message système - traité par le service de verrous
+
+@dataclass
+class LockReleaseMessage(AbstractMessage):
+    """Libération d'un verrou détenu, ou abandon d'une demande en attente"""
+    def __init__(self, source, timestamp, name, request_id, target=None):
+        super().__init__(source, timestamp, target)
+        self.name = name
+        self.request_id = request_id
+        self.is_system_message = True  # Message système - traité par le service de verrous
+
+@dataclass
+class LockRenewMessage(AbstractMessage):
+    """Prolongation du bail d'un verrou détenu"""
+    def __init__(self, source, timestamp, name, request_id, lease_ms, target=None):
+        super().__init__(source, timestamp, target)
+        self.name = name
+        self.request_id = request_id
+        self.lease_ms = lease_ms      # Nouveau bail en millisecondes, compté depuis la réception
+        self.is_system_message = True  # Message système - traité par le service de verrous
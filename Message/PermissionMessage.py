@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+from enum import IntEnum
+from .AbstractMessage import AbstractMessage
+
+class PermissionKind(IntEnum):
+    """Types de messages des moteurs par permissions"""
+    REQUEST = 1  # Demande de section critique (priorité = horloge de Lamport de la demande)
+    REPLY = 2    # Permission accordée (Ricart–Agrawala) / vote de l'arbitre (Maekawa)
+    RELEASE = 3  # Maekawa : sortie de section critique, l'arbitre peut voter pour un autre
+    FAILED = 4   # Maekawa : l'arbitre a voté pour une demande prioritaire
+    INQUIRE = 5  # Maekawa : l'arbitre demande à récupérer son vote
+    YIELD = 6    # Maekawa : le demandeur rend le vote de l'arbitre
+
+@dataclass
+class PermissionMessage(AbstractMessage):
+    """Message des moteurs d'exclusion mutuelle par permissions (Ricart–Agrawala, Maekawa)"""
+    def __init__(self, source, timestamp, kind, priority, target=None):
+        super().__init__(source, timestamp, target)
+        self.kind = kind          # PermissionKind
+        self.priority = priority  # Horloge de Lamport de la demande concernée (avec source : ordre total)
+        self.is_system_message = True  # Message système - traité par le moteur, pas par la boîte aux lettres
@@ -4,10 +4,11 @@ from .AbstractMessage import AbstractMessage
 @dataclass
 class SendToSyncMessage(AbstractMessage):
     """Message pour communication synchrone point-à-point"""
-    def __init__(self, source, timestamp, payload, sync_id, target=None):
+    def __init__(self, source, timestamp, payload, sync_id, target=None, tag=0):
         super().__init__(source, timestamp, target)
         self.payload = payload  # Le contenu du message à envoyer
         self.sync_id = sync_id  # ID unique pour identifier cette communication sync
+        self.tag = tag          # Étiquette (>= 0) appariée par receiveFromSync
         self.is_system_message = True  # Message système
 
 @dataclass
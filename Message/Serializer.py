@@ -0,0 +1,13 @@
+import pickle
+
+class PickleSerializer:
+    """Sérialiseur par défaut des payloads applicatifs (toute classe avec dumps/loads convient)"""
+
+    def __init__(self, protocol=pickle.HIGHEST_PROTOCOL):
+        self.protocol = protocol
+
+    def dumps(self, obj):
+        return pickle.dumps(obj, protocol=self.protocol)
+
+    def loads(self, data):
+        return pickle.loads(data)
@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+from .AbstractMessage import AbstractMessage
+
+@dataclass
+class TokenRequestMessage(AbstractMessage):
+    """Demande de section critique (Suzuki–Kasami), diffusée à tous les nœuds"""
+    def __init__(self, source, timestamp, sequence_number, target=None):
+        super().__init__(source, timestamp, target)
+        self.sequence_number = sequence_number  # Numéro de la demande de 'source'
+        self.is_system_message = True  # Message système - n'impacte pas l'horloge Lamport
+
+@dataclass
+class TokenGrantMessage(AbstractMessage):
+    """Jeton Suzuki–Kasami envoyé directement au prochain demandeur"""
+    def __init__(self, source, timestamp, last_granted, queue, target=None):
+        super().__init__(source, timestamp, target)
+        self.last_granted = last_granted  # Dict: {nœud: numéro de la dernière demande satisfaite}
+        self.queue = queue                # Liste ordonnée des nœuds en attente du jeton
+        self.is_system_message = True  # Message système - n'impacte pas l'horloge Lamport
@@ -4,20 +4,32 @@ from dataclasses import dataclass
 @dataclass
 class SynchronizeMessage(AbstractMessage):
     """Message pour initier la synchronisation"""
-    def __init__(self, source, timestamp, target=None):
+    def __init__(self, source, timestamp, generation=0, target=None):
         super().__init__(source, timestamp, target)
+        self.generation = generation  # Numéro de la barrière (réutilisation sans mélange des confirmations)
         self.is_system_message = True  # Message système qui peut être traité pendant la synchronisation
 
 @dataclass
 class SynchronizeConfirmedMessage(AbstractMessage):
     """Message de confirmation de synchronisation envoyé au leader"""
-    def __init__(self, source, timestamp, target=None):
+    def __init__(self, source, timestamp, generation=0, target=None):
         super().__init__(source, timestamp, target)
+        self.generation = generation
         self.is_system_message = True  # Message système qui peut être traité pendant la synchronisation
 
 @dataclass
 class AllSynchronizedMessage(AbstractMessage):
     """Message broadcast par le leader pour signaler que tous les nœuds sont synchronisés"""
-    def __init__(self, source, timestamp, target=None):
+    def __init__(self, source, timestamp, generation=0, target=None):
         super().__init__(source, timestamp, target)
-        self.is_system_message = True  # Message système qui peut être traité pendant la synchronisation
\ No newline at end of file
+        self.generation = generation
+        self.is_system_message = True  # Message système qui peut être traité pendant la synchronisation
+
+@dataclass
+class BarrierMessage(AbstractMessage):
+    """Étape d'une barrière en O(log N) tours (arbre de combinaison ou dissémination)"""
+    def __init__(self, source, timestamp, generation, round, target=None):
+        super().__init__(source, timestamp, target)
+        self.generation = generation  # Numéro de la barrière
+        self.round = round            # Tour de dissémination, ou ARRIVE / RELEASE dans l'arbre
+        self.is_system_message = True  # Message système qui peut être traité pendant la synchronisation
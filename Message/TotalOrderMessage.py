@@ -0,0 +1,32 @@
+from dataclasses import dataclass
+from .AbstractMessage import AbstractMessage
+
+@dataclass
+class TotalOrderRequestMessage(AbstractMessage):
+    """Demande de diffusion totalement ordonnée, envoyée au séquenceur (leader)"""
+    def __init__(self, source, timestamp, sender_sequence, payload, target=None):
+        super().__init__(source, timestamp, target)
+        self.sender_sequence = sender_sequence  # Numéro de la demande chez 'source' (1, 2, ...)
+        self.payload = payload
+        self.is_system_message = True  # Message système - traité par le séquenceur
+
+@dataclass
+class TotalOrderBatchMessage(AbstractMessage):
+    """Lot de demandes numérotées par le séquenceur : numéros first_sequence, first_sequence+1, ..."""
+    def __init__(self, source, timestamp, epoch, first_sequence, senders, sender_sequences, timestamps, payloads, target=None):
+        super().__init__(source, timestamp, target)
+        self.epoch = epoch                        # Terme du leader séquenceur
+        self.first_sequence = first_sequence      # Numéro global de la première demande du lot
+        self.senders = senders                    # Liste des émetteurs
+        self.sender_sequences = sender_sequences  # Liste des numéros chez chaque émetteur
+        self.timestamps = timestamps              # Liste des horloges de Lamport des émetteurs
+        self.payloads = payloads                  # Liste des payloads
+        self.is_system_message = True  # Message système - traité par la file de réception
+
+@dataclass
+class TotalOrderMessage(AbstractMessage):
+    """Message remis à l'application, dans le même ordre sur tous les nœuds"""
+    def __init__(self, source, timestamp, sequence, payload, target=None):
+        super().__init__(source, timestamp, target)
+        self.sequence = sequence  # Numéro global attribué par le séquenceur
+        self.payload = payload
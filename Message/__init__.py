@@ -1,19 +1,30 @@
 from .AbstractMessage import AbstractMessage
 from .AliveMessage import AliveMessage
+from .BroadcastMessage import BroadcastMessage
 from .RegistrationMessage import RegistrationRequest, RegistrationResponse
 from .HeartbeatMessage import HeartbeatMessage
 from .HeartbeatConfirmationMessage import HeartbeatConfirmationMessage
 from .VoteMessage import RequestVoteMessage, VoteResponseMessage
 from .WorldUpdateMessage import WorldUpdateMessage
 from .IdDistributionMessage import IdAnnouncementMessage, IdConfirmationMessage, WorldInfoMessage
-from .SynchronizeMessage import SynchronizeMessage, SynchronizeConfirmedMessage, AllSynchronizedMessage
+from .SynchronizeMessage import SynchronizeMessage, SynchronizeConfirmedMessage, AllSynchronizedMessage, BarrierMessage
 from .BroadcastSyncMessage import BroadcastSyncMessage, BroadcastSyncAckMessage
 from .SendToSyncMessage import SendToSyncMessage, SendToSyncAckMessage
 from .TokenMessage import TokenMessage
+from .SuzukiKasamiMessage import TokenRequestMessage, TokenGrantMessage
+from .PermissionMessage import PermissionKind, PermissionMessage
+from .LockMessage import LockRequestMessage, LockGrantMessage, LockReleaseMessage, LockRenewMessage
+from .TotalOrderMessage import TotalOrderRequestMessage, TotalOrderBatchMessage, TotalOrderMessage
+from .CausalMessage import CausalMessage
+from .CollectiveMessage import CollectiveMessage
+from .EnvelopeMessage import EnvelopeMessage
+from .Serializer import PickleSerializer
+from .Codec import MessageCodec
 
 __all__ = [
     "AbstractMessage",
     "AliveMessage",
+    "BroadcastMessage",
     "RegistrationRequest",
     "RegistrationResponse",
     "HeartbeatMessage",
@@ -27,9 +38,26 @@ __all__ = [
     "SynchronizeMessage",
     "SynchronizeConfirmedMessage",
     "AllSynchronizedMessage",
+    "BarrierMessage",
     "BroadcastSyncMessage",
     "BroadcastSyncAckMessage",
     "SendToSyncMessage",
     "SendToSyncAckMessage",
-    "TokenMessage"
+    "TokenMessage",
+    "TokenRequestMessage",
+    "TokenGrantMessage",
+    "PermissionKind",
+    "PermissionMessage",
+    "LockRequestMessage",
+    "LockGrantMessage",
+    "LockReleaseMessage",
+    "LockRenewMessage",
+    "TotalOrderRequestMessage",
+    "TotalOrderBatchMessage",
+    "TotalOrderMessage",
+    "CausalMessage",
+    "CollectiveMessage",
+    "EnvelopeMessage",
+    "PickleSerializer",
+    "MessageCodec",
 ]
\ No newline at end of file
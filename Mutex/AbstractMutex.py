@@ -0,0 +1,43 @@
+from abc import ABC, abstractmethod
+
+class AbstractMutex(ABC):
+    """
+    Moteur d'exclusion mutuelle distribuée d'un communicateur.
+    request() bloque jusqu'à l'entrée en section critique, release() la libère ;
+    handle_message() reçoit, dans le thread du dispatcher, les messages du protocole.
+    """
+
+    def __init__(self, communication):
+        self.communication = communication
+
+    def start(self):
+        """Démarre le moteur (appelé par Communication.init)"""
+        pass
+
+    def stop(self):
+        """Arrête le moteur et débloque un éventuel request() en attente"""
+        pass
+
+    def on_leader_elected(self):
+        """Appelé quand ce nœud devient le premier leader du cluster (Communication.init_token_ring)"""
+        pass
+
+    @abstractmethod
+    def request(self):
+        """
+        Bloque jusqu'à l'entrée en section critique.
+
+        Returns:
+            True si la section critique est obtenue, False si le nœud s'arrête
+        """
+        pass
+
+    @abstractmethod
+    def release(self):
+        """Sort de la section critique"""
+        pass
+
+    @abstractmethod
+    def handle_message(self, message):
+        """Traite un message du protocole (ne doit jamais bloquer le dispatcher)"""
+        pass
@@ -0,0 +1,268 @@
+from collections import deque
+from threading import Condition, Event
+from time import time
+import heapq
+import zlib
+from Message import LockRequestMessage, LockGrantMessage, LockReleaseMessage, LockRenewMessage
+from Log import get_logger
+
+log = get_logger("lock")
+
+REGISTRATION_POLL = 0.1    # Délai de revérification tant que le nœud n'a pas d'ID permanent
+
+class LockEntry:
+    """État d'un verrou nommé chez le nœud qui le gère"""
+
+    def __init__(self):
+        self.mode = None       # "r", "w" ou None si libre
+        self.holders = {}      # Dict: {(nœud, request_id): échéance du bail ou None}
+        self.queue = deque()   # Demandes en attente : (nœud, request_id, mode, bail en secondes)
+
+    def is_free(self):
+        return not self.holders and not self.queue
+
+class LockService:
+    """
+    Verrous nommés en lecture/écriture, avec bail.
+
+    Chaque nom est géré par un seul nœud : par défaut le nœud d'indice crc32(nom) mod N
+    dans le monde trié (répartition des verrous sur tous les nœuds), ou le leader si
+    placement="leader". Des milliers de verrous indépendants sont ainsi tenus en même temps
+    sans goulot commun, et un verrou ne coûte que 2 messages (demande, accord) plus la libération.
+
+    Côté gestionnaire, tout s'exécute dans le thread du dispatcher : pour chaque nom, les
+    demandes sont servies dans l'ordre d'arrivée, les lecteurs consécutifs ensemble, un
+    rédacteur seul (un rédacteur en tête de file bloque les lecteurs suivants : pas de famine).
+    Le bail est optionnel : un verrou dont le bail expire est libéré d'office, qu'un détenteur
+    mort ne bloque donc pas les autres ; un détenteur vivant le prolonge avec renew(). Les baux
+    sont rangés dans un tas, surveillé par un seul timer.
+
+    Le placement suit le monde connu du demandeur : tant que les mondes des nœuds divergent
+    (entrée ou départ d'un nœud), un nom peut avoir deux gestionnaires ; seuls les baux bornent
+    alors la durée d'un conflit.
+    """
+
+    def __init__(self, communication, placement="sharded"):
+        if placement not in ("sharded", "leader"):
+            raise ValueError(f"Placement des verrous inconnu: {placement}")
+        self.communication = communication
+        self.placement = placement
+        self.condition = Condition()
+        self.running = False
+        # Demandeur
+        self.request_counter = 0
+        self.pending = {}  # Dict: {request_id: Event} demandes en attente d'accord
+        self.held = {}     # Dict: {nom: [(gestionnaire, request_id, échéance du bail ou None, bail), ...]}
+        # Gestionnaire (thread du dispatcher uniquement)
+        self.entries = {}  # Dict: {nom: LockEntry}, seuls les verrous tenus ou demandés
+        self.leases = []   # Tas des baux : (échéance, nom, (nœud, request_id))
+        self.lease_timer = None
+        self.lease_deadline = None
+
+    def start(self):
+        self.running = True
+
+    def stop(self):
+        with self.condition:
+            self.running = False
+            for event in self.pending.values():
+                event.set()
+        if self.lease_timer:
+            self.lease_timer.cancel()
+
+    def owner(self, name):
+        """Nœud qui gère le verrou 'name'"""
+        if self.placement == "leader":
+            return self.communication.leader_id
+        members = sorted(self.communication.world)
+        return members[zlib.crc32(name.encode()) % len(members)]
+
+    def acquire(self, name, mode="w", lease=None, timeout=None):
+        """
+        Bloque jusqu'à l'obtention du verrou 'name'.
+
+        Sans bail (par défaut), le verrou est tenu jusqu'à release, même si son détenteur meurt.
+        Avec un bail, le gestionnaire le libère d'office à l'échéance, même si le détenteur est
+        vivant et n'a pas fini : il doit le prolonger avec renew() avant, et vérifier holds().
+
+        Args:
+            name: Nom du verrou
+            mode: "r" (lecture, partagé entre lecteurs) ou "w" (écriture, exclusif)
+            lease: Durée du bail en secondes (None = jusqu'à release)
+            timeout: Attente maximale en secondes (None = illimitée)
+
+        Returns:
+            True si le verrou est obtenu, False sur timeout ou arrêt du nœud
+        """
+        if mode not in ("r", "w"):
+            raise ValueError(f"Mode de verrou inconnu: {mode}")
+        deadline = None if timeout is None else time() + timeout
+        if not self._wait_until_registered(deadline):
+            return False
+        owner = self.owner(name)
+        event = Event()
+        with self.condition:
+            self.request_counter += 1
+            request_id = self.request_counter
+            self.pending[request_id] = event
+        start = time()
+        lease_ms = int(lease * 1000) if lease else 0
+        self._send(owner, LockRequestMessage(self.communication.id, self.communication.get_clock(),
+                                             name, mode, request_id, lease_ms))
+        granted = event.wait(None if deadline is None else max(0, deadline - time()))
+        with self.condition:
+            del self.pending[request_id]
+            if granted and self.running:
+                # Le bail est compté depuis l'envoi de la demande : l'échéance locale précède celle du gestionnaire
+                self.held.setdefault(name, []).append((owner, request_id, start + lease if lease else None, lease))
+                return True
+        # Abandon : le gestionnaire retire la demande (ou libère le verrou s'il l'a accordé entre-temps)
+        self._send(owner, LockReleaseMessage(self.communication.id, self.communication.get_clock(), name, request_id))
+        return False
+
+    def release(self, name):
+        """Libère le verrou 'name' (le plus ancien, s'il est tenu plusieurs fois en lecture)"""
+        with self.condition:
+            holds = self.held.get(name)
+            if not holds:
+                raise RuntimeError(f"Verrou non détenu: {name}")
+            owner, request_id, _, _ = holds.pop(0)
+            if not holds:
+                del self.held[name]
+        self._send(owner, LockReleaseMessage(self.communication.id, self.communication.get_clock(), name, request_id))
+
+    def renew(self, name, lease=None):
+        """
+        Prolonge le bail du verrou 'name', à envoyer avant son échéance.
+
+        Args:
+            name: Nom du verrou
+            lease: Nouvelle durée du bail en secondes, comptée depuis maintenant
+                   (None = durée donnée à acquire)
+
+        Returns:
+            True si le bail courait encore ; False s'il a déjà expiré (le verrou est
+            alors peut-être tenu par un autre, et n'est pas repris)
+        """
+        with self.condition:
+            holds = self.held.get(name)
+            if not holds:
+                raise RuntimeError(f"Verrou non détenu: {name}")
+            now = time()
+            renewed = []
+            for index, (owner, request_id, expires, initial) in enumerate(holds):
+                duration = lease or initial
+                if expires is None or expires <= now or not duration:
+                    continue  # Sans bail, ou déjà expiré chez le gestionnaire
+                holds[index] = (owner, request_id, now + duration, duration)
+                renewed.append((owner, request_id, duration))
+        for owner, request_id, duration in renewed:
+            self._send(owner, LockRenewMessage(self.communication.id, self.communication.get_clock(),
+                                               name, request_id, int(duration * 1000)))
+        return bool(renewed)
+
+    def holds(self, name):
+        """True si le verrou est détenu et que son bail n'a pas expiré"""
+        with self.condition:
+            now = time()
+            return any(expires is None or expires > now for _, _, expires, _ in self.held.get(name, ()))
+
+    def handle_message(self, message):
+        match message:
+            case LockRequestMessage():
+                entry = self.entries.setdefault(message.name, LockEntry())
+                entry.queue.append((message.source, message.request_id, message.mode, message.lease_ms / 1000))
+                self._grant(message.name, entry)
+            case LockReleaseMessage():
+                entry = self.entries.get(message.name)
+                if entry is None:
+                    return
+                key = (message.source, message.request_id)
+                if entry.holders.pop(key, False) is False:
+                    entry.queue = deque(request for request in entry.queue if request[:2] != key)
+                self._grant(message.name, entry)
+            case LockRenewMessage():
+                entry = self.entries.get(message.name)
+                key = (message.source, message.request_id)
+                if entry is None or entry.holders.get(key) is None:
+                    return  # Bail déjà échu (ou verrou sans bail) : le verrou n'est pas repris
+                # L'ancienne entrée du tas ne correspond plus à l'échéance : _expire_leases l'ignorera
+                expires = time() + message.lease_ms / 1000
+                entry.holders[key] = expires
+                heapq.heappush(self.leases, (expires, message.name, key))
+                self._schedule_lease_check()
+            case LockGrantMessage():
+                with self.condition:
+                    event = self.pending.get(message.request_id)
+                if event:
+                    event.set()
+                # Sinon la demande a été abandonnée, et sa libération est déjà envoyée
+
+    def _grant(self, name, entry):
+        """Accorde le verrou aux demandes compatibles en tête de file"""
+        if not entry.holders:
+            entry.mode = None
+        while entry.queue:
+            node, request_id, mode, lease = entry.queue[0]
+            if entry.holders and (mode == "w" or entry.mode == "w"):
+                break
+            entry.queue.popleft()
+            expires = time() + lease if lease else None
+            entry.holders[(node, request_id)] = expires
+            entry.mode = mode
+            if expires is not None:
+                heapq.heappush(self.leases, (expires, name, (node, request_id)))
+            log.debug("Verrou %s accordé à %s en mode %s", name, node, mode)
+            self._send(node, LockGrantMessage(self.communication.id, self.communication.get_clock(), name, request_id))
+        if entry.is_free():
+            del self.entries[name]
+        self._schedule_lease_check()
+
+    def _schedule_lease_check(self):
+        """Un seul timer, réglé sur le prochain bail à échoir"""
+        if not self.leases or not self.running:
+            return
+        deadline = self.leases[0][0]
+        if self.lease_deadline is not None and self.lease_deadline <= deadline:
+            return
+        if self.lease_timer:
+            self.lease_timer.cancel()
+        self.lease_deadline = deadline
+        self.lease_timer = self.communication.call_later(max(0, deadline - time()), self._expire_leases)
+
+    def _expire_leases(self):
+        """Libère d'office les verrous dont le bail est échu"""
+        self.lease_timer = None
+        self.lease_deadline = None
+        now = time()
+        while self.leases and self.leases[0][0] <= now:
+            expires, name, key = heapq.heappop(self.leases)
+            entry = self.entries.get(name)
+            if entry is None or entry.holders.get(key) != expires:
+                continue  # Déjà libéré
+            log.warning("Bail du verrou %s détenu par %s expiré, libération d'office", name, key[0])
+            del entry.holders[key]
+            self._grant(name, entry)
+        self._schedule_lease_check()
+
+    def _wait_until_registered(self, deadline):
+        """Le placement dépend du monde : attendre l'ID permanent (et le leader si placement="leader")"""
+        with self.condition:
+            while self.running and not self._is_ready():
+                if deadline is not None and time() >= deadline:
+                    return False
+                self.condition.wait(REGISTRATION_POLL)
+            return self.running
+
+    def _is_ready(self):
+        if self.communication.id is None or not self.communication.world:
+            return False
+        return self.placement == "sharded" or self.communication.leader_id is not None
+
+    def _send(self, node, message):
+        """Envoie un message du service ; à soi-même, il passe par le dispatcher local"""
+        if node == self.communication.id:
+            message.target = node
+            self.communication.dispatcher.schedule(self.handle_message, message)
+        else:
+            self.communication.send_message_to(node, message)
@@ -0,0 +1,153 @@
+import heapq
+from math import ceil, sqrt
+from Message import PermissionKind
+from Log import get_logger
+from .PermissionMutex import PermissionMutex
+
+log = get_logger("token")
+
+def grid_quorum(node, members):
+    """
+    Quorum de 'node' : sa ligne et sa colonne dans la grille k×k (k = ⌈√N⌉) des membres triés.
+    Deux quorums se coupent toujours, y compris si la dernière ligne est incomplète.
+    """
+    members = sorted(members)
+    k = ceil(sqrt(len(members)))
+    row, column = divmod(members.index(node), k)
+    return {member for i, member in enumerate(members) if i // k == row or i % k == column}
+
+class Maekawa(PermissionMutex):
+    """
+    Maekawa : la permission n'est demandée qu'au quorum du nœud (≈ 2√N nœuds), chaque nœud
+    étant l'arbitre qui ne vote que pour une demande à la fois.
+    Les interblocages sont évités par FAILED / INQUIRE / YIELD : un arbitre ayant voté pour
+    une demande moins prioritaire que la nouvelle lui réclame son vote, que le demandeur rend
+    s'il sait déjà qu'il ne peut pas entrer. Toute demande en attente qui n'est pas la plus
+    prioritaire de l'arbitre a reçu FAILED, y compris l'ancienne tête de file délogée par une
+    demande plus prioritaire (correction de Sanders). Environ 3√N à 5√N messages par entrée.
+
+    Les demandes sont identifiées par (horloge de Lamport, ID) ; un message portant une
+    autre priorité que la demande en cours est périmé et ignoré.
+    """
+
+    def __init__(self, communication):
+        super().__init__(communication)
+        # Demandeur
+        self.quorum = set()
+        self.granted = set()    # Arbitres dont on détient le vote
+        self.failed = False     # Un arbitre a voté pour une demande prioritaire
+        self.inquiries = set()  # Arbitres réclamant leur vote avant qu'on ait reçu FAILED
+        # Arbitre
+        self.locked_for = None  # Demande (priorité, nœud) ayant notre vote
+        self.waiting = []       # Tas des demandes en attente de notre vote
+        self.inquired = False   # INQUIRE envoyé pour le vote en cours
+
+    def request(self):
+        if not self.wait_until_registered():
+            return False
+        with self.condition:
+            self.requesting = True
+            self.priority = self.new_priority()
+            self.quorum = grid_quorum(self.communication.id, self.communication.world)
+            self.granted = set()
+            self.failed = False
+            self.inquiries = set()
+            quorum = sorted(self.quorum)
+        log.debug("Nœud %s demande la section critique au quorum %s", self.communication.id, quorum)
+        for node in quorum:
+            self.send(node, PermissionKind.REQUEST, self.priority[0])
+        with self.condition:
+            self.condition.wait_for(lambda: not self.running or self.granted == self.quorum)
+            self.in_critical_section = self.running
+            return self.in_critical_section
+
+    def release(self):
+        with self.condition:
+            priority, quorum = self.priority, sorted(self.quorum)
+            self.requesting = False
+            self.in_critical_section = False
+            self.priority = None
+            self.granted = set()
+            self.inquiries = set()
+        if priority is not None:
+            for node in quorum:
+                self.send(node, PermissionKind.RELEASE, priority[0])
+
+    def handle_message(self, message):
+        if message.kind == PermissionKind.REQUEST:
+            self.communication.update_lamport_clock(message.priority)
+        with self.condition:
+            match message.kind:
+                case PermissionKind.REQUEST | PermissionKind.RELEASE | PermissionKind.YIELD:
+                    sends = self._arbitrate(message.kind, (message.priority, message.source))
+                case _ if self.priority and message.priority == self.priority[0]:
+                    sends = self._on_vote(message.kind, message.source)
+                case _:
+                    sends = []  # Message d'une demande terminée
+        for node, kind, priority in sends:
+            self.send(node, kind, priority)
+
+    def _arbitrate(self, kind, request):
+        """Rôle d'arbitre (verrou tenu) ; retourne les messages à envoyer"""
+        sends = []
+        match kind:
+            case PermissionKind.REQUEST if self.locked_for is None:
+                self.locked_for = request
+                sends.append((request[1], PermissionKind.REPLY, request[0]))
+            case PermissionKind.REQUEST:
+                head = self.waiting[0] if self.waiting else None
+                heapq.heappush(self.waiting, request)
+                if request < self.locked_for and request == self.waiting[0]:
+                    if head is not None:
+                        # L'ancienne tête n'a pas reçu FAILED : sans lui, elle garderait ses autres votes (Sanders)
+                        sends.append((head[1], PermissionKind.FAILED, head[0]))
+                    if not self.inquired:
+                        self.inquired = True
+                        sends.append((self.locked_for[1], PermissionKind.INQUIRE, self.locked_for[0]))
+                else:
+                    sends.append((request[1], PermissionKind.FAILED, request[0]))
+            case PermissionKind.YIELD if request == self.locked_for:
+                heapq.heappush(self.waiting, request)
+                sends.extend(self._vote_next())
+            case PermissionKind.RELEASE if request == self.locked_for:
+                sends.extend(self._vote_next())
+            case PermissionKind.RELEASE if request in self.waiting:
+                self.waiting.remove(request)
+                heapq.heapify(self.waiting)
+        return sends
+
+    def _vote_next(self):
+        """Donne le vote à la demande la plus prioritaire en attente"""
+        self.inquired = False
+        self.locked_for = heapq.heappop(self.waiting) if self.waiting else None
+        if self.locked_for is None:
+            return []
+        return [(self.locked_for[1], PermissionKind.REPLY, self.locked_for[0])]
+
+    def _on_vote(self, kind, arbiter):
+        """Rôle de demandeur (verrou tenu) ; retourne les messages à envoyer"""
+        sends = []
+        match kind:
+            case PermissionKind.REPLY:
+                self.granted.add(arbiter)
+                self.inquiries.discard(arbiter)
+                if self.granted == self.quorum:
+                    self.condition.notify_all()
+            case PermissionKind.FAILED:
+                self.failed = True
+                for node in sorted(self.inquiries):
+                    sends.extend(self._yield(node))
+                self.inquiries = set()
+            case PermissionKind.INQUIRE if self.in_critical_section or self.granted == self.quorum:
+                pass  # Le vote sera rendu par RELEASE
+            case PermissionKind.INQUIRE if self.failed:
+                sends.extend(self._yield(arbiter))
+            case PermissionKind.INQUIRE:
+                self.inquiries.add(arbiter)
+        return sends
+
+    def _yield(self, arbiter):
+        if arbiter not in self.granted:
+            return []
+        self.granted.discard(arbiter)
+        return [(arbiter, PermissionKind.YIELD, self.priority[0])]
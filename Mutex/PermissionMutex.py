@@ -0,0 +1,50 @@
+from threading import Condition
+from Message import PermissionMessage
+from .AbstractMutex import AbstractMutex
+
+REGISTRATION_POLL = 0.1  # Délai de revérification tant que le nœud n'a pas d'ID permanent
+
+class PermissionMutex(AbstractMutex):
+    """
+    Base des moteurs par permissions (Ricart–Agrawala, Maekawa) : pas de jeton à perdre,
+    un nœud entre en section critique quand il a obtenu les permissions nécessaires.
+
+    La priorité d'une demande est l'horloge de Lamport du processus (inc_clock), départagée
+    par l'ID du demandeur. Une demande reçue met à jour l'horloge : c'est un événement du
+    processus demandeur, même si le message est traité comme un message système.
+    """
+
+    def __init__(self, communication):
+        super().__init__(communication)
+        self.condition = Condition()
+        self.running = False
+        self.requesting = False
+        self.in_critical_section = False
+        self.priority = None  # (horloge de Lamport, ID) de la demande en cours
+
+    def start(self):
+        self.running = True
+
+    def stop(self):
+        with self.condition:
+            self.running = False
+            self.condition.notify_all()
+
+    def wait_until_registered(self):
+        """Les permissions se demandent aux nœuds du monde : attendre l'ID permanent"""
+        with self.condition:
+            while self.running and (self.communication.id is None or not self.communication.world):
+                self.condition.wait(REGISTRATION_POLL)
+            return self.running
+
+    def new_priority(self):
+        """Priorité d'une nouvelle demande : (horloge de Lamport incrémentée, ID)"""
+        return (self.communication.inc_clock(), self.communication.id)
+
+    def send(self, node, kind, priority):
+        """Envoie un message du protocole ; à soi-même, il passe par le dispatcher local"""
+        message = PermissionMessage(self.communication.id, self.communication.get_clock(), kind, priority, target=node)
+        if node == self.communication.id:
+            self.communication.dispatcher.schedule(self.handle_message, message)
+        else:
+            self.communication.send_message_to(node, message)
@@ -0,0 +1,61 @@
+from Message import PermissionKind
+from Log import get_logger
+from .PermissionMutex import PermissionMutex
+
+log = get_logger("token")
+
+class RicartAgrawala(PermissionMutex):
+    """
+    Ricart–Agrawala : la demande est envoyée à tous les autres nœuds (N-1 messages),
+    chacun répond immédiatement sauf s'il est en section critique ou si sa propre
+    demande est prioritaire ; ses réponses sont alors différées jusqu'à sa sortie.
+    2(N-1) messages par entrée, aucun au repos.
+    """
+
+    def __init__(self, communication):
+        super().__init__(communication)
+        self.waiting_for = set()  # Nœuds dont la permission manque encore
+        self.deferred = []        # Nœuds à qui répondre en sortant de section critique
+
+    def request(self):
+        if not self.wait_until_registered():
+            return False
+        with self.condition:
+            self.requesting = True
+            self.priority = self.new_priority()
+            self.waiting_for = set(self.communication.world) - {self.communication.id}
+            others = sorted(self.waiting_for)
+        log.debug("Nœud %s demande la section critique (priorité %s)", self.communication.id, self.priority)
+        for node in others:
+            self.send(node, PermissionKind.REQUEST, self.priority[0])
+        with self.condition:
+            self.condition.wait_for(lambda: not self.running or not self.waiting_for)
+            self.in_critical_section = self.running
+            return self.in_critical_section
+
+    def release(self):
+        with self.condition:
+            self.requesting = False
+            self.in_critical_section = False
+            self.priority = None
+            deferred, self.deferred = self.deferred, []
+        for node, priority in deferred:
+            self.send(node, PermissionKind.REPLY, priority)
+
+    def handle_message(self, message):
+        match message.kind:
+            case PermissionKind.REQUEST:
+                self.communication.update_lamport_clock(message.priority)
+                request = (message.priority, message.source)
+                with self.condition:
+                    defer = self.in_critical_section or (self.requesting and self.priority < request)
+                    if defer:
+                        self.deferred.append((message.source, message.priority))
+                if not defer:
+                    self.send(message.source, PermissionKind.REPLY, message.priority)
+            case PermissionKind.REPLY:
+                with self.condition:
+                    if self.priority and message.priority == self.priority[0]:
+                        self.waiting_for.discard(message.source)
+                        if not self.waiting_for:
+                            self.condition.notify_all()
@@ -0,0 +1,123 @@
+from collections import deque
+from threading import Condition
+from Message import TokenRequestMessage, TokenGrantMessage
+from Log import get_logger
+from .AbstractMutex import AbstractMutex
+
+log = get_logger("token")
+
+class SuzukiKasami(AbstractMutex):
+    """
+    Jeton à la demande (Suzuki–Kasami).
+
+    - Un nœud qui veut la section critique diffuse une demande numérotée (N-1 messages) ;
+      s'il détient déjà le jeton, il entre sans aucun message.
+    - Le jeton porte, pour chaque nœud, le numéro de sa dernière demande satisfaite
+      et la file des demandeurs : il est envoyé directement au suivant (1 message).
+    - Au repos, aucun message ne circule.
+    """
+
+    def __init__(self, communication):
+        super().__init__(communication)
+        self.condition = Condition()
+        self.request_numbers = {}  # Dict: {nœud: plus grand numéro de demande reçu}
+        self.last_granted = None   # Jeton détenu : {nœud: dernière demande satisfaite}, None si absent
+        self.queue = None          # Jeton détenu : file des demandeurs
+        self.requesting = False
+        self.in_critical_section = False
+        self.running = False
+
+    def has_token(self):
+        return self.last_granted is not None
+
+    def start(self):
+        self.running = True
+
+    def stop(self):
+        with self.condition:
+            self.running = False
+            self.condition.notify_all()
+
+    def on_leader_elected(self):
+        """Le premier leader du cluster crée le jeton et sert les demandes déjà reçues (jamais à une réélection)"""
+        with self.condition:
+            if self.has_token():
+                return
+            self.last_granted = {}
+            self.queue = deque()
+            log.info("Leader %s initialise le jeton Suzuki–Kasami", self.communication.id)
+            self.condition.notify_all()
+            grant = None if self.requesting else self._grant_next()
+        if grant:
+            self._send(*grant)
+
+    def request(self):
+        my_id = self.communication.get_rank()  # temp_id avant l'enregistrement
+        with self.condition:
+            self.requesting = True
+            if self.has_token():
+                self.in_critical_section = True
+                return True
+            sequence_number = self.request_numbers.get(my_id, 0) + 1
+            self.request_numbers[my_id] = sequence_number
+        log.debug("Nœud %s demande le jeton (demande %s)", my_id, sequence_number)
+        self.communication.broadcast_message(
+            TokenRequestMessage(my_id, self.communication.get_clock(), sequence_number))
+        with self.condition:
+            self.condition.wait_for(lambda: not self.running or self.has_token())
+            self.in_critical_section = self.running
+            return self.in_critical_section
+
+    def release(self):
+        my_id = self.communication.get_rank()
+        with self.condition:
+            self.requesting = False
+            self.in_critical_section = False
+            if not self.has_token():
+                return
+            self.last_granted[my_id] = self.request_numbers.get(my_id, 0)
+            grant = self._grant_next()
+        if grant:
+            self._send(*grant)
+
+    def handle_message(self, message):
+        my_ids = (self.communication.id, self.communication.temp_id)
+        match message:
+            case TokenRequestMessage():
+                with self.condition:
+                    node = message.source
+                    self.request_numbers[node] = max(self.request_numbers.get(node, 0), message.sequence_number)
+                    idle = self.has_token() and not self.requesting and not self.in_critical_section
+                    grant = self._grant(node) if idle and self._is_pending(node) else None
+                if grant:
+                    self._send(*grant)
+            case TokenGrantMessage() if message.target in my_ids:
+                with self.condition:
+                    self.last_granted = dict(message.last_granted)
+                    self.queue = deque(message.queue)
+                    log.debug("Nœud %s a reçu le jeton de %s", self.communication.get_rank(), message.source)
+                    self.condition.notify_all()
+
+    def _is_pending(self, node):
+        """La dernière demande de 'node' n'a pas encore été satisfaite"""
+        return self.request_numbers.get(node, 0) == self.last_granted.get(node, 0) + 1
+
+    def _grant_next(self):
+        """Ajoute à la file du jeton les nœuds ayant une demande non satisfaite, et retire le jeton pour le premier"""
+        my_ids = (self.communication.id, self.communication.temp_id)
+        for node in sorted(self.request_numbers):
+            if node not in my_ids and node not in self.queue and self._is_pending(node):
+                self.queue.append(node)
+        return self._grant(self.queue.popleft()) if self.queue else None
+
+    def _grant(self, node):
+        """Retire le jeton de ce nœud (verrou tenu) ; l'envoi se fait hors verrou"""
+        grant = (node, self.last_granted, list(self.queue))
+        self.last_granted = None
+        self.queue = None
+        return grant
+
+    def _send(self, node, last_granted, queue):
+        log.debug("Nœud %s envoie le jeton à %s", self.communication.get_rank(), node)
+        self.communication.send_message_to(
+            node, TokenGrantMessage(self.communication.get_rank(), self.communication.get_clock(), last_granted, queue))
@@ -0,0 +1,109 @@
+from threading import Condition, Thread
+from Message import TokenMessage
+from Log import get_logger
+from .AbstractMutex import AbstractMutex
+import random
+
+log = get_logger("token")
+
+WORLD_POLL = 0.5  # Le monde change sans notification : délai de revérification quand le jeton n'a pas de voisin
+
+class TokenRing(AbstractMutex):
+    """
+    Jeton circulant sur l'anneau des IDs triés.
+
+    Un thread gestionnaire par communicateur attend sur une variable de condition :
+    - le jeton reçu est gardé si le processus l'a demandé (request() est réveillé aussitôt),
+      sinon il est transmis immédiatement au voisin suivant ;
+    - release() réveille le gestionnaire, qui transmet le jeton avant toute nouvelle
+      entrée locale (pas de famine des autres nœuds).
+    Le dispatcher ne fait que déposer le jeton : il n'est jamais bloqué.
+    """
+
+    def __init__(self, communication):
+        super().__init__(communication)
+        self.condition = Condition()
+        self.token = None               # ID du jeton détenu, None si absent
+        self.requested = False          # Le processus attend ou occupe la section critique
+        self.in_critical_section = False
+        self.passing = False            # Jeton à transmettre avant une nouvelle entrée locale
+        self.running = False
+        self.thread = Thread(target=self.run, name=f"TokenRing-{communication.temp_id}", daemon=True)
+
+    def start(self):
+        self.running = True
+        self.thread.start()
+
+    def stop(self):
+        with self.condition:
+            self.running = False
+            self.condition.notify_all()
+
+    def on_leader_elected(self):
+        """Le premier leader du cluster crée le jeton (jamais à une réélection)"""
+        with self.condition:
+            self.token = random.randint(1000, 9999)  # ID de jeton aléatoire
+            log.info("Leader %s initialise le token: %s", self.communication.id, self.token)
+            self.condition.notify_all()
+
+    def request(self):
+        with self.condition:
+            log.debug("Nœud %s demande le token", self.communication.id)
+            self.requested = True
+            self.condition.wait_for(lambda: not self.running or (self.token is not None and not self.passing))
+            self.in_critical_section = self.running
+            log.debug("Nœud %s a reçu le token %s", self.communication.id, self.token)
+            return self.in_critical_section
+
+    def release(self):
+        with self.condition:
+            log.debug("Nœud %s libère le token", self.communication.id)
+            self.requested = False
+            self.in_critical_section = False
+            self.passing = self.token is not None and self.next_neighbor() is not None
+            self.condition.notify_all()
+
+    def handle_message(self, message):
+        """Réception du jeton : déposé localement, le gestionnaire décide de le garder ou de le transmettre"""
+        if message.target != self.communication.id:
+            return  # Message pas pour nous
+        with self.condition:
+            self.token = message.token_id
+            self.condition.notify_all()
+
+    def next_neighbor(self):
+        """Prochain nœud dans l'ordre circulaire des IDs, ou None si ce nœud est seul"""
+        my_id = self.communication.id
+        others = sorted(node for node in self.communication.world if node != my_id)
+        if my_id is None or not others:
+            return None
+        following = [node for node in others if node > my_id]
+        return following[0] if following else others[0]
+
+    def _should_forward(self):
+        if self.token is None:
+            return False
+        return self.passing or (not self.requested and not self.in_critical_section)
+
+    def run(self):
+        """Thread gestionnaire : transmet le jeton dès qu'il n'est plus utile localement"""
+        while True:
+            with self.condition:
+                ready = self.condition.wait_for(lambda: not self.running or self._should_forward(), WORLD_POLL)
+                if not self.running:
+                    return
+                if not ready:
+                    continue
+                neighbor = self.next_neighbor()
+                if neighbor is None:
+                    # Seul dans le monde : le jeton reste ici, une demande locale peut le prendre
+                    self.passing = False
+                    self.condition.notify_all()
+                    self.condition.wait(WORLD_POLL)
+                    continue
+                token_id = self.token
+                self.token = None
+                self.passing = False
+            token_msg = TokenMessage(self.communication.id, self.communication.get_clock(), token_id=token_id)
+            self.communication.send_message_to(neighbor, token_msg)
+            log.debug("Nœud %s a envoyé le token au voisin %s", self.communication.id, neighbor)
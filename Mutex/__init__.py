@@ -0,0 +1,17 @@
+from .AbstractMutex import AbstractMutex
+from .LockService import LockService
+from .Maekawa import Maekawa
+from .PermissionMutex import PermissionMutex
+from .RicartAgrawala import RicartAgrawala
+from .SuzukiKasami import SuzukiKasami
+from .TokenRing import TokenRing
+
+__all__ = [
+    "AbstractMutex",
+    "LockService",
+    "Maekawa",
+    "PermissionMutex",
+    "RicartAgrawala",
+    "SuzukiKasami",
+    "TokenRing",
+]
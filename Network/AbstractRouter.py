@@ -0,0 +1,57 @@
+from abc import ABC, abstractmethod
+from threading import Lock
+
+class AbstractRouter(ABC):
+    """
+    Interface des couches de transport entre communicateurs.
+    Tient le registre local des adresses (ID permanent et temp_id) des
+    communicateurs hébergés par ce processus ; les sous-classes définissent
+    comment atteindre les autres.
+    """
+
+    def __init__(self):
+        self.endpoints = {}  # Dict: {adresse (id ou temp_id): communication}
+        self.lock = Lock()   # Verrou pour thread-safety du registre
+
+    def register(self, address, endpoint):
+        """Associe une adresse (id ou temp_id) à un communicateur"""
+        if address is None:
+            return
+        with self.lock:
+            self.endpoints[address] = endpoint
+
+    def unregister(self, address):
+        """Retire une adresse du registre"""
+        with self.lock:
+            self.endpoints.pop(address, None)
+
+    def unregister_endpoint(self, endpoint):
+        """Retire toutes les adresses d'un communicateur (à l'arrêt du nœud)"""
+        with self.lock:
+            for address in [a for a, e in self.endpoints.items() if e is endpoint]:
+                del self.endpoints[address]
+
+    def lookup(self, address):
+        """Retourne le communicateur local associé à une adresse, ou None si inconnue"""
+        with self.lock:
+            return self.endpoints.get(address)
+
+    def local_endpoints(self, exclude=None):
+        """Retourne les communicateurs locaux distincts, sauf 'exclude'"""
+        with self.lock:
+            return list({id(e): e for e in self.endpoints.values() if e is not exclude}.values())
+
+    @abstractmethod
+    def route(self, message):
+        """
+        Livre un message ciblé à son seul destinataire.
+
+        Returns:
+            True si le destinataire est connu et le message livré, False sinon
+        """
+        pass
+
+    @abstractmethod
+    def broadcast(self, message, sender=None):
+        """Livre un message à tous les communicateurs, sauf l'émetteur"""
+        pass
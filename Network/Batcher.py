@@ -0,0 +1,73 @@
+from threading import Condition, Lock, Thread
+from time import monotonic
+
+class Batcher:
+    """
+    Regroupe les messages sortants par destinataire.
+    Un lot part quand la fenêtre 'window' (secondes) du premier message est écoulée,
+    ou dès qu'il atteint 'max_batch' messages. L'ordre d'envoi vers un même
+    destinataire est conservé.
+    """
+
+    def __init__(self, send, window=0.002, max_batch=64, name="Batcher"):
+        self.send = send            # Fonction send(target, messages) appelée pour chaque lot
+        self.window = window
+        self.max_batch = max_batch
+        self.pending = {}           # Dict: {destinataire: [messages]}
+        self.deadlines = {}         # Dict: {destinataire: échéance du lot}
+        self.condition = Condition()
+        self.flush_lock = Lock()    # Un seul lot en cours d'envoi : garantit l'ordre FIFO
+        self.running = False
+        self.thread = Thread(target=self.run, name=name, daemon=True)
+
+    def start(self):
+        self.running = True
+        self.thread.start()
+
+    def stop(self):
+        """Envoie les lots en attente puis arrête le thread d'envoi"""
+        self.flush()
+        with self.condition:
+            self.running = False
+            self.condition.notify()
+
+    def add(self, target, message):
+        """Ajoute un message au lot de son destinataire"""
+        with self.condition:
+            batch = self.pending.setdefault(target, [])
+            batch.append(message)
+            if len(batch) == 1:
+                self.deadlines[target] = monotonic() + self.window
+                self.condition.notify()
+            full = len(batch) >= self.max_batch
+        if full:
+            self._flush_targets([target])
+
+    def flush(self):
+        """Envoie immédiatement tous les lots en attente"""
+        with self.condition:
+            targets = list(self.pending)
+        self._flush_targets(targets)
+
+    def _flush_targets(self, targets):
+        with self.flush_lock:
+            with self.condition:
+                batches = [(t, self.pending.pop(t)) for t in targets if t in self.pending]
+                for target, _ in batches:
+                    self.deadlines.pop(target, None)
+            for target, messages in batches:
+                self.send(target, messages)
+
+    def run(self):
+        """Envoie chaque lot à l'échéance de sa fenêtre"""
+        while True:
+            with self.condition:
+                if not self.running:
+                    break
+                now = monotonic()
+                due = [t for t, deadline in self.deadlines.items() if deadline <= now]
+                if not due:
+                    timeout = min(self.deadlines.values()) - now if self.deadlines else None
+                    self.condition.wait(timeout)
+                    continue
+            self._flush_targets(due)
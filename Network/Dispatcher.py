@@ -0,0 +1,85 @@
+from functools import partial
+from queue import SimpleQueue
+from threading import Thread, Timer, current_thread
+from Log import get_logger
+import traceback
+
+log = get_logger("network")
+
+class Dispatcher:
+    """
+    File d'entrée unique d'un nœud (modèle acteur).
+    Un seul thread vide la file dans l'ordre : messages reçus et tâches
+    planifiées (timers) ne s'exécutent jamais en parallèle sur un même nœud.
+
+    Remplace la livraison par PyBus (abonnés Mode.PARALLEL : un thread par événement
+    et par nœud), qui n'est plus disponible : ces threads modifiaient en concurrence
+    l'état du nœud (terme, monde, horloge, état Raft), et n'offraient aucun ordre FIFO.
+    Seul le Singleton de pyeventbus3 reste utilisé (Router).
+    """
+
+    def __init__(self, handler, name="Dispatcher"):
+        self.handler = handler      # Fonction appelée pour chaque message reçu
+        self.inbox = SimpleQueue()  # File des messages et tâches en attente
+        self.running = False
+        self.thread = Thread(target=self.run, name=name, daemon=True)
+
+    def start(self):
+        """Démarre la boucle de dispatch"""
+        self.running = True
+        self.thread.start()
+
+    def stop(self):
+        """Arrête la boucle de dispatch (les éléments encore en file sont abandonnés)"""
+        self.running = False
+        self.inbox.put(None)  # Réveille la boucle
+
+    def post(self, message):
+        """Dépose un message dans la file d'entrée"""
+        self.inbox.put(message)
+
+    def schedule(self, task, *args):
+        """Dépose une tâche à exécuter par le thread de dispatch"""
+        self.inbox.put(partial(task, *args))
+
+    def call_later(self, delay, task, *args):
+        """Planifie une tâche exécutée par le dispatcher après 'delay' secondes"""
+        timer = DispatchTimer(self, delay, task, args)
+        timer.start()
+        return timer
+
+    def is_dispatcher_thread(self):
+        """Retourne True si l'appelant s'exécute dans le thread de dispatch"""
+        return current_thread() is self.thread
+
+    def run(self):
+        """Boucle principale : traite les éléments un par un, dans l'ordre d'arrivée"""
+        while self.running:
+            item = self.inbox.get()
+            if item is None or not self.running:
+                break
+            try:
+                if isinstance(item, partial):
+                    item()
+                else:
+                    self.handler(item)
+            except Exception:
+                log.error("Erreur dans %s:\n%s", self.thread.name, traceback.format_exc())
+
+class DispatchTimer(Timer):
+    """Timer dont le callback est exécuté par le dispatcher, et non dans le thread du timer"""
+
+    def __init__(self, dispatcher, interval, task, args=()):
+        super().__init__(interval, dispatcher.schedule, args=(self._run_if_active,))
+        self.task = task
+        self.task_args = args
+        self.cancelled = False
+
+    def cancel(self):
+        """Annule le timer, y compris si son callback est déjà en file"""
+        self.cancelled = True
+        super().cancel()
+
+    def _run_if_active(self):
+        if not self.cancelled:
+            self.task(*self.task_args)
@@ -0,0 +1,327 @@
+from collections import deque
+from threading import Condition
+from time import monotonic
+import pickle
+import struct
+import sys
+import tempfile
+
+COMPACT_SLACK = 64  # Entrées retirées tolérées avant de reconstruire les files
+
+# Politiques de débordement d'une boîte aux lettres bornée
+BLOCK = "block"              # L'émetteur attend qu'il y ait de la place
+DROP_OLDEST = "drop_oldest"  # Le plus ancien message est supprimé pour faire de la place
+DROP_NEWEST = "drop_newest"  # Le message entrant est rejeté
+SPILL = "spill"              # Les messages en excès sont écrits sur disque, puis relus dans l'ordre
+
+POLICIES = (BLOCK, DROP_OLDEST, DROP_NEWEST, SPILL)
+
+RECORD_HEADER = struct.Struct("!I")  # Longueur d'un message écrit sur disque
+
+def message_size(message):
+    """Taille approximative d'un message en mémoire : l'objet et ses attributs (un niveau)"""
+    return sys.getsizeof(message) + sum(sys.getsizeof(value) for value in vars(message).values())
+
+class SpillFile:
+    """File FIFO de messages sérialisés dans un fichier temporaire"""
+
+    def __init__(self, directory=None):
+        self.file = tempfile.TemporaryFile(dir=directory)
+        self.read_offset = 0
+        self.write_offset = 0
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def push(self, message):
+        data = pickle.dumps(message, protocol=pickle.HIGHEST_PROTOCOL)
+        self.file.seek(self.write_offset)
+        self.file.write(RECORD_HEADER.pack(len(data)) + data)
+        self.write_offset += RECORD_HEADER.size + len(data)
+        self.count += 1
+
+    def pop(self):
+        self.file.seek(self.read_offset)
+        length = RECORD_HEADER.unpack(self.file.read(RECORD_HEADER.size))[0]
+        message = pickle.loads(self.file.read(length))
+        self.read_offset += RECORD_HEADER.size + length
+        self.count -= 1
+        if self.count == 0:
+            # Fichier vidé : on repart du début
+            self.file.truncate(0)
+            self.read_offset = self.write_offset = 0
+        return message
+
+    def close(self):
+        self.file.close()
+
+class Mailbox:
+    """
+    Boîte aux lettres d'un nœud : file FIFO (deque) protégée par une variable de condition.
+    Les lecteurs bloqués dans wait() sont réveillés dès qu'un message est déposé,
+    ou quand la boîte est fermée.
+
+    Réception sélective : chaque message est aussi indexé par émetteur (message.source)
+    et par classe exacte. Une entrée est une liste [message, présent, taille] partagée par
+    la file principale et les index ; retirer un message le marque absent, et les entrées
+    absentes sont éliminées paresseusement en tête de file (puis par compaction).
+
+    Capacité : 'capacity' (nombre de messages) et 'max_bytes' (taille approximative)
+    bornent la file en mémoire ; 'policy' choisit le comportement quand elle est pleine.
+    Avec SPILL, les messages en excès (et tous ceux qui arrivent après eux, pour garder
+    l'ordre) sont écrits sur disque, et ne deviennent visibles, y compris pour la
+    réception sélective, qu'une fois relus en mémoire.
+    """
+
+    def __init__(self, capacity=None, max_bytes=None, policy=BLOCK, spill_directory=None):
+        if policy not in POLICIES:
+            raise ValueError(f"Politique de débordement inconnue: {policy}")
+        self.messages = deque()  # Entrées [message, présent, taille], dans l'ordre d'arrivée
+        self.by_source = {}      # Dict: {source: deque d'entrées}
+        self.by_type = {}        # Dict: {classe du message: deque d'entrées}
+        self.count = 0           # Nombre de messages présents en mémoire
+        self.bytes = 0           # Taille approximative des messages présents en mémoire
+        self.condition = Condition()
+        self.closed = False
+
+        # Capacité et débordement
+        self.capacity = capacity
+        self.max_bytes = max_bytes
+        self.policy = policy
+        self.spill_directory = spill_directory
+        self.spill = None        # SpillFile, créé au premier débordement
+        self.dropped = 0         # Messages supprimés (DROP_OLDEST / DROP_NEWEST)
+        self.spilled = 0         # Messages écrits sur disque (SPILL)
+        self.overflows = 0       # Messages acceptés au-delà de la capacité (BLOCK, après délai)
+        self.blocked = 0         # Nombre d'attentes d'émetteurs (BLOCK)
+        self.blocked_time = 0.0  # Temps total passé par les émetteurs à attendre (secondes)
+
+    def __len__(self):
+        with self.condition:
+            return self.count + (len(self.spill) if self.spill else 0)
+
+    def is_bounded(self):
+        return self.capacity is not None or self.max_bytes is not None
+
+    def is_full(self, size=0):
+        """Indique si la file en mémoire ne peut pas accueillir un message de 'size' octets"""
+        if self.capacity is not None and self.count >= self.capacity:
+            return True
+        return self.max_bytes is not None and self.count > 0 and self.bytes + size > self.max_bytes
+
+    def stats(self):
+        """Compteurs de la boîte aux lettres"""
+        with self.condition:
+            return {
+                'queued': self.count,
+                'bytes': self.bytes,
+                'on_disk': len(self.spill) if self.spill else 0,
+                'dropped': self.dropped,
+                'spilled': self.spilled,
+                'overflows': self.overflows,
+                'blocked': self.blocked,
+                'blocked_time': self.blocked_time,
+            }
+
+    def put(self, message):
+        """
+        Dépose un message et réveille les lecteurs en attente.
+        Ne bloque jamais : l'attente d'un émetteur (politique BLOCK) se fait avant, avec wait_for_room().
+
+        Returns:
+            False si le message a été rejeté (DROP_NEWEST), True sinon
+        """
+        size = message_size(message) if self.max_bytes is not None else 0
+        with self.condition:
+            if self.spill:
+                self._spill(message)
+                return True
+            if self.is_full(size):
+                if self.policy == DROP_NEWEST:
+                    self.dropped += 1
+                    return False
+                if self.policy == DROP_OLDEST:
+                    while self.count and self.is_full(size):
+                        self._take(self._find(None, None, None), refill=False)
+                        self.dropped += 1
+                elif self.policy == SPILL:
+                    self._spill(message)
+                    return True
+                else:
+                    self.overflows += 1
+            self._append(message, size)
+            self.condition.notify_all()  # Les lecteurs sélectifs n'attendent pas tous le même message
+            return True
+
+    def wait_for_room(self, timeout=None):
+        """
+        Attend (politique BLOCK uniquement) que la file en mémoire ait de la place.
+        Appelé par l'émetteur avant de livrer un message : c'est lui qui est ralenti.
+
+        Returns:
+            True s'il y a de la place (ou si la boîte ne bloque pas), False si le délai a expiré
+        """
+        if self.policy != BLOCK or not self.is_bounded():
+            return True
+        with self.condition:
+            if not self.is_full() or self.closed:
+                return True
+            start = monotonic()
+            room = self.condition.wait_for(lambda: not self.is_full() or self.closed, timeout)
+            self.blocked += 1
+            self.blocked_time += monotonic() - start
+            return room
+
+    def has(self, source=None, type=None, predicate=None):
+        """Indique si un message correspond aux filtres"""
+        with self.condition:
+            return self._find(source, type, predicate) is not None
+
+    def get(self, source=None, type=None, predicate=None):
+        """
+        Retire le plus ancien message correspondant aux filtres, sans attendre.
+
+        Args:
+            source: Émetteur attendu (message.source)
+            type: Classe exacte du message
+            predicate: Fonction message -> bool
+
+        Returns:
+            Le message, ou None si aucun ne correspond
+        """
+        with self.condition:
+            entry = self._find(source, type, predicate)
+            return self._take(entry) if entry else None
+
+    def wait(self, timeout=None, source=None, type=None, predicate=None):
+        """
+        Retire le plus ancien message correspondant aux filtres, en attendant au plus
+        'timeout' secondes qu'il arrive.
+
+        Returns:
+            Le message, ou None si le délai expire ou si la boîte est fermée
+        """
+        with self.condition:
+            found = []
+            def ready():
+                entry = self._find(source, type, predicate)
+                if entry:
+                    found.append(entry)
+                return entry is not None or self.closed
+            self.condition.wait_for(ready, timeout)
+            return self._take(found[-1]) if found else None
+
+    def drain(self, max_n=None, source=None, type=None, predicate=None):
+        """Retire d'un coup jusqu'à 'max_n' messages correspondant aux filtres (tous si None), sans attendre"""
+        with self.condition:
+            entries = []
+            for entry in self._candidates(source, type):
+                if max_n is not None and len(entries) >= max_n:
+                    break
+                if entry[1] and self._matches(entry[0], source, type, predicate):
+                    entries.append(entry)
+            return [self._take(entry) for entry in entries]
+
+    def close(self):
+        """
+        Réveille les lecteurs et émetteurs en attente ; les messages restent lisibles.
+        Les messages écrits sur disque (SPILL) sont relus en mémoire, au-delà de la capacité,
+        avant de supprimer le fichier.
+        """
+        with self.condition:
+            self.closed = True
+            while self.spill:
+                message = self.spill.pop()
+                self._append(message, message_size(message) if self.max_bytes is not None else 0)
+            if self.spill is not None:
+                self.spill.close()
+                self.spill = None
+            self.condition.notify_all()
+
+    def _append(self, message, size):
+        entry = [message, True, size]
+        self.messages.append(entry)
+        self.by_source.setdefault(message.source, deque()).append(entry)
+        self.by_type.setdefault(type(message), deque()).append(entry)
+        self.count += 1
+        self.bytes += size
+
+    def _spill(self, message):
+        if self.spill is None:
+            self.spill = SpillFile(self.spill_directory)
+        self.spill.push(message)
+        self.spilled += 1
+
+    def _candidates(self, source, type):
+        """File la plus restreinte contenant tous les messages pouvant correspondre"""
+        queues = []
+        if source is not None:
+            queues.append(self.by_source.get(source, ()))
+        if type is not None:
+            queues.append(self.by_type.get(type, ()))
+        return min(queues, key=len) if queues else self.messages
+
+    def _matches(self, message, source, type, predicate):
+        return ((source is None or message.source == source)
+                and (type is None or message.__class__ is type)
+                and (predicate is None or predicate(message)))
+
+    def _find(self, source, type, predicate):
+        """Première entrée présente correspondant aux filtres, ou None"""
+        queue = self._candidates(source, type)
+        self._trim(queue)
+        if predicate is None and (source is None or type is None):
+            # Un seul critère : la tête de l'index correspond forcément
+            return queue[0] if queue else None
+        for entry in queue:
+            if entry[1] and self._matches(entry[0], source, type, predicate):
+                return entry
+        return None
+
+    def _take(self, entry, refill=True):
+        """Retire une entrée : elle est marquée absente et les têtes de file sont nettoyées"""
+        entry[1] = False
+        self.count -= 1
+        self.bytes -= entry[2]
+        message = entry[0]
+        self._trim(self.messages)
+        for index, key in ((self.by_source, message.source), (self.by_type, type(message))):
+            queue = index[key]
+            self._trim(queue)
+            if not queue:
+                del index[key]
+        if len(self.messages) > 2 * self.count + COMPACT_SLACK:
+            self._compact()
+        if refill:
+            self._refill()
+        if self.is_bounded():
+            self.condition.notify_all()  # De la place s'est libérée pour les émetteurs en attente
+        return message
+
+    def _refill(self):
+        """Relit en mémoire, dans l'ordre, les messages écrits sur disque tant qu'il y a de la place"""
+        while self.spill:
+            message = self.spill.pop()
+            self._append(message, message_size(message) if self.max_bytes is not None else 0)
+            if not self.spill:
+                self.spill.close()
+                self.spill = None
+            if self.is_full():
+                break
+
+    def _trim(self, queue):
+        """Élimine les entrées absentes en tête de file"""
+        while queue and not queue[0][1]:
+            queue.popleft()
+
+    def _compact(self):
+        """Reconstruit la file principale et les index sans les entrées absentes"""
+        self.messages = deque(entry for entry in self.messages if entry[1])
+        for index in (self.by_source, self.by_type):
+            for key in list(index):
+                queue = deque(entry for entry in index[key] if entry[1])
+                if queue:
+                    index[key] = queue
+                else:
+                    del index[key]
@@ -0,0 +1,120 @@
+from collections import deque
+from itertools import count
+
+ANY_SOURCE = -1  # Réception : n'importe quel expéditeur
+ANY_TAG = -1     # Réception : n'importe quelle étiquette
+
+COMPACT_SLACK = 64  # Entrées déjà appariées tolérées dans les index avant compactage
+
+class Envelope:
+    """Message arrivé avant la réception qui le prendra"""
+    __slots__ = ("number", "source", "tag", "payload", "matched")
+
+    def __init__(self, number, source, tag, payload):
+        self.number = number  # Ordre d'arrivée
+        self.source = source
+        self.tag = tag
+        self.payload = payload
+        self.matched = False
+
+class MatchQueue:
+    """
+    Appariement des messages point à point et des réceptions, à la MPI.
+
+    - Un message qui arrive est pris par la plus ancienne réception postée qui lui correspond ;
+      sinon il rejoint la file des messages inattendus, où la prochaine réception correspondante
+      le trouvera. Une réception postée prend le plus ancien message inattendu correspondant.
+    - Les messages d'un même couple (expéditeur, étiquette) sont appariés dans l'ordre d'arrivée,
+      les réceptions dans l'ordre où elles ont été postées.
+    - Appariement en O(1) : les réceptions attendent dans une file par clé (expéditeur ou
+      ANY_SOURCE, étiquette ou ANY_TAG), et un message n'en consulte que 4. Un message inattendu
+      est indexé par (expéditeur, étiquette), par expéditeur, par étiquette et dans l'ordre
+      d'arrivée : une réception, jokers compris, ne lit que la tête d'une file. Un message apparié
+      par un index reste dans les autres, écarté quand il arrive en tête ; les index sont
+      reconstruits quand ces entrées mortes dominent.
+
+    Une réception est un dict portant au moins 'source' et 'tag' ; la file y ajoute 'number' et
+    la marque 'matched'. Pas de verrou : l'appelant sérialise les appels.
+    """
+
+    def __init__(self):
+        self.numbers = count()
+        self.unexpected = {}      # Dict: {(expéditeur, étiquette): deque d'Envelope}
+        self.by_source = {}       # Dict: {expéditeur: deque d'Envelope} (réceptions ANY_TAG)
+        self.by_tag = {}          # Dict: {étiquette: deque d'Envelope} (réceptions ANY_SOURCE)
+        self.arrivals = deque()   # Tous les messages inattendus (réceptions ANY_SOURCE, ANY_TAG)
+        self.unexpected_count = 0
+        self.posted = {}          # Dict: {(expéditeur ou ANY_SOURCE, étiquette ou ANY_TAG): deque de réceptions}
+
+    def arrive(self, source, tag, payload):
+        """Message reçu : retourne la réception qui le prend, ou None s'il est gardé comme inattendu"""
+        best = None
+        for key in ((source, tag), (source, ANY_TAG), (ANY_SOURCE, tag), (ANY_SOURCE, ANY_TAG)):
+            queue = self.posted.get(key)
+            if queue is None:
+                continue
+            while queue and queue[0].get('cancelled'):
+                queue.popleft()
+            if not queue:
+                del self.posted[key]
+            elif best is None or queue[0]['number'] < best[1][0]['number']:
+                best = (key, queue)
+        if best:
+            key, queue = best
+            receive = queue.popleft()
+            if not queue:
+                del self.posted[key]
+            receive['matched'] = True
+            return receive
+        envelope = Envelope(next(self.numbers), source, tag, payload)
+        self.unexpected.setdefault((source, tag), deque()).append(envelope)
+        self.by_source.setdefault(source, deque()).append(envelope)
+        self.by_tag.setdefault(tag, deque()).append(envelope)
+        self.arrivals.append(envelope)
+        self.unexpected_count += 1
+        return None
+
+    def post(self, receive):
+        """Réception postée : retourne le message inattendu qu'elle prend, ou None si elle attend"""
+        source, tag = receive['source'], receive['tag']
+        if source == ANY_SOURCE and tag == ANY_TAG:
+            index, key = None, None
+        elif source == ANY_SOURCE:
+            index, key = self.by_tag, tag
+        elif tag == ANY_TAG:
+            index, key = self.by_source, source
+        else:
+            index, key = self.unexpected, (source, tag)
+        queue = self.arrivals if index is None else index.get(key)
+        while queue and queue[0].matched:
+            queue.popleft()
+        if queue:
+            envelope = queue.popleft()
+            if index is not None and not queue:
+                del index[key]
+            envelope.matched = True
+            receive['matched'] = True
+            self.unexpected_count -= 1
+            if len(self.arrivals) > 2 * self.unexpected_count + COMPACT_SLACK:
+                self._compact()
+            return envelope
+        if index is not None and queue is not None:
+            del index[key]
+        receive['number'] = next(self.numbers)
+        receive['matched'] = False
+        self.posted.setdefault((source, tag), deque()).append(receive)
+        return None
+
+    def pending(self):
+        """Réceptions postées en attente (arrêt du nœud)"""
+        return [receive for queue in self.posted.values() for receive in queue if not receive.get('cancelled')]
+
+    def _compact(self):
+        """Reconstruit les index à partir des seuls messages inattendus non appariés"""
+        live = [envelope for envelope in self.arrivals if not envelope.matched]
+        self.unexpected, self.by_source, self.by_tag = {}, {}, {}
+        self.arrivals = deque(live)
+        for envelope in live:
+            self.unexpected.setdefault((envelope.source, envelope.tag), deque()).append(envelope)
+            self.by_source.setdefault(envelope.source, deque()).append(envelope)
+            self.by_tag.setdefault(envelope.tag, deque()).append(envelope)
@@ -0,0 +1,138 @@
+from threading import Thread
+from .AbstractRouter import AbstractRouter
+from Message import MessageCodec
+import multiprocessing
+
+INVALIDATE = "invalidate"  # Élément de file (INVALIDATE, adresse) : l'adresse a changé de slot ou disparu
+
+class MultiprocessRouter(AbstractRouter):
+    """
+    Transport entre processus OS : chaque nœud tourne dans son propre processus
+    (et son propre GIL) et possède une file multiprocessing indexée par son slot.
+    Le registre adresse -> slot est partagé via un Manager et mis en cache localement ;
+    enregistrer ou retirer une adresse invalide son entrée dans le cache de tous les slots.
+    Les messages transitent encodés par le MessageCodec.
+
+    Le routeur est créé dans le processus parent, transmis aux processus fils,
+    puis chaque fils appelle bind(slot) avant de créer son communicateur.
+    """
+
+    def __init__(self, nb_slots, context=None, codec=None):
+        super().__init__()
+        self.codec = codec or MessageCodec()
+        context = context or multiprocessing.get_context()
+        self.manager = context.Manager()
+        self.addresses = self.manager.dict()  # Dict partagé: {adresse: slot}
+        self.queues = [context.Queue() for _ in range(nb_slots)]  # Une file d'entrée par slot
+        self.slot = None             # Slot du processus courant (défini par bind)
+        self.address_cache = {}      # Cache local du registre partagé
+        self.receiver = None         # Thread de réception de la file du slot
+
+    def __getstate__(self):
+        """Seuls les files et le registre partagé sont transmis aux processus fils"""
+        return {'addresses': self.addresses, 'queues': self.queues, 'codec': self.codec}
+
+    def __setstate__(self, state):
+        AbstractRouter.__init__(self)
+        self.manager = None
+        self.addresses = state['addresses']
+        self.queues = state['queues']
+        self.codec = state['codec']
+        self.slot = None
+        self.address_cache = {}
+        self.receiver = None
+
+    def bind(self, slot):
+        """Attache ce processus à son slot et démarre la réception de sa file"""
+        self.slot = slot
+        self.receiver = Thread(target=self._receive_loop, name=f"MultiprocessRouter-{slot}", daemon=True)
+        self.receiver.start()
+
+    def close(self):
+        """Arrête la réception de la file du slot et attend la fin du thread de réception"""
+        if self.slot is not None:
+            self.queues[self.slot].put(None)
+        if self.receiver:
+            self.receiver.join()
+
+    def shutdown(self):
+        """Arrête le Manager (à appeler par le processus parent, une fois les fils terminés)"""
+        if self.manager:
+            self.manager.shutdown()
+
+    def register(self, address, endpoint):
+        """Enregistre l'adresse localement et la publie dans le registre partagé"""
+        super().register(address, endpoint)
+        if address is not None:
+            self.addresses[address] = self.slot
+            self._invalidate(address)
+
+    def unregister(self, address):
+        """Retire l'adresse du registre local et du registre partagé"""
+        super().unregister(address)
+        if self.addresses.get(address) == self.slot:
+            self.addresses.pop(address, None)
+            self._invalidate(address)
+
+    def unregister_endpoint(self, endpoint):
+        """Retire toutes les adresses d'un communicateur des deux registres"""
+        with self.lock:
+            addresses = [a for a, e in self.endpoints.items() if e is endpoint]
+        for address in addresses:
+            self.unregister(address)
+
+    def _invalidate(self, address):
+        """Retire l'adresse du cache local et demande aux autres slots d'en faire autant"""
+        self.address_cache.pop(address, None)
+        for slot, queue in enumerate(self.queues):
+            if slot != self.slot:
+                queue.put((INVALIDATE, address))
+
+    def resolve(self, address):
+        """Retourne le slot d'une adresse distante, ou None si inconnue"""
+        slot = self.address_cache.get(address)
+        if slot is None:
+            slot = self.addresses.get(address)
+            if slot is not None:
+                self.address_cache[address] = slot
+        return slot
+
+    def route(self, message):
+        """Livre un message ciblé localement, ou dans la file du slot destinataire"""
+        endpoint = self.lookup(message.target)
+        if endpoint is not None:
+            endpoint.deliver(message)
+            return True
+        slot = self.resolve(message.target)
+        if slot is None:
+            return False
+        self.queues[slot].put(self.codec.encode(message))
+        return True
+
+    def broadcast(self, message, sender=None):
+        """Livre un message aux communicateurs locaux puis dans la file de chaque autre slot"""
+        for endpoint in self.local_endpoints(exclude=sender):
+            endpoint.deliver(message)
+        data = self.codec.encode(message)
+        for slot, queue in enumerate(self.queues):
+            if slot != self.slot:
+                queue.put(data)
+
+    def _receive_loop(self):
+        """Reçoit les messages de la file du slot et les livre aux communicateurs locaux"""
+        queue = self.queues[self.slot]
+        while True:
+            data = queue.get()
+            if data is None:
+                break
+            if isinstance(data, tuple):
+                self.address_cache.pop(data[1], None)  # (INVALIDATE, adresse)
+                continue
+            message = self.codec.decode(data)
+            endpoint = self.lookup(message.target) if message.target is not None else None
+            if endpoint is not None:
+                endpoint.deliver(message)
+            else:
+                # Broadcast, ou message ciblé diffusé faute d'adresse connue : chacun filtre
+                for endpoint in self.local_endpoints():
+                    endpoint.deliver(message)
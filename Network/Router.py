@@ -0,0 +1,23 @@
+from pyeventbus3.Singleton import Singleton
+from .AbstractRouter import AbstractRouter
+
+@Singleton
+class Router(AbstractRouter):
+    """
+    Transport en mémoire : tous les communicateurs vivent dans le même interpréteur.
+    Livre les messages ciblés uniquement à leur destinataire et diffuse les
+    broadcasts à tous les nœuds enregistrés.
+    """
+
+    def route(self, message):
+        """Livre un message ciblé à son seul destinataire"""
+        endpoint = self.lookup(message.target)
+        if endpoint is None:
+            return False
+        endpoint.deliver(message)
+        return True
+
+    def broadcast(self, message, sender=None):
+        """Livre un message à tous les communicateurs enregistrés, sauf l'émetteur"""
+        for endpoint in self.local_endpoints(exclude=sender):
+            endpoint.deliver(message)
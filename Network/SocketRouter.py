@@ -0,0 +1,285 @@
+from threading import Lock, Thread
+from time import sleep
+from .AbstractRouter import AbstractRouter
+from Message import MessageCodec
+import glob
+import ipaddress
+import os
+import socket
+import struct
+
+FRAME_HEADER = struct.Struct("!I")    # Longueur de la trame (entier non signé, 4 octets)
+ADDRESS_HEADER = struct.Struct("!H")  # Longueur de l'adresse d'écoute de l'émetteur
+PORT = struct.Struct("!H")
+
+def is_loopback(host):
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+def encode_address(address):
+    """Adresse d'écoute en octets, sans pickle : b"U" + chemin (Unix) ou b"T" + port + hôte (TCP)"""
+    if isinstance(address, str):
+        return b"U" + address.encode()
+    host, port = address
+    return b"T" + PORT.pack(port) + host.encode()
+
+def decode_address(data):
+    """Inverse de encode_address ; ValueError si les octets ne sont pas une adresse"""
+    kind = data[:1]
+    if kind == b"U":
+        return data[1:].decode()
+    if kind == b"T" and len(data) > 1 + PORT.size:
+        return data[1 + PORT.size:].decode(), PORT.unpack_from(data, 1)[0]
+    raise ValueError(f"Adresse d'écoute invalide: {data!r}")
+
+class SocketRouter(AbstractRouter):
+    """
+    Transport par sockets entre processus d'un même hôte : sockets Unix dans un
+    répertoire partagé, ou TCP sur loopback (base_port + slot).
+
+    - Trames préfixées par leur longueur : [longueur][adresse d'écoute de l'émetteur][message encodé par le MessageCodec]
+    - Connexions sortantes persistantes, une par pair, rétablies automatiquement
+    - Pas de registre central : l'adresse réseau d'un nœud est apprise à la réception
+      de ses messages (AliveMessage, heartbeats, RegistrationRequest...) ; un message
+      ciblé vers une adresse encore inconnue est diffusé et filtré par is_for_me
+
+    Comme MultiprocessRouter, il est créé dans le processus parent puis chaque
+    processus fils appelle bind(slot) avant de créer son communicateur.
+
+    Confiance : les payloads (et les messages sans schéma) sont décodés avec pickle, qui
+    peut exécuter du code. Tout processus capable de se connecter doit donc être de confiance :
+    en TCP, seul le loopback est accepté (ValueError sinon), et en mode Unix le répertoire
+    ne doit être accessible qu'aux nœuds (tempfile.mkdtemp le crée en 0700). Les adresses
+    d'écoute annoncées dans les trames sont décodées sans pickle, et une adresse hors du
+    répertoire ou du loopback n'est jamais apprise.
+    """
+
+    def __init__(self, directory=None, host="127.0.0.1", base_port=None, nb_slots=0, peers=(), max_retries=3, codec=None):
+        super().__init__()
+        if directory is None and not is_loopback(host):
+            raise ValueError(f"SocketRouter: TCP limité au loopback (payloads décodés avec pickle), pas {host}")
+        self.codec = codec or MessageCodec()
+        self.directory = directory   # Mode Unix : répertoire des sockets des nœuds
+        self.host = host             # Mode TCP : hôte et ports base_port + slot
+        self.base_port = base_port
+        self.nb_slots = nb_slots
+        self.seed_peers = set(peers) # Adresses de pairs connues au démarrage
+        self.max_retries = max_retries
+        self._init_runtime()
+
+    def _init_runtime(self):
+        """État propre au processus (sockets, threads, verrous) : jamais transmis aux fils"""
+        self.address = None          # Adresse d'écoute de ce processus
+        self.address_prefix = b""    # Adresse d'écoute encodée, en tête de chaque trame émise
+        self.decoded_addresses = {}  # Cache: {adresse encodée: adresse d'écoute d'un pair}
+        self.server = None
+        self.running = False
+        self.peer_addresses = {}     # Dict: {adresse de nœud (id ou temp_id): adresse réseau}
+        self.connections = {}        # Dict: {adresse réseau: socket} (pool de connexions sortantes)
+        self.send_locks = {}         # Dict: {adresse réseau: Lock} pour ne pas entrelacer les trames
+        self.pool_lock = Lock()
+
+    def __getstate__(self):
+        state = {k: v for k, v in self.__dict__.items()
+                 if k in ('directory', 'host', 'base_port', 'nb_slots', 'seed_peers', 'max_retries', 'codec')}
+        return state
+
+    def __setstate__(self, state):
+        AbstractRouter.__init__(self)
+        self.__dict__.update(state)
+        self._init_runtime()
+
+    def listen_address(self, slot):
+        """Adresse d'écoute du nœud d'un slot donné"""
+        if self.directory:
+            return os.path.join(self.directory, f"node-{slot}.sock")
+        return (self.host, self.base_port + slot)
+
+    def bind(self, slot):
+        """Ouvre le socket d'écoute du slot et démarre l'acceptation des connexions"""
+        self.address = self.listen_address(slot)
+        encoded_address = encode_address(self.address)
+        self.address_prefix = ADDRESS_HEADER.pack(len(encoded_address)) + encoded_address
+        if self.directory:
+            if os.path.exists(self.address):
+                os.unlink(self.address)
+            self.server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        else:
+            self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self.server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.server.bind(self.address)
+        self.server.listen()
+        self.running = True
+        Thread(target=self._accept_loop, name=f"SocketRouter-{slot}", daemon=True).start()
+
+    def close(self):
+        """Ferme le socket d'écoute et toutes les connexions du pool"""
+        self.running = False
+        if self.server:
+            try:
+                self.server.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            self.server.close()
+        with self.pool_lock:
+            for connection in self.connections.values():
+                connection.close()
+            self.connections.clear()
+        if self.directory and self.address and os.path.exists(self.address):
+            os.unlink(self.address)
+
+    def shutdown(self):
+        """Rien à libérer côté parent (pas de processus serveur partagé)"""
+        pass
+
+    def known_peers(self):
+        """Adresses réseau des autres nœuds : pairs initiaux, appris, et sockets du répertoire"""
+        peers = set(self.seed_peers) | set(self.peer_addresses.values())
+        if self.directory:
+            peers.update(glob.glob(os.path.join(self.directory, "*.sock")))
+        elif self.base_port is not None:
+            peers.update(self.listen_address(slot) for slot in range(self.nb_slots))
+        peers.discard(self.address)
+        return peers
+
+    def route(self, message):
+        """Livre un message ciblé localement, ou sur la connexion du pair destinataire"""
+        endpoint = self.lookup(message.target)
+        if endpoint is not None:
+            endpoint.deliver(message)
+            return True
+        peer = self.peer_addresses.get(message.target)
+        if peer is None:
+            return False
+        return self.send_frame(peer, self.encode(message))
+
+    def broadcast(self, message, sender=None):
+        """Livre un message aux communicateurs locaux puis à chaque pair connu"""
+        for endpoint in self.local_endpoints(exclude=sender):
+            endpoint.deliver(message)
+        frame = self.encode(message)
+        for peer in self.known_peers():
+            self.send_frame(peer, frame)
+
+    def encode(self, message):
+        """Construit une trame préfixée par sa longueur"""
+        data = self.address_prefix + self.codec.encode(message)
+        return FRAME_HEADER.pack(len(data)) + data
+
+    def decode(self, data):
+        """Décode le contenu d'une trame : (adresse d'écoute de l'émetteur, message)"""
+        length = ADDRESS_HEADER.unpack_from(data, 0)[0]
+        end = ADDRESS_HEADER.size + length
+        encoded_address = data[ADDRESS_HEADER.size:end]
+        if encoded_address in self.decoded_addresses:
+            address = self.decoded_addresses[encoded_address]
+        else:
+            address = self.decoded_addresses[encoded_address] = self._checked_address(encoded_address)
+        return address, self.codec.decode(data[end:])
+
+    def _checked_address(self, encoded_address):
+        """Adresse d'écoute annoncée par un pair, ou None si elle n'est pas une adresse de nœud de ce routeur"""
+        try:
+            address = decode_address(encoded_address)
+        except (ValueError, UnicodeDecodeError):
+            return None
+        if self.directory:
+            inside = isinstance(address, str) and os.path.dirname(address) == os.path.normpath(self.directory)
+            return address if inside else None
+        return address if isinstance(address, tuple) and is_loopback(address[0]) else None
+
+    def send_frame(self, peer, frame):
+        """
+        Envoie une trame sur la connexion persistante vers un pair.
+        Si une connexion du pool est rompue, elle est rouverte (jusqu'à max_retries
+        tentatives) ; un pair qui refuse une nouvelle connexion est considéré injoignable.
+
+        Returns:
+            True si la trame a été envoyée, False si le pair est injoignable
+        """
+        with self.pool_lock:
+            send_lock = self.send_locks.setdefault(peer, Lock())
+        with send_lock:
+            for attempt in range(self.max_retries):
+                with self.pool_lock:
+                    reused = peer in self.connections
+                try:
+                    self._connection(peer).sendall(frame)
+                    return True
+                except OSError:
+                    self._drop_connection(peer)
+                    if not reused or not self.running:
+                        break
+                    sleep(0.01 * (2 ** attempt))  # Attente exponentielle avant reconnexion
+        return False
+
+    def _connection(self, peer):
+        """Retourne la connexion du pool vers un pair, en l'ouvrant si nécessaire"""
+        with self.pool_lock:
+            connection = self.connections.get(peer)
+        if connection is None:
+            family = socket.AF_UNIX if isinstance(peer, str) else socket.AF_INET
+            connection = socket.socket(family, socket.SOCK_STREAM)
+            if family == socket.AF_INET:
+                connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            connection.connect(peer)
+            with self.pool_lock:
+                self.connections[peer] = connection
+        return connection
+
+    def _drop_connection(self, peer):
+        with self.pool_lock:
+            connection = self.connections.pop(peer, None)
+        if connection:
+            connection.close()
+
+    def _accept_loop(self):
+        """Accepte les connexions entrantes, une thread de lecture par connexion"""
+        while self.running:
+            try:
+                connection, _ = self.server.accept()
+            except OSError:
+                break
+            Thread(target=self._read_loop, args=(connection,), daemon=True).start()
+
+    def _read_loop(self, connection):
+        """Lit les trames d'une connexion entrante et livre les messages"""
+        with connection:
+            while self.running:
+                header = self._recv_exact(connection, FRAME_HEADER.size)
+                if header is None:
+                    break
+                data = self._recv_exact(connection, FRAME_HEADER.unpack(header)[0])
+                if data is None:
+                    break
+                sender_address, message = self.decode(data)
+                self._receive(sender_address, message)
+
+    def _recv_exact(self, connection, size):
+        """Lit exactement 'size' octets, ou retourne None si la connexion est fermée"""
+        buffer = bytearray()
+        while len(buffer) < size:
+            try:
+                chunk = connection.recv(size - len(buffer))
+            except OSError:
+                return None
+            if not chunk:
+                return None
+            buffer.extend(chunk)
+        return bytes(buffer)
+
+    def _receive(self, sender_address, message):
+        """Apprend l'adresse réseau de l'émetteur puis livre le message aux communicateurs locaux"""
+        if sender_address is not None and message.source is not None:
+            self.peer_addresses[message.source] = sender_address
+        endpoint = self.lookup(message.target) if message.target is not None else None
+        if endpoint is not None:
+            endpoint.deliver(message)
+        else:
+            # Broadcast, ou message ciblé diffusé faute d'adresse connue : chacun filtre
+            for endpoint in self.local_endpoints():
+                endpoint.deliver(message)
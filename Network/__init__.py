@@ -0,0 +1,22 @@
+from .AbstractRouter import AbstractRouter
+from .Batcher import Batcher
+from .Dispatcher import Dispatcher, DispatchTimer
+from .Mailbox import Mailbox
+from .MatchQueue import ANY_SOURCE, ANY_TAG, MatchQueue
+from .MultiprocessRouter import MultiprocessRouter
+from .Router import Router
+from .SocketRouter import SocketRouter
+
+__all__ = [
+    "AbstractRouter",
+    "Batcher",
+    "Dispatcher",
+    "DispatchTimer",
+    "Mailbox",
+    "MatchQueue",
+    "ANY_SOURCE",
+    "ANY_TAG",
+    "MultiprocessRouter",
+    "Router",
+    "SocketRouter",
+]
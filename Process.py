@@ -1,10 +1,15 @@
 from threading import Lock, Thread
-from time import sleep
+from time import sleep, time
 from Communication import Communication
+from Collective import SUM
+from Network import ANY_SOURCE, ANY_TAG
+from Log import get_logger
+
+log = get_logger("process")
 
 class Process(Thread):
 
-    def __init__(self, name):
+    def __init__(self, name, router=None, **options):
         Thread.__init__(self)
 
         self.myProcessName = name
@@ -12,7 +17,7 @@ class Process(Thread):
         self.setName("MainThread-" + name)
 
         # Communication
-        self.communication = Communication()
+        self.communication = Communication(router, **options)  # options: voir Communication.__init__
 
         #   Contrôle du thread
         self.alive = True
@@ -25,26 +30,26 @@ class Process(Thread):
         
         # Récupération de l'ID attribué
         self.myId = self.communication.get_rank()
-        print(f"[Node {self.myId}] 🚀 Démarrage")
+        log.info("[Node %s] 🚀 Démarrage", self.myId)
 
         loop = 0
+        next_round = time()
         while self.alive:
-            if self.communication.hasLetterMessage():
-                message = self.communication.retrieveLetterMessage()
-                print(f"[Node {self.myId}] 📩 Reçu: {message}")
-
+            # Attente bloquante : réveil dès qu'un message arrive, ou à la prochaine ronde
+            message = self.communication.waitLetterMessage(timeout=max(0, next_round - time()))
+            if message is not None:
+                log.debug("[Node %s] 📩 Reçu: %s", self.myId, message)
 
-            # Log périodique
-            if loop % 100 == 0:  # Toutes les secondes (10ms * 100)
+            # Ronde périodique (toutes les secondes)
+            if self.alive and time() >= next_round:
                 self.communication.requestToken()
                 sleep(0.1)  # Simuler une section critique
                 self.communication.releaseToken()
-                print(f"[Node {self.myId}] Loop {loop}")
-            
-            sleep(0.01)  # 10ms
-            loop += 1
+                log.debug("[Node %s] Loop %s", self.myId, loop)
+                next_round = time() + 1
+                loop += 1
         
-        print(f"[Node {self.myId}] 🛑 Arrêté")
+        log.info("[Node %s] 🛑 Arrêté", self.myId)
 
     def stop(self):
         self.alive = False
@@ -56,9 +61,13 @@ class Process(Thread):
     def getId(self):
         return self.communication.get_rank()
     
-    def synchronize(self, callback=None):
-        """Déclenche la synchronisation"""
-        return self.communication.synchronize(callback)
+    def synchronize(self, callback=None, timeout=None):
+        """Bloque jusqu'à la synchronisation de tous les nœuds (sans bloquer avec un callback)"""
+        return self.communication.synchronize(callback, timeout)
+
+    def synchronize_async(self, callback=None):
+        """Déclenche la synchronisation et retourne un Future (True quand tous sont synchronisés)"""
+        return self.communication.synchronize_async(callback)
     
     def broadcastSync(self, payload, from_id, callback=None):
         """
@@ -68,19 +77,81 @@ class Process(Thread):
         """
         return self.communication.broadcastSync(payload, from_id, callback)
     
-    def sendToSync(self, payload, dest_id, callback=None):
+    def broadcastTotalOrder(self, payload):
+        """
+        Diffuse un message à tous les processus (y compris celui-ci) ; tous le reçoivent,
+        en TotalOrderMessage dans leur boîte aux lettres, dans le même ordre.
+        """
+        return self.communication.broadcastTotalOrder(payload)
+    
+    def broadcastCausal(self, payload):
+        """
+        Diffuse un message à tous les processus ; un message n'est reçu (CausalMessage
+        dans la boîte aux lettres) qu'après ceux qui le précèdent causalement.
+        """
+        return self.communication.broadcastCausal(payload)
+    
+    def scatter(self, values, root=None, timeout=None):
+        """Collective : 'root' distribue values[i] au i-ème processus (monde trié) ; retourne la valeur reçue"""
+        return self.communication.scatter(values, root, timeout)
+    
+    def gather(self, value, root=None, timeout=None):
+        """Collective : 'root' reçoit la liste des valeurs de tous les processus, les autres None"""
+        return self.communication.gather(value, root, timeout)
+    
+    def reduce(self, value, op=SUM, root=None, timeout=None):
+        """Collective : 'root' reçoit la réduction des valeurs de tous les processus par 'op', les autres None"""
+        return self.communication.reduce(value, op, root, timeout)
+    
+    def allgather(self, value, timeout=None):
+        """Collective : chaque processus reçoit la liste des valeurs de tous les processus"""
+        return self.communication.allgather(value, timeout)
+    
+    def allreduce(self, value, op=SUM, timeout=None):
+        """Collective : chaque processus reçoit la réduction des valeurs de tous les processus par 'op'"""
+        return self.communication.allreduce(value, op, timeout)
+    
+    def ring_allreduce(self, array, op=SUM, timeout=None):
+        """Collective : allreduce en anneau d'un grand tableau NumPy, réparti équitablement entre les processus"""
+        return self.communication.ring_allreduce(array, op, timeout=timeout)
+    
+    def sendToSync(self, payload, dest_id, callback=None, tag=0):
         """
         Envoie un message de manière synchrone à un destinataire spécifique.
         Bloque jusqu'à ce que le destinataire ait reçu le message.
         """
-        return self.communication.sendToSync(payload, dest_id, callback)
+        return self.communication.sendToSync(payload, dest_id, callback, tag)
     
-    def receiveFromSync(self, from_id, callback=None):
+    def receiveFromSync(self, from_id=ANY_SOURCE, callback=None, tag=ANY_TAG, status=None):
         """
-        Attend de recevoir un message synchrone d'un expéditeur spécifique.
-        Bloque jusqu'à ce que le message arrive.
+        Attend de recevoir un message synchrone d'un expéditeur spécifique (ou ANY_SOURCE),
+        avec l'étiquette 'tag' (ou ANY_TAG). Bloque jusqu'à ce que le message arrive.
         """
-        return self.communication.receiveFromSync(from_id, callback)
+        return self.communication.receiveFromSync(from_id, callback, tag, status)
+    
+    def isend(self, payload, dest_id, tag=0):
+        """sendToSync non bloquant : retourne un Future (True quand le destinataire a reçu le message)"""
+        return self.communication.isend(payload, dest_id, tag)
+    
+    def irecv(self, from_id=ANY_SOURCE, tag=ANY_TAG, status=None):
+        """receiveFromSync non bloquant : retourne un Future (le payload reçu)"""
+        return self.communication.irecv(from_id, tag, status)
+    
+    def ibroadcast(self, payload, from_id):
+        """broadcastSync non bloquant : retourne un Future (True chez l'émetteur, le payload chez les récepteurs)"""
+        return self.communication.ibroadcast(payload, from_id)
+    
+    def wait_all(self, requests, timeout=None):
+        """Attend la fin de toutes les requêtes isend / irecv / ibroadcast ; retourne leurs résultats"""
+        return self.communication.wait_all(requests, timeout)
+    
+    def wait_any(self, requests, timeout=None):
+        """Attend la fin d'une des requêtes ; retourne (indice, résultat)"""
+        return self.communication.wait_any(requests, timeout)
+    
+    def test(self, request):
+        """Sans bloquer : (True, résultat) si la requête est terminée, (False, None) sinon"""
+        return self.communication.test(request)
 
     
 
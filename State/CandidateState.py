@@ -1,9 +1,11 @@
 from .StateMachine import StateMachine
 from .NodeState import NodeState
 from Message import *
-from threading import Timer
+from Log import get_logger
 import random
 
+log = get_logger("raft")
+
 class CandidateState(StateMachine):
     
     def __init__(self, communication):
@@ -25,12 +27,12 @@ class CandidateState(StateMachine):
         """Démarre une nouvelle élection"""
         # Vérifier si le nœud est toujours vivant
         if not self.communication.alive:
-            print(f"Nœud {self.communication.id} arrêté, pas d'élection")
+            log.info("Nœud %s arrêté, pas d'élection", self.communication.id)
             return
             
         # Si on est seul, devenir leader directement
         if len(self.communication.world) <= 1:
-            print(f"Nœud {self.communication.id} seul dans le monde, devient leader directement")
+            log.info("Nœud %s seul dans le monde, devient leader directement", self.communication.id)
             self.communication.transition_to_state(NodeState.LEADER)
             return
         
@@ -39,12 +41,12 @@ class CandidateState(StateMachine):
         self.communication.voted_for = self.communication.id
         self.communication.votes_received = {self.communication.id}
         
-        print(f"Nœud {self.communication.id} démarre une élection (terme {self.communication.current_term})")
+        log.info("Nœud %s démarre une élection (terme %s)", self.communication.id, self.communication.current_term)
         
         # Envoyer des demandes de vote à tous les nœuds connus
         vote_request = RequestVoteMessage(
             self.communication.id,
-            self.communication.get_lamport_timestamp(),
+            self.communication.get_clock(),
             self.communication.current_term,
             self.communication.id
         )
@@ -61,8 +63,7 @@ class CandidateState(StateMachine):
         if self.election_timeout:
             self.election_timeout.cancel()
         
-        self.election_timeout = Timer(self.election_timeout_duration, self.on_timeout)
-        self.election_timeout.start()
+        self.election_timeout = self.communication.call_later(self.election_timeout_duration, self.on_timeout)
     
     def handle_message(self, message):
         """Traite les messages reçus en tant que CANDIDATE"""
@@ -95,14 +96,14 @@ class CandidateState(StateMachine):
         
         if message.term == self.communication.current_term and message.vote_granted:
             self.communication.votes_received.add(message.source)
-            print(f"Nœud {self.communication.id} reçoit vote de {message.source} ({len(self.communication.votes_received)} votes)")
+            log.debug("Nœud %s reçoit vote de %s (%s votes)", self.communication.id, message.source, len(self.communication.votes_received))
             
             # Vérifier si on a la majorité
             majority = (len(self.communication.world) // 2) + 1
-            print(f"Majorité requise: {majority}, monde: {self.communication.world}")
+            log.debug("Majorité requise: %s, monde: %s", majority, self.communication.world)
             
             if len(self.communication.votes_received) >= majority:
-                print(f"Nœud {self.communication.id} élu LEADER avec {len(self.communication.votes_received)} votes sur {len(self.communication.world)} nœuds")
+                log.info("Nœud %s élu LEADER avec %s votes sur %s nœuds", self.communication.id, len(self.communication.votes_received), len(self.communication.world))
                 self.communication.transition_to_state(NodeState.LEADER)
     
     def handle_heartbeat(self, message):
@@ -114,9 +115,9 @@ class CandidateState(StateMachine):
             # Mettre à jour le monde avec celui reçu du leader
             if hasattr(message, 'world_nodes') and message.world_nodes:
                 self.communication.world = message.world_nodes.copy()
-                print(f"Candidat {self.communication.id} met à jour son monde: {self.communication.world}")
+                log.debug("Candidat %s met à jour son monde: %s", self.communication.id, self.communication.world)
             
-            print(f"Candidat {self.communication.id} reconnaît le leader {message.source}")
+            log.info("Candidat %s reconnaît le leader %s", self.communication.id, message.source)
             self.communication.transition_to_state(NodeState.FOLLOWER)
     
     def handle_vote_request(self, message):
@@ -129,7 +130,7 @@ class CandidateState(StateMachine):
             
             response = VoteResponseMessage(
                 self.communication.id,
-                self.communication.get_lamport_timestamp(),
+                self.communication.get_clock(),
                 self.communication.current_term,
                 True
             )
@@ -137,5 +138,5 @@ class CandidateState(StateMachine):
     
     def on_timeout(self):
         """Timeout d'élection - recommencer une élection"""
-        print(f"Nœud {self.communication.id} timeout d'élection - recommence")
+        log.info("Nœud %s timeout d'élection - recommence", self.communication.id)
         self.start_election()
\ No newline at end of file
@@ -1,9 +1,11 @@
 from .StateMachine import StateMachine
 from .NodeState import NodeState
 from Message import *
-from threading import Timer
+from Log import get_logger
 import random
 
+log = get_logger("raft")
+
 class FollowerState(StateMachine):
     
     def __init__(self, communication):
@@ -13,7 +15,7 @@ class FollowerState(StateMachine):
     
     def enter_state(self):
         """Entrée dans l'état FOLLOWER"""
-        print(f"Nœud {self.communication.id or self.communication.temp_id} entre en état FOLLOWER (terme {self.communication.current_term})")
+        log.info("Nœud %s entre en état FOLLOWER (terme %s)", self.communication.id or self.communication.temp_id, self.communication.current_term)
         self.reset_election_timeout()
     
     def cleanup(self):
@@ -29,8 +31,7 @@ class FollowerState(StateMachine):
         
         # Ne démarrer un nouveau timer que si le nœud est vivant
         if self.communication.alive:
-            self.heartbeat_timeout = Timer(self.election_timeout, self.on_timeout)
-            self.heartbeat_timeout.start()
+            self.heartbeat_timeout = self.communication.call_later(self.election_timeout, self.on_timeout)
     
     def handle_message(self, message):
         """Traite les messages reçus en tant que FOLLOWER"""
@@ -65,7 +66,7 @@ class FollowerState(StateMachine):
         
         # Vérifier que le nœud est toujours vivant avant de répondre
         if not self.communication.alive:
-            print(f"Nœud {self.communication.id or self.communication.temp_id} est arrêté, n'envoie pas de confirmation")
+            log.debug("Nœud %s est arrêté, n'envoie pas de confirmation", self.communication.id or self.communication.temp_id)
             return
             
         if message.term >= self.communication.current_term:
@@ -78,22 +79,22 @@ class FollowerState(StateMachine):
                 old_world = self.communication.world.copy()
                 self.communication.world = message.world_nodes.copy()
                 if old_world != self.communication.world:
-                    print(f"Nœud {self.communication.id or self.communication.temp_id} met à jour son monde: {old_world} -> {self.communication.world}")
+                    log.debug("Nœud %s met à jour son monde: %s -> %s", self.communication.id or self.communication.temp_id, old_world, self.communication.world)
             
             self.reset_election_timeout()
-            print(f"Nœud {self.communication.id or self.communication.temp_id} reçoit heartbeat du leader {message.source} (terme {message.term})")
+            log.debug("Nœud %s reçoit heartbeat du leader %s (terme %s)", self.communication.id or self.communication.temp_id, message.source, message.term)
             
             # Envoyer confirmation de vie au leader
             confirmation = HeartbeatConfirmationMessage(
                 self.communication.id or self.communication.temp_id,
-                self.communication.get_lamport_timestamp(),
+                self.communication.get_clock(),
                 self.communication.current_term
             )
             self.communication.send_message_to(message.source, confirmation)
-            print(f"Nœud {self.communication.id or self.communication.temp_id} envoie confirmation au leader {message.source}")
+            log.debug("Nœud %s envoie confirmation au leader %s", self.communication.id or self.communication.temp_id, message.source)
             
         elif message.term < self.communication.current_term:
-            print(f"Nœud {self.communication.id or self.communication.temp_id} ignore heartbeat obsolète du nœud {message.source} (terme {message.term} < {self.communication.current_term})")
+            log.debug("Nœud %s ignore heartbeat obsolète du nœud %s (terme %s < %s)", self.communication.id or self.communication.temp_id, message.source, message.term, self.communication.current_term)
     
     def handle_vote_request(self, message):
         """Traite une demande de vote"""
@@ -106,12 +107,12 @@ class FollowerState(StateMachine):
             self.communication.voted_for = message.candidate_id
             vote_granted = True
             self.reset_election_timeout()
-            print(f"Nœud {self.communication.id} vote pour {message.candidate_id}")
+            log.debug("Nœud %s vote pour %s", self.communication.id, message.candidate_id)
         
         # Répondre au candidat
         response = VoteResponseMessage(
             self.communication.id,
-            self.communication.get_lamport_timestamp(),
+            self.communication.get_clock(),
             self.communication.current_term,
             vote_granted
         )
@@ -123,33 +124,33 @@ class FollowerState(StateMachine):
         temp_world = getattr(self.communication, 'temp_world', set())
         temp_world.add(message.source)
         self.communication.temp_world = temp_world
-        print(f"Nœud {self.communication.temp_id} découvre le nœud temporaire {message.source}")
+        log.debug("Nœud %s découvre le nœud temporaire %s", self.communication.temp_id, message.source)
     
     def handle_id_announcement(self, message):
         """Traite une annonce d'ID pendant la phase de distribution"""
-        print(f"Nœud {self.communication.temp_id} reçoit annonce d'ID {message.proposed_id} de {message.temp_id}")
+        log.debug("Nœud %s reçoit annonce d'ID %s de %s", self.communication.temp_id, message.proposed_id, message.temp_id)
         # Cette logique sera gérée par le leader lors de la distribution
         
     def handle_id_confirmation(self, message):
         """Traite la confirmation de distribution d'ID"""
         if self.communication.temp_id in message.id_mapping:
             old_temp_id = self.communication.temp_id
-            self.communication.id = message.id_mapping[self.communication.temp_id]
+            self.communication.assign_id(message.id_mapping[self.communication.temp_id])
             self.communication.world = set(message.id_mapping.values())
             self.communication.is_registered = True
-            print(f"Nœud {old_temp_id} reçoit ID permanent {self.communication.id}")
-            print(f"Monde final: {self.communication.world}")
+            log.info("Nœud %s reçoit ID permanent %s", old_temp_id, self.communication.id)
+            log.debug("Monde final: %s", self.communication.world)
     
     def on_timeout(self):
         """Timeout d'élection - lance la phase de distribution d'ID puis devient candidat"""
         # Vérifier si le nœud est toujours vivant
         if not self.communication.alive:
-            print(f"Nœud {self.communication.id or self.communication.temp_id} arrêté, pas de timeout d'élection")
+            log.info("Nœud %s arrêté, pas de timeout d'élection", self.communication.id or self.communication.temp_id)
             return
             
         # Phase d'initialisation - distribution d'ID
         if not self.communication.is_registered and hasattr(self.communication, 'temp_world'):
-            print(f"Nœud {self.communication.temp_id} timeout d'élection - lance distribution d'ID puis élection")
+            log.info("Nœud %s timeout d'élection - lance distribution d'ID puis élection", self.communication.temp_id)
             self.communication.distribute_ids()
             return
         
@@ -157,9 +158,9 @@ class FollowerState(StateMachine):
         if self.communication.is_registered and self.communication.alive:
             # Si on est seul dans le monde, pas besoin d'élection
             if len(self.communication.world) <= 1:
-                print(f"Nœud {self.communication.id} seul dans le monde, reste en FOLLOWER")
+                log.info("Nœud %s seul dans le monde, reste en FOLLOWER", self.communication.id)
                 return
                 
             # Devenir candidat seulement si nécessaire
-            print(f"Nœud {self.communication.id} timeout d'élection - devient CANDIDAT")
+            log.info("Nœud %s timeout d'élection - devient CANDIDAT", self.communication.id)
             self.communication.transition_to_state(NodeState.CANDIDATE)
\ No newline at end of file
@@ -1,7 +1,9 @@
 from .StateMachine import StateMachine
 from .NodeState import NodeState
 from Message import *
-from threading import Timer
+from Log import get_logger
+
+log = get_logger("raft")
 
 class LeaderState(StateMachine):
     
@@ -16,8 +18,9 @@ class LeaderState(StateMachine):
     
     def enter_state(self):
         """Entrée dans l'état LEADER"""
+        bootstrap = self.communication.leader_id is None  # Aucun leader connu avant : premier leader du cluster
         self.communication.leader_id = self.communication.id
-        print(f"Nœud {self.communication.id} devient LEADER (terme {self.communication.current_term})")
+        log.info("Nœud %s devient LEADER (terme %s)", self.communication.id, self.communication.current_term)
         
         # Assurer que l'ID du leader est dans le monde
         if self.communication.id:
@@ -26,7 +29,9 @@ class LeaderState(StateMachine):
                 self.next_node_id = self.communication.id + 1
         
         self.start_heartbeat()
-        self.communication.init_token_ring()
+        if bootstrap:
+            self.communication.init_token_ring()
+        self.communication.init_sequencer()
     
     def cleanup(self):
         """Nettoie les timers avant de quitter l'état LEADER"""
@@ -37,22 +42,21 @@ class LeaderState(StateMachine):
     def start_heartbeat(self):
         """Démarre l'envoi régulier de heartbeats"""
         if not self.communication.alive:
-            print(f"Leader {self.communication.id} arrêté, pas de heartbeat")
+            log.debug("Leader %s arrêté, pas de heartbeat", self.communication.id)
             return
             
         self.send_heartbeat()
         # Programmer le prochain heartbeat seulement si toujours vivant
         if self.communication.alive:
-            self.heartbeat_timer = Timer(self.heartbeat_interval, self.start_heartbeat)
-            self.heartbeat_timer.start()
+            self.heartbeat_timer = self.communication.call_later(self.heartbeat_interval, self.start_heartbeat)
     
     def send_heartbeat(self):
         """Envoie un heartbeat en broadcast avec le monde connu"""
         if not self.communication.alive:
-            print(f"Leader {self.communication.id} arrêté, pas d'envoi de heartbeat")
+            log.debug("Leader %s arrêté, pas d'envoi de heartbeat", self.communication.id)
             return
             
-        print(f"Leader {self.communication.id} envoie heartbeat avec monde: {self.communication.world}")
+        log.debug("Leader %s envoie heartbeat avec monde: %s", self.communication.id, self.communication.world)
         
         # Réinitialiser les confirmations pour ce cycle
         self.heartbeat_confirmations = set()
@@ -61,7 +65,7 @@ class LeaderState(StateMachine):
         # Créer le heartbeat avec le monde actuel
         heartbeat = HeartbeatMessage(
             self.communication.id,
-            self.communication.get_lamport_timestamp(),
+            self.communication.get_clock(),
             self.communication.current_term,
             self.communication.world.copy()  # Inclure le monde connu
         )
@@ -71,7 +75,7 @@ class LeaderState(StateMachine):
         
         # Programmer le timeout pour vérifier les confirmations seulement si vivant
         if self.communication.alive:
-            Timer(self.heartbeat_timeout, self.check_heartbeat_responses).start()
+            self.communication.call_later(self.heartbeat_timeout, self.check_heartbeat_responses)
     
     def check_heartbeat_responses(self):
         """Vérifie les réponses de heartbeat et met à jour le monde"""
@@ -88,18 +92,18 @@ class LeaderState(StateMachine):
         missing_nodes = expected_responses - self.heartbeat_confirmations
         
         if missing_nodes:
-            print(f"Leader {self.communication.id} détecte des nœuds en panne: {missing_nodes}")
+            log.warning("Leader %s détecte des nœuds en panne: %s", self.communication.id, missing_nodes)
             
             # Retirer les nœuds en panne du monde
             for failed_node in missing_nodes:
                 self.communication.world.discard(failed_node)
             
-            print(f"Nouveau monde après détection de pannes: {self.communication.world}")
+            log.debug("Nouveau monde après détection de pannes: %s", self.communication.world)
             
             # Si le leader est seul, on peut le laisser continuer ou l'arrêter
             # Pour éviter la boucle infinie, on continue normalement
         else:
-            print(f"Leader {self.communication.id} reçoit confirmations de tous les nœuds: {self.heartbeat_confirmations}")
+            log.debug("Leader %s reçoit confirmations de tous les nœuds: %s", self.communication.id, self.heartbeat_confirmations)
     
     def handle_message(self, message):
         """Traite les messages reçus en tant que LEADER"""
@@ -121,7 +125,7 @@ class LeaderState(StateMachine):
         """Traite une confirmation de heartbeat d'un follower"""
         if self.waiting_for_confirmations:
             self.heartbeat_confirmations.add(message.source)
-            print(f"Leader {self.communication.id} reçoit confirmation de {message.source}")
+            log.debug("Leader %s reçoit confirmation de %s", self.communication.id, message.source)
     
     def handle_registration_request(self, message):
         """Traite une demande d'enregistrement d'un nouveau nœud"""
@@ -132,7 +136,7 @@ class LeaderState(StateMachine):
         # Ajouter le nouveau nœud au monde
         self.communication.world.add(new_id)
         
-        print(f"Leader {self.communication.id} assigne l'ID {new_id} au nœud {message.source}")
+        log.info("Leader %s assigne l'ID %s au nœud %s", self.communication.id, new_id, message.source)
         
         # Répondre avec l'ID assigné et l'état du monde
         response = RegistrationResponse(
@@ -168,7 +172,7 @@ class LeaderState(StateMachine):
             self.communication.voted_for = message.candidate_id
             response = VoteResponseMessage(
                 self.communication.id,
-                self.communication.get_lamport_timestamp(),
+                self.communication.get_clock(),
                 self.communication.current_term,
                 True
             )
@@ -178,11 +182,11 @@ class LeaderState(StateMachine):
         """Traite un message Alive - ajouter le nœud au monde s'il n'y est pas"""
         if message.source not in self.communication.world:
             self.communication.world.add(message.source)
-            print(f"Leader {self.communication.id} découvre le nœud {message.source}")
+            log.debug("Leader %s découvre le nœud %s", self.communication.id, message.source)
     
     def handle_new_node_discovery(self, message):
         """Traite la découverte d'un nouveau nœud qui envoie AliveMessage"""
-        print(f"Leader {self.communication.id} détecte un nouveau nœud avec temp_id {message.source}")
+        log.info("Leader %s détecte un nouveau nœud avec temp_id %s", self.communication.id, message.source)
         
         # Le nouveau nœud devrait ensuite envoyer un RegistrationRequest
         # On ne fait rien de spécial ici, on attend la demande d'enregistrement
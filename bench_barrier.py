@@ -0,0 +1,45 @@
+import statistics
+import time
+from collections import Counter
+from testing import make_nodes
+
+def count_received(router):
+    """Compte les messages reçus par chaque nœud (un broadcast compte une fois par destinataire)"""
+    received = Counter()
+    route, broadcast = router.route, router.broadcast
+    def counting_route(message):
+        received[message.target] += 1
+        return route(message)
+    def counting_broadcast(message, sender=None):
+        for endpoint in router.local_endpoints(exclude=sender):
+            received[endpoint.id] += 1
+        return broadcast(message, sender)
+    router.route, router.broadcast = counting_route, counting_broadcast
+    return received, (route, broadcast)
+
+def bench(nb_nodes, barrier, rounds=20):
+    nodes = make_nodes(nb_nodes, barrier=barrier)
+    router = nodes[0].router
+    received, originals = count_received(router)
+    latencies = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        # Chaque nœud appelle synchronize() (pour "leader", l'appel du leader suffit)
+        futures = [node.synchronize_async() for node in (nodes if barrier != "leader" else nodes[:1])]
+        for future in futures:
+            future.result(10)
+        latencies.append(time.perf_counter() - start)
+        time.sleep(0.005)
+    router.route, router.broadcast = originals
+    for node in nodes:
+        node.stop()
+    total = sum(received.values()) / rounds
+    hottest = max(received.values()) / rounds
+    print(f"{barrier:>13} {nb_nodes:>4} nœuds | latence médiane {statistics.median(latencies) * 1000:7.3f} ms"
+          f" | {total:7.1f} messages/barrière, nœud le plus chargé {hottest:5.1f}")
+
+if __name__ == "__main__":
+    print("=== Barrières (transport en mémoire) ===")
+    for barrier in ("leader", "tree", "dissemination"):
+        for nb_nodes in (4, 16, 64):
+            bench(nb_nodes, barrier)
@@ -0,0 +1,70 @@
+import contextlib
+import io
+import multiprocessing
+import shutil
+import tempfile
+import threading
+import time
+from Communication import Communication
+from Message import AliveMessage
+from Network import SocketRouter
+
+SENDER, RECEIVER = 1, 2
+
+def make_node(router, slot, node_id, options):
+    """Communicateur sans élection : ID fixé et monde {SENDER, RECEIVER}"""
+    router.bind(slot)
+    communication = Communication(router, **options)
+    communication.dispatcher.start()
+    if communication.batcher:
+        communication.batcher.start()
+    communication.assign_id(node_id)
+    communication.world = {SENDER, RECEIVER}
+    communication.is_registered = True
+    return communication
+
+def run_receiver(router, options, ready, done):
+    """Nœud récepteur : acquitte chaque sendToSync (dans son propre processus OS)"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        communication = make_node(router, 1, RECEIVER, options)
+        communication.broadcast_message(AliveMessage(RECEIVER, 0))  # Le SocketRouter de l'émetteur apprend notre adresse
+        ready.set()
+        done.wait()
+        communication.stop()
+        router.close()
+
+def bench(nb_messages, options, tcp=False):
+    """nb_messages sendToSync concurrents : temps jusqu'à réception de tous les ACK"""
+    directory = tempfile.mkdtemp(prefix="algo-distribue-bench-")
+    router = SocketRouter(base_port=47200, nb_slots=2) if tcp else SocketRouter(directory=directory)
+    ready, done = multiprocessing.Event(), multiprocessing.Event()
+    receiver = multiprocessing.Process(target=run_receiver, args=(router, options, ready, done))
+    receiver.start()
+    ready.wait()
+
+    acked = threading.Semaphore(0)
+    with contextlib.redirect_stdout(io.StringIO()):
+        communication = make_node(router, 0, SENDER, options)
+        time.sleep(0.2)  # Laisser l'AliveMessage du récepteur arriver
+        start = time.perf_counter()
+        for i in range(nb_messages):
+            communication.sendToSync({"step": i}, RECEIVER, callback=acked.release)
+        for _ in range(nb_messages):
+            acked.acquire()
+        elapsed = time.perf_counter() - start
+        done.set()
+        receiver.join()
+        communication.stop()
+        router.close()
+    shutil.rmtree(directory, ignore_errors=True)
+    return elapsed
+
+if __name__ == "__main__":
+    nb_messages = 5000
+    for tcp in (False, True):
+        for name, options in (("sans batching", {}),
+                              ("batch 1 ms / 64", {"batch_window": 0.001, "batch_size": 64}),
+                              ("batch 5 ms / 256", {"batch_window": 0.005, "batch_size": 256})):
+            elapsed = bench(nb_messages, options, tcp)
+            transport = "tcp" if tcp else "unix"
+            print(f"{transport:<5} {name:<18} {nb_messages} sendToSync + ACK en {elapsed:.3f}s : {nb_messages / elapsed:,.0f} msg/s")
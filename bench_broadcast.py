@@ -0,0 +1,65 @@
+import statistics
+import threading
+import time
+from Message import CausalMessage
+from testing import make_nodes
+
+def bench(nb_nodes, fan_out=None, rounds=50):
+    """Latence d'un broadcastSync bloquant et messages traités par l'émetteur"""
+    nodes = make_nodes(nb_nodes, broadcast_fan_out=fan_out)
+    sender = nodes[0]
+    router = sender.router
+    counter = {'messages': 0}
+    route = router.route
+    def counting_route(message):
+        if message.target == sender.id:
+            counter['messages'] += 1
+        return route(message)
+    router.route = counting_route
+
+    latencies = []
+    for i in range(rounds):
+        start = time.perf_counter()
+        sender.broadcastSync(i, sender.id)
+        latencies.append(time.perf_counter() - start)
+    router.route = route
+    for node in nodes:
+        node.stop()
+    mode = f"arbre k={fan_out}" if fan_out else "direct"
+    print(f"{mode:>10} {nb_nodes:>4} nœuds | latence médiane {statistics.median(latencies) * 1000:7.3f} ms"
+          f" | {counter['messages'] / rounds:6.1f} ACKs reçus par l'émetteur")
+
+def bench_causal(nb_nodes, rounds=500):
+    """Débit de broadcastCausal quand tous les nœuds diffusent, et profondeur de la file de rétention"""
+    nodes = make_nodes(nb_nodes)
+    def worker(node):
+        for i in range(rounds):
+            node.broadcastCausal(i)
+            node.drainLetterMessages(type=CausalMessage)
+    threads = [threading.Thread(target=worker, args=(node,)) for node in nodes]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    expected = {node.id: rounds for node in nodes}
+    while any(node.causal.delivered != expected for node in nodes):
+        time.sleep(0.001)
+    elapsed = time.perf_counter() - start
+    stats = [node.causal.stats() for node in nodes]
+    for node in nodes:
+        node.stop()
+    delays = [s['max_delay'] for s in stats]
+    print(f"{nb_nodes:>4} nœuds | {rounds / elapsed:8.0f} diffusions/s par nœud"
+          f" | retenues {sum(s['held_total'] for s in stats) / len(stats):7.1f} par nœud, profondeur max {max(s['max_held'] for s in stats):4}"
+          f" | délai max {max(delays) * 1000:6.2f} ms")
+
+if __name__ == "__main__":
+    print("=== broadcastSync (transport en mémoire) ===")
+    for nb_nodes in (8, 32, 128):
+        for fan_out in (None, 2, 4, 8):
+            bench(nb_nodes, fan_out)
+
+    print("=== broadcastCausal (transport en mémoire) ===")
+    for nb_nodes in (4, 16, 64):
+        bench_causal(nb_nodes)
@@ -0,0 +1,40 @@
+import pickle
+import time
+from Message import *
+
+def sample_messages(nb_nodes=100):
+    """Messages représentatifs du trafic d'un cluster de nb_nodes nœuds"""
+    world = set(range(1, nb_nodes + 1))
+    return [
+        HeartbeatMessage(1, 1042, 7, world),
+        HeartbeatConfirmationMessage(12, 1043, 7, target=1),
+        RequestVoteMessage(3, 88, 8, 3, target=5),
+        VoteResponseMessage(5, 89, 8, True, target=3),
+        TokenMessage(4, 120, 4821, target=5),
+        IdConfirmationMessage(12345, 4, {10000 + i: i for i in world}),
+        SendToSyncMessage(1, 200, {"step": 3, "value": 1.5}, "1-2-17", target=2),
+        BroadcastSyncAckMessage(2, 201, 1, target=1),
+    ]
+
+def bench_one(name, encode, decode, message, repeat):
+    data = encode(message)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        encode(message)
+    encode_us = (time.perf_counter() - start) / repeat * 1e6
+    start = time.perf_counter()
+    for _ in range(repeat):
+        decode(data)
+    decode_us = (time.perf_counter() - start) / repeat * 1e6
+    return len(data), encode_us, decode_us
+
+if __name__ == "__main__":
+    codec = MessageCodec()
+    protocol = pickle.HIGHEST_PROTOCOL
+    repeat = 20000
+
+    print(f"{'message':<30} {'octets codec/pickle':>20} {'encode µs codec/pickle':>24} {'decode µs codec/pickle':>24}")
+    for message in sample_messages():
+        size, enc, dec = bench_one("codec", codec.encode, codec.decode, message, repeat)
+        p_size, p_enc, p_dec = bench_one("pickle", lambda m: pickle.dumps(m, protocol=protocol), pickle.loads, message, repeat)
+        print(f"{type(message).__name__:<30} {size:>9} / {p_size:<8} {enc:>11.2f} / {p_enc:<10.2f} {dec:>11.2f} / {p_dec:<10.2f}")
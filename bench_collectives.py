@@ -0,0 +1,77 @@
+import functools
+import threading
+import time
+from Collective import SUM
+from Message import MessageCodec
+from testing import make_nodes
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+def serializing_transport(router):
+    """Encode puis décode chaque message, comme un vrai transport ; compte les octets envoyés par nœud"""
+    codec = MessageCodec()
+    sent = {}
+    route, broadcast = router.route, router.broadcast
+    def encoding_route(message):
+        data = codec.encode(message)
+        sent[message.source] = sent.get(message.source, 0) + len(data)
+        return route(codec.decode(data))
+    def encoding_broadcast(message, sender=None):
+        data = codec.encode(message)
+        endpoints = router.local_endpoints(exclude=sender)
+        sent[message.source] = sent.get(message.source, 0) + len(data) * len(endpoints)
+        for endpoint in endpoints:
+            endpoint.deliver(codec.decode(data))
+    router.route, router.broadcast = encoding_route, encoding_broadcast
+    return sent, (route, broadcast)
+
+def naive_allreduce(node, array, root=1):
+    """gather vers la racine, réduction, puis broadcastSync du résultat : tout le tableau passe par la racine"""
+    arrays = node.gather(array, root=root)
+    if node.id == root:
+        total = functools.reduce(SUM, arrays)
+        node.broadcastSync(total, root)
+        return total
+    received = []
+    done = threading.Event()
+    node.broadcastSync(None, root, callback=lambda payload: (received.append(payload), done.set()))
+    done.wait()
+    return received[0]
+
+def bench(nb_nodes, megabytes, algorithm):
+    nodes = make_nodes(nb_nodes)
+    sent, originals = serializing_transport(nodes[0].router)
+    arrays = {node.id: numpy.full(megabytes * (1 << 20) // 8, float(node.id)) for node in nodes}
+    results = {}
+    def worker(node):
+        if algorithm == "anneau":
+            results[node.id] = node.ring_allreduce(arrays[node.id])
+        else:
+            results[node.id] = naive_allreduce(node, arrays[node.id])
+    threads = [threading.Thread(target=worker, args=(node,)) for node in nodes]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    nodes[0].router.route, nodes[0].router.broadcast = originals
+    for node in nodes:
+        node.stop()
+    expected = nb_nodes * (nb_nodes + 1) / 2
+    assert all(result[0] == expected and result[-1] == expected for result in results.values())
+    size = megabytes * (1 << 20)
+    print(f"{algorithm:>22} {nb_nodes:>3} nœuds {megabytes:>4} Mo | {elapsed * 1000:8.1f} ms, {megabytes / elapsed:7.1f} Mo/s"
+          f" | envoyé par nœud : max {max(sent.values()) / size:5.2f}×, moyenne {sum(sent.values()) / nb_nodes / size:5.2f}× le tableau")
+
+if __name__ == "__main__":
+    if numpy is None:
+        raise SystemExit("Ce benchmark nécessite NumPy")
+    print("=== allreduce de grands tableaux (transport en mémoire, messages encodés) ===")
+    for nb_nodes in (4, 8):
+        for megabytes in (8, 32):
+            for algorithm in ("gather + broadcastSync", "anneau"):
+                bench(nb_nodes, megabytes, algorithm)
@@ -0,0 +1,48 @@
+import threading
+import time
+from testing import make_nodes
+from Message import BroadcastMessage
+
+def bench_thread_per_event(nodes, nb_messages):
+    """Ancien modèle : un thread par événement et par nœud (Mode.PARALLEL)"""
+    start = time.perf_counter()
+    threads = []
+    for i in range(nb_messages):
+        message = BroadcastMessage(i, 0, i)
+        for node in nodes:
+            thread = threading.Thread(target=node._dispatch_message, args=(message,))
+            thread.start()
+            threads.append(thread)
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+def bench_dispatcher(nodes, nb_messages):
+    """Nouveau modèle : une file d'entrée et un thread de dispatch par nœud"""
+    start = time.perf_counter()
+    for i in range(nb_messages):
+        message = BroadcastMessage(i, 0, i)
+        for node in nodes:
+            node.deliver(message)
+    done = [threading.Event() for _ in nodes]
+    for node, event in zip(nodes, done):
+        node.dispatcher.schedule(event.set)
+    for event in done:
+        event.wait()
+    return time.perf_counter() - start
+
+def bench(nb_nodes, nb_messages=200):
+    nodes = make_nodes(nb_nodes)
+    threaded = bench_thread_per_event(nodes, nb_messages)
+    dispatched = bench_dispatcher(nodes, nb_messages)
+    for node in nodes:
+        node.stop()
+    total = nb_nodes * nb_messages
+    print(f"{nb_nodes:>4} nœuds, {total:>6} livraisons : "
+          f"thread/événement {threaded:.3f}s ({total / threaded:,.0f} msg/s) | "
+          f"dispatcher {dispatched:.3f}s ({total / dispatched:,.0f} msg/s) | "
+          f"x{threaded / dispatched:.1f}")
+
+if __name__ == "__main__":
+    for nb_nodes in (10, 50, 100):
+        bench(nb_nodes)
@@ -0,0 +1,76 @@
+import statistics
+import threading
+import time
+from testing import make_nodes
+
+def count_messages(router):
+    """Compte les messages livrés par le routeur (un broadcast compte une fois par destinataire)"""
+    counter = {'messages': 0}
+    route, broadcast = router.route, router.broadcast
+    def counting_route(message):
+        counter['messages'] += 1
+        return route(message)
+    def counting_broadcast(message, sender=None):
+        counter['messages'] += len(router.local_endpoints(exclude=sender))  # Une livraison par destinataire
+        return broadcast(message, sender)
+    router.route, router.broadcast = counting_route, counting_broadcast
+    return counter, (route, broadcast)
+
+def bench_single_requester(nodes, rounds=50):
+    """Latence d'acquisition quand un seul nœud demande la section critique"""
+    latencies = []
+    for i in range(rounds):
+        node = nodes[i % len(nodes)]
+        start = time.perf_counter()
+        node.requestToken()
+        latencies.append(time.perf_counter() - start)
+        node.releaseToken()
+        time.sleep(0.002)
+    return latencies
+
+def bench_contention(nodes, rounds=20, hold=0.001):
+    """Tous les nœuds demandent la section critique en boucle ; vérifie l'exclusion mutuelle"""
+    inside = []
+    violations = []
+    def worker(node):
+        for _ in range(rounds):
+            node.requestToken()
+            inside.append(node.id)
+            if len(inside) > 1:
+                violations.append(list(inside))
+            time.sleep(hold)
+            inside.remove(node.id)
+            node.releaseToken()
+    threads = [threading.Thread(target=worker, args=(node,)) for node in nodes]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start, violations
+
+def bench(nb_nodes, **options):
+    nodes = make_nodes(nb_nodes, start_mutex=True, **options)
+    router = nodes[0].router
+    time.sleep(0.05)
+
+    latencies = bench_single_requester(nodes)
+    counter, originals = count_messages(router)
+    time.sleep(0.2)
+    idle_rate = counter['messages'] / 0.2
+    counter['messages'] = 0
+    elapsed, violations = bench_contention(nodes)
+    entries = nb_nodes * 20
+    router.route, router.broadcast = originals
+
+    for node in nodes:
+        node.stop()
+    print(f"{options.get('mutex', 'ring'):>15} {nb_nodes:>4} nœuds | acquisition médiane {statistics.median(latencies) * 1000:7.3f} ms"
+          f" | contention {entries / elapsed:7.1f} entrées/s, {counter['messages'] / entries:6.1f} messages/entrée"
+          f" | repos {idle_rate:8.0f} messages/s | violations {len(violations)}")
+
+if __name__ == "__main__":
+    print("=== Exclusion mutuelle (transport en mémoire) ===")
+    for mutex in ("ring", "suzuki_kasami", "ricart_agrawala", "maekawa"):
+        for nb_nodes in (4, 9, 16, 36):
+            bench(nb_nodes, mutex=mutex)
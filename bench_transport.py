@@ -0,0 +1,80 @@
+import multiprocessing
+import shutil
+import tempfile
+import threading
+import time
+from Message import AliveMessage, SendToSyncMessage
+from Network import MultiprocessRouter, Router, SocketRouter
+
+SENDER, RECEIVER = 1, 2  # Adresses des deux nœuds du benchmark
+
+class CountingEndpoint:
+    """Communicateur minimal qui compte les messages reçus"""
+    def __init__(self, expected, done):
+        self.expected = expected
+        self.done = done
+        self.count = 0
+
+    def deliver(self, message):
+        self.count += 1
+        if self.count >= self.expected:
+            self.done.set()
+
+def run_receiver(router, nb_messages, ready, done):
+    """Nœud récepteur, dans son propre processus OS"""
+    router.bind(1)
+    router.register(RECEIVER, CountingEndpoint(nb_messages, done))
+    # Annonce, comme un AliveMessage de découverte : le SocketRouter apprend notre adresse
+    router.broadcast(AliveMessage(RECEIVER, 0))
+    ready.set()
+    done.wait()
+    router.close()
+
+def send_all(router, nb_messages, payload):
+    for i in range(nb_messages):
+        router.route(SendToSyncMessage(SENDER, i, payload, f"{SENDER}-{RECEIVER}-{i}", target=RECEIVER))
+
+def bench_in_process(nb_messages, payload):
+    router = Router.Instance()
+    done = threading.Event()
+    router.register(RECEIVER, CountingEndpoint(nb_messages, done))
+    start = time.perf_counter()
+    send_all(router, nb_messages, payload)
+    done.wait()
+    elapsed = time.perf_counter() - start
+    router.unregister(RECEIVER)
+    return elapsed
+
+def bench_out_of_process(router, nb_messages, payload):
+    ready, done = multiprocessing.Event(), multiprocessing.Event()
+    hello = threading.Event()
+    router.bind(0)
+    router.register(SENDER, CountingEndpoint(1, hello))
+    receiver = multiprocessing.Process(target=run_receiver, args=(router, nb_messages, ready, done))
+    receiver.start()
+    ready.wait()
+    hello.wait(timeout=5)
+    start = time.perf_counter()
+    send_all(router, nb_messages, payload)
+    done.wait()
+    elapsed = time.perf_counter() - start
+    receiver.join()
+    router.close()
+    router.shutdown()
+    return elapsed
+
+def report(name, nb_messages, elapsed):
+    print(f"{name:<22} {nb_messages:>7} messages en {elapsed:.3f}s : {nb_messages / elapsed:>10,.0f} msg/s")
+
+if __name__ == "__main__":
+    nb_messages = 20000
+    payload = {"data": "x" * 64, "step": 0}
+
+    report("Router (mémoire)", nb_messages, bench_in_process(nb_messages, payload))
+    report("MultiprocessRouter", nb_messages, bench_out_of_process(MultiprocessRouter(2), nb_messages, payload))
+
+    directory = tempfile.mkdtemp(prefix="algo-distribue-bench-")
+    report("SocketRouter (unix)", nb_messages, bench_out_of_process(SocketRouter(directory=directory), nb_messages, payload))
+    shutil.rmtree(directory, ignore_errors=True)
+
+    report("SocketRouter (tcp)", nb_messages, bench_out_of_process(SocketRouter(base_port=47100, nb_slots=2), nb_messages, payload))
@@ -0,0 +1,81 @@
+from threading import Lock, Thread
+from time import sleep
+import random
+from testing import make_nodes
+
+def synchronize(node, timeout=5):
+    assert node.synchronize(timeout=timeout), f"Barrière bloquée sur le nœud {node.id}"
+
+def test_barriers():
+    """Test des barrières réutilisables : aucun nœud ne franchit la barrière avant l'arrivée de tous"""
+
+    print("=== Test barrières ===")
+
+    random.seed(5)
+    for barrier in ("tree", "dissemination"):
+        for nb_nodes in (1, 2, 7, 16):
+            nodes = make_nodes(nb_nodes, barrier=barrier)
+            arrivals = [0] * 10
+            lock = Lock()
+            violations = []
+            def worker(node):
+                for generation in range(10):
+                    sleep(random.random() * 0.005)
+                    with lock:
+                        arrivals[generation] += 1
+                    synchronize(node)
+                    if arrivals[generation] != nb_nodes:
+                        violations.append((node.id, generation, arrivals[generation]))
+            threads = [Thread(target=worker, args=(node,)) for node in nodes]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(30)
+            for node in nodes:
+                node.stop()
+            assert not violations, violations
+            assert all(node.barrier.generation == 10 for node in nodes)
+        print(f"✅ {barrier}: 10 barrières successives, 1 à 16 nœuds, aucune traversée anticipée")
+
+    # Barrière du leader : synchronize() depuis le leader puis depuis un follower
+    nodes = make_nodes(5)
+    synchronize(nodes[0])
+    synchronize(nodes[3])
+    synchronize(nodes[3])
+    for node in nodes:
+        node.stop()
+    print("✅ leader: synchronisations successives depuis le leader et un follower")
+
+    print("Test barrières terminé ✅")
+
+def test_synchronize_timeout_and_future():
+    """Test de synchronize(timeout=...) et synchronize_async()"""
+
+    print("=== Test synchronize bloquant / asynchrone ===")
+
+    nodes = make_nodes(3, barrier="tree")
+    assert not nodes[0].synchronize(timeout=0.2)  # Les autres n'ont pas encore appelé synchronize
+    assert nodes[0].is_synchronizing
+    print("✅ Timeout : la barrière reste en cours")
+
+    futures = [node.synchronize_async() for node in nodes[1:]]
+    assert all(future.result(5) for future in futures)
+    assert not nodes[0].is_synchronizing
+    print("✅ Les futures sont résolus quand les derniers nœuds arrivent")
+
+    stats = nodes[0].get_status()['barrier']
+    assert stats['algorithm'] == "TreeBarrier" and stats['completed'] == 1 and stats['generation'] == 1
+    assert stats['last_latency'] >= 0.2, stats
+    print(f"✅ Latence mesurée: {stats['last_latency'] * 1000:.1f} ms")
+
+    pending = nodes[1].synchronize_async()
+    for node in nodes:
+        node.stop()
+    assert pending.result(1) is False
+    print("✅ Arrêt du nœud : le future est résolu à False")
+
+    print("Test synchronize bloquant / asynchrone terminé ✅")
+
+if __name__ == "__main__":
+    test_barriers()
+    test_synchronize_timeout_and_future()
@@ -1,6 +1,7 @@
 import time
 import threading
 from Process import Process
+from testing import make_nodes
 
 def test_broadcast_sync():
     """Test de la fonction broadcastSync"""
@@ -57,8 +58,8 @@ def test_broadcast_sync():
     
     # Threads pour les récepteurs
     for i in range(1, 3):
-        def receiver_thread(idx=i-1):
-            processes[i].broadcastSync(None, sender_id, callback=receiver_callback(idx))
+        def receiver_thread(idx=i-1, process=processes[i]):
+            process.broadcastSync(None, sender_id, callback=receiver_callback(idx))
         threads.append(threading.Thread(target=receiver_thread))
     
     # Démarrer tous les threads
@@ -133,5 +134,110 @@ def test_broadcast_sync():
     
     print("Test broadcastSync terminé ✅")
 
+def test_broadcast_sync_pipelined():
+    """Test de broadcasts en rafale : plusieurs en cours par émetteur, remis dans l'ordre"""
+
+    print("=== Test broadcastSync en rafale ===")
+
+    nodes = make_nodes(4)
+    sender = nodes[0]
+    count = 2000
+    acked = []
+    received = {node.id: [] for node in nodes[1:]}
+    all_acked = threading.Event()
+
+    def on_ack(payload):
+        acked.append(payload)
+        if len(acked) == count:
+            all_acked.set()
+
+    # Les récepteurs attendent en même temps que l'émetteur envoie
+    def receiver(node):
+        for _ in range(count):
+            node.broadcastSync(None, sender.id, callback=received[node.id].append)
+    threads = [threading.Thread(target=receiver, args=(node,)) for node in nodes[1:]]
+    for thread in threads:
+        thread.start()
+    start = time.time()
+    for i in range(count):
+        sender.broadcastSync(i, sender.id, callback=on_ack)
+    assert all_acked.wait(10)
+    elapsed = time.time() - start
+    for thread in threads:
+        thread.join(10)
+
+    assert sorted(acked) == list(range(count))
+    assert all(payloads == list(range(count)) for payloads in received.values())
+    print(f"✅ {count} broadcasts acquittés en {elapsed:.2f} s, reçus dans l'ordre par {len(received)} nœuds")
+
+    # Messages arrivés avant l'appel du récepteur : gardés pour les appels suivants
+    for i in range(3):
+        sender.broadcastSync(f"tôt {i}", sender.id, callback=lambda payload: None)
+    time.sleep(0.1)
+    payloads = []
+    for _ in range(3):
+        assert nodes[1].broadcastSync(None, sender.id, callback=payloads.append)
+    assert payloads == ["tôt 0", "tôt 1", "tôt 2"], payloads
+    assert sender.broadcastSync("bloquant", sender.id)
+    print("✅ Messages arrivés avant l'appel conservés, broadcastSync bloquant acquitté")
+
+    for node in nodes:
+        node.stop()
+    print("Test broadcastSync en rafale terminé ✅")
+
+def test_broadcast_sync_tree():
+    """Test de la diffusion en arbre : ACKs agrégés, O(k) messages pour l'émetteur"""
+
+    print("=== Test broadcastSync en arbre ===")
+
+    nodes = make_nodes(20, broadcast_fan_out=3)
+    sender = nodes[4]
+    router = sender.router
+    received_by_sender = []
+    route = router.route
+    def counting_route(message):
+        if message.target == sender.id:
+            received_by_sender.append(message)
+        return route(message)
+    router.route = counting_route
+
+    count = 200
+    received = {node.id: [] for node in nodes if node is not sender}
+    def receiver(node):
+        for _ in range(count):
+            node.broadcastSync(None, sender.id, callback=received[node.id].append)
+    threads = [threading.Thread(target=receiver, args=(node,)) for node in nodes if node is not sender]
+    for thread in threads:
+        thread.start()
+    for i in range(count - 1):
+        sender.broadcastSync(i, sender.id, callback=lambda payload: None)
+    assert sender.broadcastSync(count - 1, sender.id)  # Bloquant : le dernier, donc tous, acquitté par tous
+    for thread in threads:
+        thread.join(10)
+    router.route = route
+
+    assert all(payloads == list(range(count)) for payloads in received.values())
+    assert len(received_by_sender) == 3 * count, len(received_by_sender)
+    print(f"✅ 19 récepteurs servis dans l'ordre, {len(received_by_sender) // count} ACKs par diffusion pour l'émetteur")
+
+    # Changement de monde : l'arbre est reconstruit
+    leaving = nodes.pop()
+    leaving.stop()
+    for node in nodes:
+        node.world.discard(leaving.id)
+    payloads = []
+    for node in nodes:
+        if node is not sender:
+            node.broadcastSync(None, sender.id, callback=payloads.append)
+    assert sender.broadcastSync("après départ", sender.id)
+    assert payloads == ["après départ"] * 18
+    print("✅ Arbre reconstruit après le départ d'un nœud")
+
+    for node in nodes:
+        node.stop()
+    print("Test broadcastSync en arbre terminé ✅")
+
 if __name__ == "__main__":
-    test_broadcast_sync()
\ No newline at end of file
+    test_broadcast_sync()
+    test_broadcast_sync_pipelined()
+    test_broadcast_sync_tree()
\ No newline at end of file
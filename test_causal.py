@@ -0,0 +1,102 @@
+from threading import Thread, Timer
+from time import sleep, time
+import random
+from Message import CausalMessage
+from testing import make_nodes
+
+def delay_deliveries(node, should_delay, delay):
+    """Retarde la livraison à 'node' des messages sélectionnés (réseau qui réordonne)"""
+    deliver = node.deliver
+    def delayed(message):
+        if should_delay(message):
+            Timer(delay(), deliver, [message]).start()
+        else:
+            deliver(message)
+    node.deliver = delayed
+
+def is_causal(messages):
+    """Chaque message n'est remis qu'après toutes ses dépendances"""
+    delivered = {}
+    for message in messages:
+        for node, number in message.dependencies.items():
+            expected = delivered.get(node, 0) + (1 if node == message.source else 0)
+            if number > expected:
+                return False
+        delivered[message.source] = message.dependencies[message.source]
+    return True
+
+def collect(node, expected, timeout=10):
+    messages = []
+    deadline = time() + timeout
+    while len(messages) < expected and time() < deadline:
+        messages += node.drainLetterMessages(type=CausalMessage)
+        sleep(0.005)
+    return messages
+
+def test_causal_broadcast():
+    """Test de la diffusion causale : une réponse n'est jamais remise avant sa question"""
+
+    print("=== Test diffusion causale ===")
+
+    # Les questions du nœud 1 arrivent en retard au nœud 3, pas les réponses du nœud 2.
+    # Le nœud 3 est en cours de synchronize() (barrière en arbre : il ne la franchit pas seul)
+    nodes = make_nodes(3, barrier="tree")
+    one, two, three = nodes
+    delay_deliveries(three, lambda message: isinstance(message, CausalMessage) and message.source == 1, lambda: 0.05)
+    synchronizing = three.synchronize_async()
+    try:
+        def answer():
+            for message in collect(two, 10):
+                two.broadcastCausal(f"réponse à {message.payload}")
+        answering = Thread(target=answer)
+        answering.start()
+        for i in range(10):
+            one.broadcastCausal(f"question {i}")
+        answering.join(10)
+
+        payloads = [message.payload for message in collect(three, 20)]
+        assert len(payloads) == 20, payloads
+        for i in range(10):
+            assert payloads.index(f"question {i}") < payloads.index(f"réponse à question {i}"), payloads
+        stats = three.get_status()['causal']
+        assert stats['held_total'] > 0 and stats['held'] == 0 and stats['max_delay'] > 0, stats
+        print(f"✅ Questions retardées : réponses retenues puis remises après elles ({stats['held_total']} retenues)")
+        assert three.is_synchronizing
+        assert all(future.result(5) for future in [synchronizing, one.synchronize_async(), two.synchronize_async()])
+        print("✅ Remises pendant synchronize() : aucune perdue")
+    finally:
+        for node in nodes:
+            node.stop()
+
+    # Réseau qui réordonne tout : chaque nœud diffuse en lisant ce qu'il reçoit entre deux diffusions
+    random.seed(21)
+    nodes = make_nodes(5)
+    for node in nodes:
+        delay_deliveries(node, lambda message: isinstance(message, CausalMessage), lambda: random.random() * 0.01)
+    try:
+        received = {node.id: [] for node in nodes}
+        def worker(node):
+            for i in range(40):
+                node.broadcastCausal((node.id, i))
+                # Ce qui est lu avant la diffusion suivante la précède causalement
+                received[node.id] += node.drainLetterMessages(type=CausalMessage)
+                sleep(0.001)
+        threads = [Thread(target=worker, args=(node,)) for node in nodes]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+        for node in nodes:
+            received[node.id] += collect(node, 200 - len(received[node.id]))
+            assert len(received[node.id]) == 200, len(received[node.id])
+            assert is_causal(received[node.id]), f"Ordre non causal sur le nœud {node.id}"
+            assert node.get_status()['causal']['held'] == 0
+        print("✅ 5 nœuds × 40 diffusions réordonnées : ordre causal respecté partout")
+    finally:
+        for node in nodes:
+            node.stop()
+
+    print("Test diffusion causale terminé ✅")
+
+if __name__ == "__main__":
+    test_causal_broadcast()
@@ -0,0 +1,64 @@
+from collections import deque
+from threading import Thread
+from Clock import LamportClock, VectorClock
+import random
+
+def test_lamport_clock_thread_safety():
+    """Test de l'horloge de Lamport modifiée en parallèle par plusieurs threads"""
+
+    print("=== Test LamportClock ===")
+
+    clock = LamportClock()
+    def worker():
+        for i in range(10000):
+            clock.inc()
+            clock.update(i // 2)
+    threads = [Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert clock.value == 4 * 10000 * 2, clock.value
+    print(f"✅ Aucun incrément perdu: {clock.value}")
+    print("Test LamportClock terminé ✅")
+
+def test_vector_clock_differential_encoding():
+    """Test de l'encodage différentiel : même résultat que l'envoi du vecteur complet"""
+
+    print("=== Test VectorClock ===")
+
+    random.seed(3)
+    nodes = list(range(1, 9))
+    differential = {node: VectorClock(node) for node in nodes}
+    full = {node: VectorClock(node) for node in nodes}
+    channels = {(a, b): deque() for a in nodes for b in nodes if a != b}  # Canaux FIFO
+    sent_entries = 0
+    full_entries = 0
+
+    for _ in range(5000):
+        a, b = random.sample(nodes, 2)
+        if random.random() < 0.6:
+            vector = differential[a].stamp(b)
+            sent_entries += len(vector)
+            full_vector = full[a].stamp()
+            full_entries += len(full_vector)
+            channels[(a, b)].append((vector, full_vector))
+        elif channels[(a, b)]:
+            vector, full_vector = channels[(a, b)].popleft()
+            differential[b].merge(vector)
+            full[b].merge(full_vector)
+            assert differential[b].snapshot() == full[b].snapshot()
+
+    assert sent_entries < full_entries
+    print(f"✅ Vecteurs identiques, {sent_entries} entrées envoyées au lieu de {full_entries}")
+
+    assert VectorClock.happened_before({1: 1}, {1: 2, 2: 1})
+    assert not VectorClock.happened_before({1: 2}, {1: 2})
+    assert VectorClock.concurrent({1: 1}, {2: 1})
+    print("✅ Relations de causalité")
+    print("Test VectorClock terminé ✅")
+
+if __name__ == "__main__":
+    test_lamport_clock_thread_safety()
+    test_vector_clock_differential_encoding()
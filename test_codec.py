@@ -0,0 +1,76 @@
+from Message import *
+
+def vector_stamped(message, vector):
+    message.vector = vector
+    return message
+
+def test_codec_round_trip():
+    """Test de l'encodage/décodage binaire de chaque type de message"""
+    
+    print("=== Test MessageCodec ===")
+    
+    codec = MessageCodec()
+    messages = [
+        AliveMessage(12345, 1),
+        RegistrationRequest(12345, 2, target=1),
+        RegistrationResponse(1, 3, 4, {1, 2, 3, 4}, target=12345),
+        HeartbeatMessage(1, 4, 2, {1, 2, 3}),
+        HeartbeatConfirmationMessage(2, 5, 2, target=1),
+        RequestVoteMessage(3, 6, 3, 3),
+        VoteResponseMessage(2, 7, 3, False, target=3),
+        WorldUpdateMessage(1, 8, {1, 2, 3, 40000}),
+        vector_stamped(WorldUpdateMessage(1, 8, {1, 2}, target=2), {1: 5, 2: 3, 70000: 1}),
+        IdAnnouncementMessage(12345, 9, 1, 12345),
+        IdConfirmationMessage(12345, 10, {12345: 1, 67890: 2}),
+        WorldInfoMessage(1, 11, {1, 2}),
+        SynchronizeMessage(1, 12, 3),
+        SynchronizeConfirmedMessage(2, 13, 3, target=1),
+        AllSynchronizedMessage(1, 14, 3),
+        BarrierMessage(2, 14, 3, 1, target=4),
+        TotalOrderRequestMessage(2, 30, 4, "a", target=1),
+        TotalOrderBatchMessage(1, 30, 2, 17, [2, 3], [4, 1], [30, 12], ["a", {"b": 1}]),
+        TotalOrderMessage(2, 30, 17, "a"),
+        CausalMessage(3, 31, {1: 4, 3: 2}, "réponse"),
+        CollectiveMessage(2, 32, 7, 3, {0: 1.5, 1: [2, 3]}, target=4),
+        BroadcastMessage(15, 1, ["contenu", 42]),
+        BroadcastSyncMessage(1, 16, {"clé": "valeur"}, 1, 5),
+        BroadcastSyncMessage(2, 16, [1, 2], 1, 6, 3, {1, 2, 3, 4}, target=4),
+        BroadcastSyncAckMessage(2, 17, 1, 5, target=1),
+        SendToSyncMessage(1, 18, b"\x00\x01", "1-2-1", target=2),
+        SendToSyncMessage(1, 19, "étiqueté", "1-2-2", target=2, tag=7),
+        SendToSyncAckMessage(2, 19, "1-2-1", target=1),
+        TokenMessage(1, 20, 4821, target=2),
+        TokenMessage(1, 21, None, target=2),
+        TokenRequestMessage(3, 21, 7),
+        TokenGrantMessage(1, 21, {1: 4, 2: 7, 3: 6}, [3, 2], target=3),
+        PermissionMessage(2, 21, 1, 42, target=3),
+        LockRequestMessage(2, 21, "compte/42", "r", 7, 10000, target=3),
+        LockGrantMessage(3, 21, "compte/42", 7, target=2),
+        LockReleaseMessage(2, 21, "compte/42", 7, target=3),
+        LockRenewMessage(2, 21, "compte/42", 7, 5000, target=3),
+        EnvelopeMessage(1, 22, [VoteResponseMessage(1, 22, 3, True, target=2), TokenMessage(1, 22, 7, target=2)], target=2),
+    ]
+    
+    for message in messages:
+        decoded = codec.decode(codec.encode(message))
+        assert type(decoded) is type(message), type(decoded)
+        assert vars(decoded) == vars(message), (vars(decoded), vars(message))
+        assert decoded.is_system() == message.is_system()
+        if isinstance(message, EnvelopeMessage):
+            assert [vars(m) for m in decoded.messages] == [vars(m) for m in message.messages]
+        print(f"✅ {type(message).__name__}: {len(codec.encode(message))} octets")
+    
+    # Bornes du format 64 bits : encodées telles quelles, au-delà une erreur explicite
+    limits = TokenGrantMessage(1, 23, {1: 2**63 - 1, 2: -2**63}, [3], target=3)
+    assert vars(codec.decode(codec.encode(limits))) == vars(limits)
+    try:
+        codec.encode(TokenGrantMessage(1, 23, {1: 2**64}, [3], target=3))
+        assert False, "Entier de plus de 64 bits encodé"
+    except ValueError as error:
+        assert "64 bits" in str(error), error
+    print("✅ Entiers aux bornes 64 bits, ValueError au-delà")
+    
+    print("Test MessageCodec terminé ✅")
+
+if __name__ == "__main__":
+    test_codec_round_trip()
@@ -0,0 +1,94 @@
+from math import ceil, log2, prod
+from threading import Thread
+from Collective import MAX, MIN, PROD, SUM
+from testing import make_nodes
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+def run_collective(nodes, operation):
+    """Exécute operation(node) sur tous les nœuds en parallèle ; retourne {id: résultat}"""
+    results = {}
+    def worker(node):
+        results[node.id] = operation(node)
+    threads = [Thread(target=worker, args=(node,)) for node in nodes]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+    assert len(results) == len(nodes), "Collective bloquée"
+    return results
+
+def count_sends(router):
+    """Compte les messages envoyés par chaque nœud"""
+    counter = {}
+    route = router.route
+    def counting_route(message):
+        counter[message.source] = counter.get(message.source, 0) + 1
+        return route(message)
+    router.route = counting_route
+    return counter
+
+def test_collectives():
+    """Test de scatter, gather, reduce, allgather et allreduce, N quelconque, en O(log N) tours"""
+
+    print("=== Test opérations collectives ===")
+
+    for nb_nodes in (1, 2, 5, 8, 13):
+        nodes = make_nodes(nb_nodes)
+        ids = list(range(1, nb_nodes + 1))
+        try:
+            for root in (1, nb_nodes):
+                results = run_collective(nodes, lambda node: node.scatter([i * 10 for i in ids] if node.id == root else None, root=root, timeout=5))
+                assert results == {i: i * 10 for i in ids}, results
+                results = run_collective(nodes, lambda node: node.gather(node.id * 2, root=root, timeout=5))
+                assert results[root] == [i * 2 for i in ids] and all(results[i] is None for i in ids if i != root), results
+                results = run_collective(nodes, lambda node: node.reduce(node.id, MAX, root=root, timeout=5))
+                assert results[root] == nb_nodes, results
+
+            results = run_collective(nodes, lambda node: node.allgather(str(node.id), timeout=5))
+            assert all(result == [str(i) for i in ids] for result in results.values()), results
+            for op, expected in ((SUM, sum(ids)), (PROD, prod(ids)), (MIN, 1), (MAX, nb_nodes)):
+                results = run_collective(nodes, lambda node: node.allreduce(node.id, op, timeout=5))
+                assert set(results.values()) == {expected}, (op, results)
+            results = run_collective(nodes, lambda node: node.allreduce([node.id, -node.id], timeout=5))
+            assert all(result == [sum(ids), -sum(ids)] for result in results.values()), results
+
+            # Nombre de messages envoyés par nœud : O(log N)
+            rounds = ceil(log2(nb_nodes)) if nb_nodes > 1 else 0
+            counter = count_sends(nodes[0].router)
+            run_collective(nodes, lambda node: node.allgather(node.id))
+            assert max(counter.values(), default=0) <= rounds, counter
+            counter.clear()
+            run_collective(nodes, lambda node: node.allreduce(node.id))
+            assert max(counter.values(), default=0) <= rounds + 1, counter
+            print(f"✅ {nb_nodes} nœuds : scatter, gather, reduce, allgather, allreduce ({rounds} tours)")
+        finally:
+            for node in nodes:
+                node.stop()
+
+    if numpy is None:
+        print("NumPy absent : réduction vectorisée non testée")
+    else:
+        nodes = make_nodes(6)
+        try:
+            results = run_collective(nodes, lambda node: node.allreduce(numpy.full(1000, float(node.id)), timeout=5))
+            assert all(numpy.array_equal(result, numpy.full(1000, 21.0)) for result in results.values())
+            results = run_collective(nodes, lambda node: node.reduce(numpy.arange(4) * node.id, MIN, timeout=5))
+            assert numpy.array_equal(results[1], numpy.arange(4))
+            print("✅ Tableaux NumPy : allreduce et reduce vectorisés")
+            arrays = {node.id: numpy.random.rand(101, 7) for node in nodes}
+            results = run_collective(nodes, lambda node: node.ring_allreduce(arrays[node.id], chunk_bytes=512, timeout=5))
+            assert numpy.allclose(results[1], sum(arrays.values()))
+            assert all(numpy.array_equal(result, results[1]) for result in results.values()), "Résultats différents"
+            print("✅ Ring allreduce en morceaux : même résultat sur tous les nœuds")
+        finally:
+            for node in nodes:
+                node.stop()
+
+    print("Test opérations collectives terminé ✅")
+
+if __name__ == "__main__":
+    test_collectives()
@@ -0,0 +1,146 @@
+from threading import Thread
+from time import sleep, time
+from Message import *
+from Network import Mailbox
+from Network.Mailbox import BLOCK, DROP_NEWEST, DROP_OLDEST, SPILL
+from testing import make_nodes
+
+def test_mailbox_selective_receive():
+    """Test de la réception sélective (source, type, prédicat) et de l'attente bloquante"""
+
+    print("=== Test Mailbox ===")
+
+    mailbox = Mailbox()
+    for i in range(1000):
+        mailbox.put(SendToSyncMessage(i % 10, i, i, f"{i % 10}-0-{i}", target=0))
+    mailbox.put(TokenMessage(7, 1000, 1, target=0))
+    mailbox.put(SendToSyncMessage(3, 1001, "dernier", "3-0-1001", target=0))
+
+    # Par émetteur : messages de 3 dans l'ordre d'arrivée, les autres restent en place
+    from_three = mailbox.drain(source=3)
+    assert [m.payload for m in from_three] == list(range(3, 1000, 10)) + ["dernier"]
+    assert len(mailbox) == 1001 - len(from_three) + 1
+    print(f"✅ {len(from_three)} messages de 3 retirés, {len(mailbox)} restants")
+
+    # Par type
+    token = mailbox.get(type=TokenMessage)
+    assert token.token_id == 1 and not mailbox.has(type=TokenMessage)
+    print("✅ Réception par type")
+
+    # Émetteur + prédicat
+    message = mailbox.get(source=5, predicate=lambda m: m.payload > 500)
+    assert message.payload == 505
+    assert mailbox.get().payload == 0  # La tête de file n'a pas bougé
+    print("✅ Réception par émetteur et prédicat")
+
+    # Attente sélective : réveillée par le bon message uniquement
+    results = []
+    waiter = Thread(target=lambda: results.append(mailbox.wait(2, source=42)))
+    waiter.start()
+    start = time()
+    sleep(0.05)
+    mailbox.put(SendToSyncMessage(9, 2000, "autre", "9-0-2000", target=0))
+    mailbox.put(SendToSyncMessage(42, 2001, "attendu", "42-0-2001", target=0))
+    waiter.join()
+    assert results[0].payload == "attendu" and time() - start < 1
+    print("✅ Attente sélective réveillée à l'arrivée du message")
+
+    assert mailbox.wait(0.01, source=42) is None
+    mailbox.close()
+    assert mailbox.wait(source=42) is None
+    remaining = mailbox.drain()
+    assert len(remaining) == 1001 - len(from_three) - 1 and len(mailbox) == 0
+    print(f"✅ Fermeture : {len(remaining)} messages restants vidés")
+
+    print("Test Mailbox terminé ✅")
+
+def test_mailbox_overflow_policies():
+    """Test des politiques de débordement d'une boîte aux lettres bornée"""
+
+    print("=== Test Mailbox bornée ===")
+
+    def message(i, source=1):
+        return SendToSyncMessage(source, i, i, f"{source}-0-{i}", target=0)
+
+    # DROP_NEWEST : les messages entrants sont rejetés
+    mailbox = Mailbox(capacity=3, policy=DROP_NEWEST)
+    accepted = [mailbox.put(message(i)) for i in range(5)]
+    assert accepted == [True, True, True, False, False]
+    assert [m.payload for m in mailbox.drain()] == [0, 1, 2] and mailbox.stats()['dropped'] == 2
+    print("✅ DROP_NEWEST")
+
+    # DROP_OLDEST : les plus anciens sont supprimés
+    mailbox = Mailbox(capacity=3, policy=DROP_OLDEST)
+    for i in range(5):
+        mailbox.put(message(i))
+    assert [m.payload for m in mailbox.drain()] == [2, 3, 4] and mailbox.stats()['dropped'] == 2
+    print("✅ DROP_OLDEST")
+
+    # SPILL : les messages en excès passent par le disque, l'ordre est conservé
+    mailbox = Mailbox(capacity=10, policy=SPILL)
+    for i in range(100):
+        mailbox.put(message(i, source=i % 2))
+    stats = mailbox.stats()
+    assert stats['queued'] == 10 and stats['on_disk'] == 90 and len(mailbox) == 100
+    assert [m.payload for m in mailbox.drain(source=1)] == [1, 3, 5, 7, 9]  # Seuls les messages en mémoire sont visibles
+    received = [mailbox.get().payload for _ in range(95)]
+    assert received == [i for i in range(100) if i % 2 == 0 or i > 9]
+    assert len(mailbox) == 0 and mailbox.spill is None
+    print(f"✅ SPILL: {stats['spilled']} messages écrits sur disque puis relus dans l'ordre")
+
+    # Fermeture : les messages encore sur disque sont relus, pas perdus
+    mailbox = Mailbox(capacity=10, policy=SPILL)
+    for i in range(30):
+        mailbox.put(message(i))
+    mailbox.close()
+    assert mailbox.spill is None and [m.payload for m in mailbox.drain()] == list(range(30))
+    print("✅ SPILL: messages sur disque relus à la fermeture")
+
+    # Capacité en octets
+    mailbox = Mailbox(max_bytes=4000, policy=DROP_NEWEST)
+    while mailbox.put(SendToSyncMessage(1, 0, b"x" * 1000, "1-0-0", target=0)):
+        pass
+    assert 0 < mailbox.stats()['bytes'] <= 4000 and len(mailbox) < 4
+    print(f"✅ Capacité en octets: {len(mailbox)} messages, {mailbox.stats()['bytes']} octets")
+
+    # BLOCK : l'émetteur attend que le lecteur libère de la place
+    mailbox = Mailbox(capacity=5, policy=BLOCK)
+    def producer():
+        for i in range(50):
+            mailbox.wait_for_room()
+            mailbox.put(message(i))
+    thread = Thread(target=producer)
+    thread.start()
+    received = []
+    while len(received) < 50:
+        assert len(mailbox) <= 5
+        sleep(0.001)
+        item = mailbox.wait(1)
+        received.append(item.payload)
+    thread.join()
+    stats = mailbox.stats()
+    assert received == list(range(50)) and stats['blocked'] > 0 and stats['overflows'] == 0
+    print(f"✅ BLOCK: émetteur bloqué {stats['blocked']} fois ({stats['blocked_time'] * 1000:.0f} ms)")
+
+    full = Mailbox(capacity=1, policy=BLOCK)
+    full.put(message(0))
+    assert full.wait_for_room(0.01) is False
+    print("✅ Délai d'attente de l'émetteur")
+
+    # Le trafic de contrôle, qui n'entre pas dans la boîte, n'attend jamais qu'elle se vide
+    node, = make_nodes(1, mailbox_capacity=1, mailbox_block_timeout=2)
+    try:
+        node.mailbox.put(message(0))
+        start = time()
+        node.deliver(WorldUpdateMessage(2, 0, {1, 2}))
+        node.deliver(AliveMessage(2, 0))
+        assert time() - start < 0.5 and node.mailbox.stats()['blocked'] == 0
+        print("✅ BLOCK: messages de contrôle jamais retenus")
+    finally:
+        node.stop()
+
+    print("Test Mailbox bornée terminé ✅")
+
+if __name__ == "__main__":
+    test_mailbox_selective_receive()
+    test_mailbox_overflow_policies()
@@ -0,0 +1,128 @@
+import multiprocessing
+import shutil
+import tempfile
+import time
+from Process import Process
+from Network import MultiprocessRouter, SocketRouter
+from Network.SocketRouter import encode_address
+
+def run_reporting_node(name, router, slot, stop_event, results):
+    """Nœud lancé dans son propre processus OS, qui renvoie son statut avant de s'arrêter"""
+    router.bind(slot)
+    process = Process(name, router)
+    stop_event.wait()
+    results.put(process.communication.get_status())
+    process.stop()
+    process.waitStopped()
+    router.close()
+
+def run_cluster(router, nb_nodes, name):
+    """Lance nb_nodes processus OS reliés par 'router' et retourne leurs statuts après l'élection"""
+    stop_event = multiprocessing.Event()
+    results = multiprocessing.Queue()
+    
+    nodes = []
+    for i in range(nb_nodes):
+        node = multiprocessing.Process(
+            target=run_reporting_node,
+            args=(f"{name}{i}", router, i, stop_event, results)
+        )
+        node.start()
+        nodes.append(node)
+    
+    # Attendre la découverte, la distribution d'ID et l'élection
+    print("=== Attente de l'élection du leader ===")
+    time.sleep(10)
+    stop_event.set()
+    
+    statuses = [results.get(timeout=10) for _ in range(nb_nodes)]
+    for node in nodes:
+        node.join(timeout=10)
+    router.shutdown()
+    return statuses
+
+def check_cluster(statuses, nb_nodes):
+    """Affiche les statuts et vérifie les IDs uniques et le leader commun"""
+    for status in statuses:
+        print(f"Nœud {status['id']}: état={status['state']}, leader_id={status['leader_id']}, monde={status['world']}")
+    
+    ids = [status['id'] for status in statuses]
+    leaders = {status['leader_id'] for status in statuses}
+    
+    assert all(status['is_registered'] for status in statuses), "Distribution d'ID incomplète"
+    assert None not in ids and len(set(ids)) == nb_nodes, f"IDs non uniques: {ids}"
+    print("✅ Chaque processus OS a reçu un ID unique")
+    
+    assert len(leaders) == 1, f"Pas de leader commun: {leaders}"
+    leader = leaders.pop()
+    assert leader in ids, f"Leader {leader} inconnu"
+    assert [status['id'] for status in statuses if status['state'] == "LEADER"] == [leader], "Plusieurs leaders"
+    print(f"✅ Leader commun: {leader}")
+
+def test_multiprocess_address_cache():
+    """Une adresse réenregistrée sur un autre slot n'est plus résolue vers l'ancien"""
+    router = MultiprocessRouter(3)
+    slots = []
+    for slot in range(3):
+        view = MultiprocessRouter.__new__(MultiprocessRouter)  # Vue d'un processus fils, ici dans le même processus
+        view.__setstate__(router.__getstate__())
+        view.bind(slot)
+        slots.append(view)
+    try:
+        slots[1].register(5, object())
+        assert slots[0].resolve(5) == 1
+        slots[1].unregister(5)
+        slots[2].register(5, object())
+        deadline = time.time() + 5
+        while slots[0].resolve(5) != 2 and time.time() < deadline:
+            time.sleep(0.01)
+        assert slots[0].resolve(5) == 2
+        print("✅ Cache d'adresses invalidé au réenregistrement")
+    finally:
+        for view in slots:
+            view.close()
+        router.shutdown()
+
+def test_multiprocess_transport():
+    """Test d'un cluster de 3 nœuds, chacun dans son propre processus OS, reliés par des files"""
+    print("=== Démarrage du test MultiprocessRouter ===")
+    statuses = run_cluster(MultiprocessRouter(3), 3, "MultiNode")
+    check_cluster(statuses, 3)
+    print("Test MultiprocessRouter terminé ✅")
+
+def test_socket_transport():
+    """Test d'un cluster de 3 nœuds, chacun dans son propre processus OS, reliés par des sockets Unix"""
+    print("=== Démarrage du test SocketRouter ===")
+    directory = tempfile.mkdtemp(prefix="algo-distribue-test-")
+    try:
+        statuses = run_cluster(SocketRouter(directory=directory), 3, "SocketNode")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+    check_cluster(statuses, 3)
+    print("Test SocketRouter terminé ✅")
+
+def test_socket_transport_tcp():
+    """Test d'un cluster de 3 nœuds reliés en TCP, limité au loopback"""
+    print("=== Démarrage du test SocketRouter TCP ===")
+    try:
+        SocketRouter(host="0.0.0.0", base_port=47300, nb_slots=3)
+        assert False, "TCP hors loopback accepté"
+    except ValueError:
+        print("✅ TCP hors loopback refusé")
+    
+    # Adresses d'écoute annoncées par les pairs : décodées sans pickle, apprises seulement si ce sont des nœuds
+    router = SocketRouter(base_port=47300, nb_slots=3)
+    assert router._checked_address(encode_address(("127.0.0.1", 47301))) == ("127.0.0.1", 47301)
+    assert router._checked_address(encode_address(("10.0.0.1", 47301))) is None
+    assert router._checked_address(b"\x80\x04N.") is None  # pickle.dumps(None)
+    print("✅ Adresses annoncées vérifiées")
+    
+    statuses = run_cluster(router, 3, "TcpNode")
+    check_cluster(statuses, 3)
+    print("Test SocketRouter TCP terminé ✅")
+
+if __name__ == "__main__":
+    test_multiprocess_transport()
+    test_multiprocess_address_cache()
+    test_socket_transport()
+    test_socket_transport_tcp()
@@ -0,0 +1,242 @@
+from threading import Event, Thread
+from time import sleep, time
+from Message import PermissionKind
+from Mutex import Maekawa
+from State.NodeState import NodeState
+from testing import make_nodes
+
+def run_mutex(mutex, nb_nodes=5, rounds=10):
+    """Chaque nœud entre 'rounds' fois en section critique ; retourne (entrées, violations)"""
+    nodes = make_nodes(nb_nodes, start_mutex=True, mutex=mutex)
+
+    inside = []
+    entries = []
+    violations = []
+    def worker(node):
+        for _ in range(rounds):
+            assert node.requestToken()
+            inside.append(node.id)
+            if len(inside) > 1:
+                violations.append(list(inside))
+            entries.append(node.id)
+            sleep(0.001)
+            inside.remove(node.id)
+            node.releaseToken()
+
+    threads = [Thread(target=worker, args=(node,)) for node in nodes]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+    for node in nodes:
+        node.stop()
+    return entries, violations
+
+def test_mutual_exclusion():
+    """Test de l'exclusion mutuelle de chaque moteur, sous contention"""
+
+    print("=== Test exclusion mutuelle ===")
+
+    for mutex in ("ring", "suzuki_kasami", "ricart_agrawala", "maekawa"):
+        entries, violations = run_mutex(mutex)
+        assert not violations, violations
+        assert sorted(entries) == sorted(list(range(1, 6)) * 10), entries
+        print(f"✅ {mutex}: {len(entries)} entrées, aucune violation")
+
+    print("Test exclusion mutuelle terminé ✅")
+
+class ScriptedNetwork:
+    """Réseau simulé pour Maekawa : les messages restent en file jusqu'à ce que le test les livre, dans l'ordre choisi"""
+
+    def __init__(self, clocks):
+        self.in_flight = []  # (destinataire, message)
+        self.engines = {}
+        for node, clock in clocks.items():
+            engine = Maekawa(ScriptedCommunication(self, node, set(clocks), clock))
+            engine.start()
+            self.engines[node] = engine
+
+    def deliver(self, source, target, kind):
+        """Livre le message 'kind' de 'source' vers 'target', attendu en vol"""
+        deadline = time() + 5
+        while True:
+            for index, (node, message) in enumerate(self.in_flight):
+                if node == target and message.source == source and message.kind == kind:
+                    del self.in_flight[index]  # Par position : les messages de même contenu sont égaux
+                    self.engines[target].handle_message(message)
+                    return
+            assert time() < deadline, f"{kind.name} {source} -> {target} jamais envoyé"
+            sleep(0.001)
+
+class ScriptedCommunication:
+    def __init__(self, network, node, world, clock):
+        self.network, self.id, self.world, self.clock = network, node, world, clock
+        self.dispatcher = self  # Messages à soi-même : en vol comme les autres
+
+    def inc_clock(self):
+        return self.clock  # Priorité fixée par le test
+
+    def get_clock(self):
+        return self.clock
+
+    def update_lamport_clock(self, timestamp):
+        pass
+
+    def send_message_to(self, node, message):
+        self.network.in_flight.append((node, message))
+
+    def schedule(self, handler, message):
+        self.send_message_to(self.id, message)
+
+def test_maekawa_displaced_head_fails():
+    """Maekawa : une demande délogée de la tête d'une file d'arbitre reçoit FAILED, sinon interblocage"""
+
+    print("=== Test Maekawa : tête de file délogée ===")
+
+    # 4 nœuds, grille 2×2 : quorums 1:{1,2,3}, 2:{1,2,4}, 3:{1,3,4}. Priorités A=1 > B=2 > C=3
+    network = ScriptedNetwork({1: 1, 2: 2, 3: 3, 4: 4})
+    A, B, C = 1, 2, 3
+    entered = {node: Event() for node in (A, B, C)}
+    def requester(node):
+        assert network.engines[node].request()
+        entered[node].set()
+    for node in (C, B, A):
+        Thread(target=requester, args=(node,), daemon=True).start()
+
+    REQUEST = PermissionKind.REQUEST
+    network.deliver(C, 1, REQUEST)  # L'arbitre 1 vote pour C
+    network.deliver(B, 1, REQUEST)  # B, prioritaire, en tête : INQUIRE vers C
+    network.deliver(A, 1, REQUEST)  # A déloge B de la tête, INQUIRE déjà en cours : B doit recevoir FAILED
+    network.deliver(B, 2, REQUEST)  # B obtient les votes de 2 et 4
+    network.deliver(B, 4, REQUEST)
+    network.deliver(A, 2, REQUEST)  # A attend 2, tenu par B : INQUIRE vers B
+    network.deliver(A, 3, REQUEST)
+    network.deliver(C, 3, REQUEST)  # C reçoit FAILED de 3 et 4 : il rendra le vote de 1
+    network.deliver(C, 4, REQUEST)
+
+    # Le reste dans l'ordre d'envoi ; chaque nœud sort de section critique dès qu'il y entre
+    done = set()
+    deadline = time() + 5
+    while len(done) < 3 and time() < deadline:
+        for node in (A, B, C):
+            if entered[node].is_set() and node not in done:
+                done.add(node)
+                network.engines[node].release()
+        if network.in_flight:
+            target, message = network.in_flight.pop(0)
+            network.engines[target].handle_message(message)
+        else:
+            sleep(0.001)
+    assert done == {A, B, C}, f"Interblocage : seuls {sorted(done)} sont entrés en section critique"
+    print("✅ FAILED envoyé à la tête délogée : A, B et C entrent tour à tour")
+
+    print("Test Maekawa terminé ✅")
+
+def test_reelection_keeps_single_token():
+    """Un leader réélu ne crée pas de second jeton pendant qu'un autre nœud le détient"""
+
+    print("=== Test réélection et jeton unique ===")
+
+    for mutex in ("ring", "suzuki_kasami"):
+        nodes = make_nodes(3, start_mutex=True, mutex=mutex)
+        one, _, three = nodes
+        try:
+            assert one.requestToken()  # L'ancien leader détient le jeton, en section critique
+            three.transition_to_state(NodeState.LEADER)  # Réélection : le nœud 3 succède au leader 1
+            entered = Event()
+            def waiter():
+                if three.requestToken():
+                    entered.set()
+            Thread(target=waiter, daemon=True).start()
+            assert not entered.wait(0.3), f"{mutex}: deux nœuds en section critique après la réélection"
+            one.releaseToken()
+            assert entered.wait(5), f"{mutex}: jeton jamais transmis au nouveau leader"
+            three.releaseToken()
+            print(f"✅ {mutex}: réélection sans second jeton")
+        finally:
+            for node in nodes:
+                node.stop()
+
+    print("Test réélection et jeton unique terminé ✅")
+
+def test_lock_service():
+    """Test des verrous nommés : lecteurs partagés, rédacteur exclusif, bail, milliers de clés"""
+
+    print("=== Test verrous nommés ===")
+
+    for placement in ("sharded", "leader"):
+        nodes = make_nodes(4, start_mutex=True, lock_placement=placement)
+        a, b, c, d = nodes
+
+        assert a.acquire("fichier", mode="r") and b.acquire("fichier", mode="r", timeout=1)
+        assert not c.acquire("fichier", mode="w", timeout=0.2)
+        a.release("fichier")
+        b.release("fichier")
+        assert c.acquire("fichier", mode="w", timeout=1)
+        c.release("fichier")
+        print(f"✅ {placement}: lecteurs partagés, rédacteur exclusif")
+
+        # Un détenteur qui ne libère jamais (nœud mort) : le bail libère le verrou
+        assert d.acquire("orphelin", lease=0.3)
+        start = time()
+        assert a.acquire("orphelin", timeout=2)
+        assert 0.2 < time() - start < 1.5, time() - start
+        assert not d.locks.holds("orphelin") and a.locks.holds("orphelin")
+        a.release("orphelin")
+        print(f"✅ {placement}: verrou libéré à l'expiration du bail")
+
+        # Un détenteur vivant prolonge son bail : le verrou n'est pas libéré sous lui
+        assert d.acquire("prolongé", lease=0.3)
+        for _ in range(4):
+            sleep(0.15)
+            assert d.renew("prolongé")
+        assert not a.acquire("prolongé", timeout=0.1)
+        assert d.locks.holds("prolongé")
+        d.release("prolongé")
+        assert a.acquire("prolongé", timeout=1)
+        a.release("prolongé")
+        # Sans bail (par défaut), le verrou n'expire jamais
+        assert d.acquire("sans-bail")
+        assert not a.acquire("sans-bail", timeout=0.4)
+        d.release("sans-bail")
+        print(f"✅ {placement}: bail prolongé par renew, aucun bail par défaut")
+
+        # Compteur partagé incrémenté sous verrou d'écriture
+        counter = [0]
+        def increment(node):
+            for _ in range(20):
+                assert node.acquire("compteur")
+                value = counter[0]
+                sleep(0.0005)
+                counter[0] = value + 1
+                node.release("compteur")
+        # Chaque nœud tient 1000 clés distinctes en même temps
+        def hold_many(node):
+            names = [f"n{node.id}/clé{i}" for i in range(1000)]
+            for name in names:
+                assert node.acquire(name, timeout=5)
+            for name in names:
+                node.release(name)
+        threads = [Thread(target=task, args=(node,)) for node in nodes for task in (increment, hold_many)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(30)
+        assert counter[0] == 80, counter[0]
+        print(f"✅ {placement}: compteur partagé exact, 4000 clés tenues simultanément")
+
+        # Les dernières libérations peuvent encore être en route vers leur gestionnaire
+        deadline = time() + 2
+        while any(node.locks.entries for node in nodes) and time() < deadline:
+            sleep(0.01)
+        assert all(not node.locks.entries for node in nodes)
+        for node in nodes:
+            node.stop()
+
+    print("Test verrous nommés terminé ✅")
+
+if __name__ == "__main__":
+    test_mutual_exclusion()
+    test_maekawa_displaced_head_fails()
+    test_reelection_keeps_single_token()
+    test_lock_service()
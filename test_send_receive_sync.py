@@ -1,6 +1,9 @@
 import time
 import threading
+from concurrent.futures import CancelledError
+from Network import ANY_SOURCE, ANY_TAG, MatchQueue
 from Process import Process
+from testing import make_nodes
 
 def test_send_receive_sync():
     """Test des communications synchrones point-à-point"""
@@ -177,5 +180,123 @@ def test_send_receive_sync():
     
     print("✅ Test terminé!")
 
+def test_send_receive_sync_matching():
+    """Test de l'appariement à la MPI : messages inattendus, étiquettes, jokers, réceptions multiples"""
+
+    print("=== Test appariement sendToSync/receiveFromSync ===")
+
+    nodes = make_nodes(3)
+    a, b, c = nodes
+    try:
+        # Message arrivé avant receiveFromSync : gardé au lieu d'être perdu
+        assert a.sendToSync("tôt", b.id)
+        assert b.receiveFromSync(a.id) == "tôt"
+        print("✅ Message arrivé avant la réception conservé")
+
+        # Étiquettes : chaque réception prend le message de son étiquette, dans l'ordre d'arrivée
+        for i in range(100):
+            assert a.sendToSync(("x", i), b.id, tag=1)
+        assert a.sendToSync("y", b.id, tag=2)
+        assert b.receiveFromSync(a.id, tag=2) == "y"
+        assert [b.receiveFromSync(a.id, tag=1) for _ in range(100)] == [("x", i) for i in range(100)]
+        print("✅ Étiquettes séparées, ordre FIFO par (expéditeur, étiquette)")
+
+        # Jokers : ANY_SOURCE et ANY_TAG, avec l'expéditeur et l'étiquette dans 'status'
+        assert a.sendToSync("de a", c.id, tag=5) and b.sendToSync("de b", c.id, tag=6)
+        statuses = [{}, {}]
+        payloads = [c.receiveFromSync(ANY_SOURCE, status=status) for status in statuses]
+        assert payloads == ["de a", "de b"], payloads
+        assert statuses == [{'source': a.id, 'tag': 5}, {'source': b.id, 'tag': 6}], statuses
+        print("✅ ANY_SOURCE / ANY_TAG, expéditeur et étiquette rendus dans status")
+
+        # Plusieurs conversations simultanées entre les mêmes nœuds : une réception par étiquette
+        received = {}
+        def receiver(tag):
+            received[tag] = b.receiveFromSync(a.id, tag=tag)
+        threads = [threading.Thread(target=receiver, args=(tag,)) for tag in range(10)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.1)
+        for tag in reversed(range(10)):
+            assert a.sendToSync(f"conversation {tag}", b.id, tag=tag)
+        for thread in threads:
+            thread.join(5)
+        assert received == {tag: f"conversation {tag}" for tag in range(10)}, received
+        print("✅ 10 réceptions simultanées vers le même expéditeur, chacune servie")
+    finally:
+        for node in nodes:
+            node.stop()
+
+    # Les entrées déjà appariées ne s'accumulent pas derrière un message jamais reçu
+    matches = MatchQueue()
+    matches.arrive(3, 0, "jamais reçu")
+    for i in range(10000):
+        matches.arrive(2, 0, i)
+        assert matches.post({'source': 2, 'tag': ANY_TAG}).payload == i
+    assert len(matches.arrivals) < 200 and matches.unexpected_count == 1
+    assert matches.post({'source': ANY_SOURCE, 'tag': ANY_TAG}).payload == "jamais reçu"
+    print("✅ File des messages inattendus compactée")
+
+    print("Test appariement sendToSync/receiveFromSync terminé ✅")
+
+def test_send_receive_sync_requests():
+    """Test des requêtes non bloquantes isend / irecv / ibroadcast et de wait_all, wait_any, test"""
+
+    print("=== Test requêtes non bloquantes ===")
+
+    nodes = make_nodes(3)
+    a, b, c = nodes
+    try:
+        # 100 envois en vol depuis un seul thread, puis une seule attente
+        sends = [a.isend(i, b.id, tag=i % 3) for i in range(100)]
+        receives = [b.irecv(a.id, tag=i % 3) for i in range(100)]
+        assert a.wait_all(sends, timeout=5) == [True] * 100
+        assert b.wait_all(receives, timeout=5) == list(range(100))
+        print("✅ 100 isend / irecv en vol, terminés par wait_all")
+
+        # wait_any / test : la requête servie est rendue sans bloquer sur les autres
+        status = {}
+        receives = [c.irecv(a.id), c.irecv(b.id, status=status)]
+        assert c.test(receives[1]) == (False, None)
+        assert b.isend("de b", c.id, tag=7).result(5)
+        assert c.wait_any(receives, timeout=5) == (1, "de b") and status == {'source': b.id, 'tag': 7}
+        assert c.test(receives[0]) == (False, None)
+        try:
+            c.wait_all(receives, timeout=0.1)
+            assert False, "wait_all aurait dû expirer"
+        except TimeoutError:
+            pass
+        print("✅ wait_any, test et timeout de wait_all")
+
+        # Une réception annulée laisse le message à la suivante
+        assert receives[0].cancel()
+        assert a.isend("après annulation", c.id).result(5)
+        assert c.receiveFromSync(a.id) == "après annulation"
+        try:
+            receives[0].result()
+            assert False, "Requête annulée"
+        except CancelledError:
+            pass
+        print("✅ irecv annulée avant appariement")
+
+        # ibroadcast : l'émetteur et les récepteurs attendent ensemble
+        requests = [node.ibroadcast("diffusé" if node is a else None, a.id) for node in nodes]
+        assert a.wait_all(requests, timeout=5) == [True, "diffusé", "diffusé"]
+        print("✅ ibroadcast")
+
+        # Les requêtes en cours sont résolues à l'arrêt du nœud
+        pending = [b.irecv(c.id), b.ibroadcast(None, c.id)]
+        b.stop()
+        assert b.wait_all(pending, timeout=5) == [None, None]
+        assert b.isend("trop tard", a.id).result(0) is False
+        print("✅ Requêtes en cours résolues à l'arrêt")
+    finally:
+        for node in nodes:
+            node.stop()
+
+    print("Test requêtes non bloquantes terminé ✅")
+
 if __name__ == "__main__":
     test_send_receive_sync()
+    test_send_receive_sync_matching()
+    test_send_receive_sync_requests()
@@ -1,104 +1,58 @@
-import threading
 import time
 from Process import Process
+from State.NodeState import NodeState
+
+def wait_for_cluster(processes, timeout=20):
+    """Attend l'élection d'un leader et l'enregistrement de tous les nœuds ; retourne le leader"""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        leaders = [p for p in processes if p.communication.state == NodeState.LEADER]
+        if leaders and all(p.communication.is_registered or p in leaders for p in processes) \
+                and all(len(p.communication.world) == len(processes) for p in processes):
+            return leaders[0]
+        time.sleep(0.2)
+    return None
 
 def test_synchronization():
     """Test de la synchronisation entre nœuds"""
     
     # Créer 3 processus
-    processes = []
-    for i in range(3):
-        process = Process(f"TestNode{i}")
-        processes.append(process)
-    
-    # Attendre que l'élection soit terminée
-    print("=== Attente de l'élection du leader ===")
-    time.sleep(10)
-    
-    # Trouver le leader
-    leader = None
-    for process in processes:
-        if process.communication.state == NodeState.LEADER:
-            leader = process
-            break
-    
-    if leader:
+    processes = [Process(f"TestNode{i}") for i in range(3)]
+    try:
+        # Attendre que l'élection soit terminée
+        print("=== Attente de l'élection du leader ===")
+        leader = wait_for_cluster(processes)
+        assert leader, "Aucun leader trouvé"
         print(f"=== Leader trouvé: Nœud {leader.getId()} ===")
         
-        # Test de synchronisation
+        # Synchronisation bloquante depuis le leader
         print("=== Test de synchronisation ===")
+        start = time.time()
+        assert leader.synchronize(timeout=10), "Timeout de synchronisation"
+        print(f"✅ Synchronisation réussie depuis le leader en {(time.time() - start) * 1000:.1f} ms")
         
-        def sync_callback():
-            print(f"Nœud {leader.getId()} - Synchronisation terminée dans le callback!")
-        
-        # Démarrer la synchronisation depuis le leader
-        success = leader.communication.synchronize(callback=sync_callback)
-        if success:
-            print(f"Synchronisation démarrée par le leader {leader.getId()}")
-            
-            # Attendre que la synchronisation se termine
-            timeout = 10  # 10 secondes maximum
-            start_time = time.time()
-            
-            while leader.communication.is_synchronizing and (time.time() - start_time) < timeout:
-                time.sleep(0.1)
-            
-            if not leader.communication.is_synchronizing:
-                print("✅ Synchronisation réussie!")
-            else:
-                print("❌ Timeout de synchronisation")
-        else:
-            print("❌ Échec du démarrage de la synchronisation")
-    else:
-        print("❌ Aucun leader trouvé")
-    
-    # Test de synchronisation depuis un follower
-    print("\n=== Test de synchronisation depuis un follower ===")
-    follower = None
-    for process in processes:
-        if process.communication.state == NodeState.FOLLOWER:
-            follower = process
-            break
-    
-    if follower:
-        print(f"Follower trouvé: Nœud {follower.getId()}")
+        # Synchronisation depuis un follower, bloquante puis asynchrone
+        print("\n=== Test de synchronisation depuis un follower ===")
+        follower = next(p for p in processes if p.communication.state == NodeState.FOLLOWER)
+        assert follower.synchronize(timeout=10), "Timeout de synchronisation"
+        print(f"✅ Synchronisation réussie depuis le follower {follower.getId()}")
         
-        def follower_sync_callback():
-            print(f"Nœud {follower.getId()} - Synchronisation terminée dans le callback!")
+        future = follower.synchronize_async()
+        assert future.result(10)
+        print("✅ synchronize_async() résolu")
         
-        success = follower.communication.synchronize(callback=follower_sync_callback)
-        if success:
-            print(f"Synchronisation démarrée par le follower {follower.getId()}")
-            
-            # Attendre que la synchronisation se termine
-            timeout = 10  # 10 secondes maximum
-            start_time = time.time()
-            
-            while follower.communication.is_synchronizing and (time.time() - start_time) < timeout:
-                time.sleep(0.1)
-            
-            if not follower.communication.is_synchronizing:
-                print("✅ Synchronisation réussie!")
-            else:
-                print("❌ Timeout de synchronisation")
-        else:
-            print("❌ Échec du démarrage de la synchronisation")
-    
-    # Attendre un peu avant d'arrêter
-    time.sleep(3)
-    
-    # Arrêter tous les processus
-    print("\n=== Arrêt des processus ===")
-    for process in processes:
-        process.stop()
-    
-    for process in processes:
-        process.waitStopped()
-    
-    print("Test terminé")
+        stats = follower.communication.get_status()['barrier']
+        assert stats['completed'] == 2, stats
+        print(f"✅ Latence moyenne d'une barrière: {stats['mean_latency'] * 1000:.1f} ms")
+    finally:
+        # Arrêter tous les processus
+        print("\n=== Arrêt des processus ===")
+        for process in processes:
+            process.stop()
+        for process in processes:
+            process.waitStopped()
+    
+    print("Test synchronisation terminé ✅")
 
 if __name__ == "__main__":
-    # Import nécessaire pour les tests
-    from State.NodeState import NodeState
-    
-    test_synchronization()
\ No newline at end of file
+    test_synchronization()
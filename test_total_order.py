@@ -0,0 +1,90 @@
+from threading import Thread
+from time import sleep, time
+from Message import TotalOrderMessage
+from State.NodeState import NodeState
+from testing import make_nodes
+
+def delivered(node):
+    return [(message.source, message.payload) for message in node.drainLetterMessages(type=TotalOrderMessage)]
+
+def wait_for_deliveries(nodes, expected, timeout=10):
+    """Lit les boîtes aux lettres jusqu'à ce que chaque nœud ait reçu 'expected' messages"""
+    orders = {node.id: [] for node in nodes}
+    deadline = time() + timeout
+    while any(len(order) < expected for order in orders.values()) and time() < deadline:
+        for node in nodes:
+            orders[node.id] += delivered(node)
+        sleep(0.01)
+    return orders
+
+def test_total_order():
+    """Test de la diffusion totalement ordonnée : même ordre partout, reprise par un nouveau leader"""
+
+    print("=== Test diffusion totalement ordonnée ===")
+
+    nodes = make_nodes(5, barrier="tree")  # Seul un synchronize() de tous les nœuds franchit la barrière
+    for node in nodes:
+        node.total_order.start()
+    nodes[0].init_sequencer()
+    try:
+        def worker(node, rounds):
+            for i in range(rounds):
+                node.broadcastTotalOrder(f"{node.id}-{i}")
+        threads = [Thread(target=worker, args=(node, 50)) for node in nodes]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+
+        orders = wait_for_deliveries(nodes, 250)
+        reference = orders[1]
+        assert len(reference) == 250, len(reference)
+        assert all(order == reference for order in orders.values()), "Ordres de remise différents"
+        for node in nodes:
+            # L'ordre FIFO de chaque émetteur est respecté
+            assert [payload for source, payload in reference if source == node.id] == [f"{node.id}-{i}" for i in range(50)]
+        print("✅ 5 nœuds × 50 diffusions concurrentes : ordre identique sur tous les nœuds")
+
+        # Un nœud en cours de synchronize() reçoit quand même toutes les diffusions, dans l'ordre
+        pending = nodes[2].synchronize_async()
+        assert nodes[2].is_synchronizing
+        threads = [Thread(target=worker, args=(node, 20)) for node in nodes]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+        orders = wait_for_deliveries(nodes, 100)
+        assert nodes[2].is_synchronizing, "La barrière ne doit pas être franchie pendant les diffusions"
+        assert len(orders[1]) == 100 and all(order == orders[1] for order in orders.values()), "Message perdu pendant synchronize()"
+        futures = [node.synchronize_async() for node in nodes if node is not nodes[2]]
+        assert pending.result(5) and all(future.result(5) for future in futures)
+        print("✅ Diffusions concurrentes à synchronize() : aucune perdue, ordre identique")
+
+        # Le leader s'arrête : le nœud 2 reprend le séquenceur avec un terme supérieur
+        nodes[0].stop()
+        survivors = nodes[1:]
+        for node in survivors:
+            node.leader_id = 2
+            node.world.discard(1)
+        survivors[0].state = NodeState.LEADER
+        survivors[0].current_term = nodes[0].current_term + 1
+        survivors[0].init_sequencer()
+        threads = [Thread(target=worker, args=(node, 20)) for node in survivors]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+
+        orders = wait_for_deliveries(survivors, 80)
+        reference = orders[2]
+        assert len(reference) == 80, len(reference)
+        assert all(order == reference for order in orders.values()), "Ordres de remise différents après la reprise"
+        print("✅ Reprise du séquenceur par le nouveau leader : ordre identique sur les survivants")
+    finally:
+        for node in nodes:
+            node.stop()
+
+    print("Test diffusion totalement ordonnée terminé ✅")
+
+if __name__ == "__main__":
+    test_total_order()
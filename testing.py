@@ -0,0 +1,27 @@
+from Communication import Communication
+from State.NodeState import NodeState
+
+def make_nodes(nb_nodes, start_mutex=False, **options):
+    """
+    Communicateurs sans élection, pour les tests et benchmarks : IDs 1..N, monde complet,
+    le nœud 1 joue le leader. Seuls les dispatchers sont démarrés ; avec start_mutex,
+    l'exclusion mutuelle et les verrous nommés le sont aussi (le leader crée le jeton).
+    'options' est passé à Communication.
+    """
+    nodes = []
+    for i in range(1, nb_nodes + 1):
+        communication = Communication(**options)
+        communication.dispatcher.start()
+        communication.assign_id(i)
+        nodes.append(communication)
+    for communication in nodes:
+        communication.world = set(range(1, nb_nodes + 1))
+        communication.leader_id = 1
+        communication.is_registered = True  # Un heartbeat de leader ne relance pas l'enregistrement
+    nodes[0].state = NodeState.LEADER
+    if start_mutex:
+        for communication in nodes:
+            communication.mutex.start()
+            communication.locks.start()
+        nodes[0].init_token_ring()
+    return nodes